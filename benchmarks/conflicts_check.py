@@ -0,0 +1,177 @@
+"""Check the live conflicts of the game against a full recompute.
+
+python benchmarks/conflicts_check.py [--moves 3000] [--seed 3] [boards...]
+
+Every board of benchmarks/corpus is played with random moves, undos and
+redos, and after each one the cells marked by Logic.conflicts are compared
+with the marks computed from scratch on the whole graph. The journal is
+then replayed in a new game and checked again, and the known solution is
+drawn after a stray edge that is removed last. The exit status is 1 if a
+mark differs.
+"""
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from Logic.board import BLACK, WHITE  # noqa: E402
+from Logic.game import Game_flow  # noqa: E402
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+
+def recompute(game: Game_flow) -> set[int]:
+    """Compute the marked cells from scratch, on every cell of the graph
+
+    Args:
+        game (Game_flow): the game
+
+    Returns:
+        set[int]: the cell ids (x * size + y) that must be marked
+    """
+    conflicts = game.conflicts
+    graph = game.graph
+    size = graph.size
+    nodes = [node for row in graph.adjacency_matrix for node in row]
+    marked = {node.x * size + node.y for node in nodes if node.weight > 2}
+    marked |= {node.x * size + node.y for node in nodes
+               if node.color in (WHITE, BLACK) and conflicts.clue_broken(node)}
+
+    loops = {conflicts.walk_loop(node) for node in nodes}
+    loops.discard(frozenset())
+    if loops:
+        cells = next(iter(loops))
+        clues = sum(1 for cell in cells if graph.adjacency_matrix[cell // size][cell % size].color
+                    in (WHITE, BLACK))
+        if len(loops) > 1 or len(cells) != graph.edge_count or clues != len(graph.clue_nodes):
+            for cells in loops:
+                marked |= cells
+    return marked
+
+
+def compare(game: Game_flow, where: str) -> list[str]:
+    """Compare the live marks with a full recompute
+
+    Args:
+        game (Game_flow): the game
+        where (str): the move, for the message
+
+    Returns:
+        list[str]: the message of the difference, empty if there is none
+    """
+    expected = recompute(game)
+    if game.conflicts.marked == expected:
+        return []
+    missing = sorted(expected - game.conflicts.marked)
+    extra = sorted(game.conflicts.marked - expected)
+    return [f"{where}: missing {missing[:8]} extra {extra[:8]}"]
+
+
+def random_moves(path: str, moves: int, seed: int) -> list[str]:
+    """Play random moves, undos and redos and compare after every one, then
+    replay the journal in a new game
+
+    Args:
+        path (str): the board file
+        moves (int): the number of moves
+        seed (int): the seed of the moves
+
+    Returns:
+        list[str]: the differences found
+    """
+    game = Game_flow(path)
+    size = game.get_graph_size()
+    rng = random.Random(seed)
+    errors = []
+    for number in range(moves):
+        roll = rng.random()
+        if roll < 0.05:
+            game.undo()
+        elif roll < 0.08:
+            game.redo()
+        else:
+            x, y = rng.randrange(size), rng.randrange(size - 1)
+            edge = (x, y, x, y + 1) if rng.random() < 0.5 else (y, x, y + 1, x)
+            if game.edges.has(*edge):
+                game.undo_move(*edge)
+            else:
+                game.make_move(*edge)
+        errors += compare(game, f"move {number}")
+        if len(errors) > 5:
+            return errors
+
+    # The same edges built from the journal
+    replay = Game_flow(path)
+    for key in sorted(game.edges.keys):
+        replay.apply(key, True)
+    return errors + compare(replay, "replay")
+
+
+def stray_edge(path: str) -> list[str]:
+    """Draw the solution after a stray edge that is not part of it and
+    remove it, the board is won and nothing is marked
+
+    Args:
+        path (str): the board file, with its .sol solution next to it
+
+    Returns:
+        list[str]: the differences found
+    """
+    solution = os.path.splitext(path)[0] + ".sol"
+    if not os.path.exists(solution):
+        return []
+    with open(solution) as file:
+        edges = [tuple(int(value) - 1 for value in line.split(",")) for line in file if line.strip()]
+    if not edges:
+        # The board has no solution
+        return []
+
+    game = Game_flow(path)
+    size = game.get_graph_size()
+    used = {game.edges.key(*edge) for edge in edges}
+    stray = next(edge for x in range(size) for y in range(size - 1)
+                 for edge in ((x, y, x, y + 1), (y, x, y + 1, x))
+                 if game.edges.key(*edge) not in used)
+    game.make_move(*stray)
+    for edge in edges:
+        game.make_move(*edge)
+        errors = compare(game, "solution")
+        if errors:
+            return errors
+    game.undo_move(*stray)
+    errors = compare(game, "stray edge removed")
+    if not game.conflicts.won() or game.conflicts.marked:
+        errors.append(f"stray edge removed: won {game.conflicts.won()}, "
+                      f"{len(game.conflicts.marked)} cells marked")
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("boards", nargs="*", help="board files, all of the corpus by default")
+    parser.add_argument("--moves", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    boards = args.boards or sorted(glob.glob(os.path.join(CORPUS, "*.txt")))
+    failed = False
+    for path in boards:
+        start = time.perf_counter()
+        errors = stray_edge(path) + random_moves(path, args.moves, args.seed)
+        name = os.path.basename(path)
+        print(f"{name:<26}{'ok' if not errors else 'FAILED':<8}{time.perf_counter() - start:6.1f}s",
+              flush=True)
+        for error in errors:
+            print(f"    {error}")
+        failed = failed or bool(errors)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Build the benchmark corpus: seeded boards of 6x6 up to 50x50 with their
+known solution, and a few adversarial boards.
+
+python benchmarks/corpus.py [directory]
+
+Every board is written as <name>.txt in the game format and its solution
+as <name>.sol, one s_row,s_col,e_row,e_col edge per line counting from 1.
+The boards only depend on the seeds below, and the files are kept in the
+repository so a change of the generator does not change the corpus.
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from Logic.generator import board_text, loop_clues, random_loop  # noqa: E402
+from Logic.uniqueness import UniquenessChecker  # noqa: E402
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+# name: (size, seed, fill, wiggle, fraction of the clues kept)
+BOARDS = {
+    "06x06_a": (6, 1, 0.5, 0.5, 0.7),
+    "06x06_b": (6, 2, 0.7, 0.3, 1.0),
+    "10x10_a": (10, 1, 0.5, 0.5, 0.7),
+    "10x10_b": (10, 2, 0.7, 0.3, 1.0),
+    "20x20_a": (20, 1, 0.5, 0.5, 0.7),
+    "20x20_b": (20, 2, 0.7, 0.3, 1.0),
+    "30x30_a": (30, 1, 0.5, 0.5, 0.7),
+    "30x30_b": (30, 2, 0.7, 0.3, 1.0),
+    "50x50_a": (50, 1, 0.5, 0.5, 0.7),
+    "50x50_b": (50, 2, 0.7, 0.3, 1.0),
+    # Few clues and wide empty areas, the search has little to propagate
+    "adv_sparse_20x20": (20, 3, 0.5, 0.5, 0.25),
+    # Every clue of a loop with many turns, slow for backtracking
+    "adv_wiggly_20x20": (20, 5, 0.5, 0.9, 1.0),
+    "adv_wiggly_25x25": (25, 2, 0.5, 0.9, 1.0),
+}
+
+# Boards without solution: a board of the list above with one clue of the
+# other color, name: (board, seed of the clue to change)
+UNSOLVABLE = {
+    "adv_unsolvable_10x10": ("10x10_b", 7),
+    "adv_unsolvable_20x20": ("20x20_b", 7),
+}
+
+
+def build_board(size: int, seed: int, fill: float, wiggle: float,
+                fraction: float) -> tuple[dict, list]:
+    """Build a board from a seeded random loop
+
+    Args:
+        size (int): the size of the board
+        seed (int): the seed of the loop and of the clues kept
+        fill (float): the fraction of the board inside the loop
+        wiggle (float): how often the loop turns
+        fraction (float): the fraction of the clues of the loop to keep
+
+    Returns:
+        tuple[dict, list]: the clues and the edges of the solution
+    """
+    rnd = random.Random(seed)
+    edges = random_loop(size, rnd, fill, wiggle)
+    clues = loop_clues(edges)
+    cells = sorted(clues)
+    rnd.shuffle(cells)
+    kept = cells[:max(1, round(len(cells) * fraction))]
+    return {cell: clues[cell] for cell in kept}, edges
+
+
+def write_board(directory: str, name: str, size: int, clues: dict, edges: list) -> None:
+    """Write a board and its solution
+
+    Args:
+        directory (str): the directory of the corpus
+        name (str): the name of the board
+        size (int): the size of the board
+        clues (dict): the color of every clue
+        edges (list): the edges of the solution, empty if there is none
+    """
+    with open(os.path.join(directory, name + ".txt"), "w") as file:
+        file.write(board_text(size, clues))
+    with open(os.path.join(directory, name + ".sol"), "w") as file:
+        for (s_x, s_y), (e_x, e_y) in sorted(edges):
+            file.write(f"{s_x + 1},{s_y + 1},{e_x + 1},{e_y + 1}\n")
+
+
+def main():
+    directory = sys.argv[1] if len(sys.argv) > 1 else CORPUS
+    os.makedirs(directory, exist_ok=True)
+
+    built = {}
+    for name, (size, seed, fill, wiggle, fraction) in BOARDS.items():
+        clues, edges = build_board(size, seed, fill, wiggle, fraction)
+        built[name] = (size, clues)
+        write_board(directory, name, size, clues, edges)
+        print(f"{name}: {len(clues)} clues")
+
+    for name, (source, seed) in UNSOLVABLE.items():
+        size, clues = built[source]
+        checker = UniquenessChecker(size)
+        cells = sorted(clues)
+        random.Random(seed).shuffle(cells)
+        # The first clue that leaves the board without solution
+        for cell in cells:
+            changed = dict(clues)
+            changed[cell] = 3 - clues[cell]
+            if checker.check(changed).count == 0:
+                break
+        else:
+            raise RuntimeError(f"No clue of {source} makes it unsolvable")
+        write_board(directory, name, size, changed, [])
+        print(f"{name}: {len(changed)} clues, {cell} changed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+2,1,2,2
+2,1,3,1
+2,2,2,3
+2,3,2,4
+2,4,2,5
+2,5,2,6
+2,6,3,6
+3,1,4,1
+3,3,3,4
+3,3,4,3
+3,4,4,4
+3,6,4,6
+4,1,4,2
+4,2,5,2
+4,3,5,3
+4,4,5,4
+4,6,5,6
+5,2,5,3
+5,4,5,5
+5,5,5,6
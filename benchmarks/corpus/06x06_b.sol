@@ -0,0 +1,24 @@
+1,1,1,2
+1,1,2,1
+1,2,1,3
+1,3,1,4
+1,4,1,5
+1,5,1,6
+1,6,2,6
+2,1,3,1
+2,4,2,5
+2,4,3,4
+2,5,3,5
+2,6,3,6
+3,1,4,1
+3,4,4,4
+3,5,4,5
+3,6,4,6
+4,1,5,1
+4,4,5,4
+4,5,4,6
+5,1,5,2
+5,2,6,2
+5,3,5,4
+5,3,6,3
+6,2,6,3
@@ -0,0 +1,44 @@
+1,1,1,2
+1,1,2,1
+1,2,1,3
+1,3,1,4
+1,4,1,5
+1,5,1,6
+1,6,2,6
+1,7,1,8
+1,7,2,7
+1,8,2,8
+2,1,3,1
+2,4,2,5
+2,4,3,4
+2,5,3,5
+2,6,2,7
+2,8,3,8
+3,1,4,1
+3,4,4,4
+3,5,3,6
+3,6,3,7
+3,7,3,8
+4,1,5,1
+4,4,4,5
+4,5,5,5
+5,1,6,1
+5,5,5,6
+5,6,5,7
+5,7,5,8
+5,8,6,8
+6,1,7,1
+6,5,6,6
+6,5,7,5
+6,6,6,7
+6,7,6,8
+7,1,8,1
+7,5,7,6
+7,6,8,6
+8,1,9,1
+8,6,9,6
+9,1,9,2
+9,2,9,3
+9,3,9,4
+9,4,9,5
+9,5,9,6
@@ -0,0 +1,48 @@
+1,1,1,2
+1,1,2,1
+1,2,1,3
+1,3,1,4
+1,4,1,5
+1,5,1,6
+1,6,1,7
+1,7,1,8
+1,8,2,8
+2,1,3,1
+2,7,2,8
+2,7,3,7
+3,1,4,1
+3,7,3,8
+3,8,3,9
+3,9,3,10
+3,10,4,10
+4,1,5,1
+4,10,5,10
+5,1,6,1
+5,8,5,9
+5,8,6,8
+5,9,6,9
+5,10,6,10
+6,1,6,2
+6,2,7,2
+6,4,6,5
+6,4,7,4
+6,5,7,5
+6,8,7,8
+6,9,6,10
+7,2,8,2
+7,4,8,4
+7,5,8,5
+7,8,8,8
+8,1,8,2
+8,1,9,1
+8,4,9,4
+8,5,9,5
+8,7,8,8
+8,7,9,7
+9,1,9,2
+9,2,10,2
+9,4,10,4
+9,5,9,6
+9,6,9,7
+10,2,10,3
+10,3,10,4
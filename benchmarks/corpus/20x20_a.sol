@@ -0,0 +1,138 @@
+1,8,1,9
+1,8,2,8
+1,9,1,10
+1,10,1,11
+1,11,1,12
+1,12,1,13
+1,13,2,13
+1,14,1,15
+1,14,2,14
+1,15,2,15
+1,17,1,18
+1,17,2,17
+1,18,1,19
+1,19,1,20
+1,20,2,20
+2,8,2,9
+2,9,3,9
+2,13,2,14
+2,15,2,16
+2,16,2,17
+2,20,3,20
+3,6,3,7
+3,6,4,6
+3,7,3,8
+3,8,4,8
+3,9,4,9
+3,20,4,20
+4,6,5,6
+4,8,5,8
+4,9,4,10
+4,10,5,10
+4,20,5,20
+5,6,6,6
+5,8,5,9
+5,9,5,10
+5,20,6,20
+6,6,6,7
+6,7,7,7
+6,20,7,20
+7,7,8,7
+7,20,8,20
+8,7,9,7
+8,8,8,9
+8,8,9,8
+8,9,8,10
+8,10,8,11
+8,11,9,11
+8,17,8,18
+8,17,9,17
+8,18,9,18
+8,20,9,20
+9,7,10,7
+9,8,10,8
+9,9,9,10
+9,9,10,9
+9,10,9,11
+9,16,9,17
+9,16,10,16
+9,18,10,18
+9,20,10,20
+10,7,10,8
+10,9,11,9
+10,16,11,16
+10,17,10,18
+10,17,11,17
+10,20,11,20
+11,9,11,10
+11,10,11,11
+11,11,12,11
+11,16,12,16
+11,17,12,17
+11,20,12,20
+12,10,12,11
+12,10,13,10
+12,16,13,16
+12,17,13,17
+12,20,13,20
+13,10,14,10
+13,15,13,16
+13,15,14,15
+13,17,14,17
+13,20,14,20
+14,10,14,11
+14,11,14,12
+14,12,14,13
+14,13,15,13
+14,15,15,15
+14,16,14,17
+14,16,15,16
+14,19,14,20
+14,19,15,19
+15,13,16,13
+15,14,15,15
+15,14,16,14
+15,16,16,16
+15,19,15,20
+15,20,16,20
+16,11,16,12
+16,11,17,11
+16,12,16,13
+16,14,16,15
+16,15,17,15
+16,16,17,16
+16,20,17,20
+17,9,17,10
+17,9,18,9
+17,10,18,10
+17,11,17,12
+17,12,17,13
+17,13,17,14
+17,14,17,15
+17,16,17,17
+17,17,18,17
+17,20,18,20
+18,9,19,9
+18,10,18,11
+18,11,18,12
+18,12,18,13
+18,13,18,14
+18,14,18,15
+18,15,18,16
+18,16,18,17
+18,20,19,20
+19,9,19,10
+19,10,19,11
+19,11,20,11
+19,12,19,13
+19,12,20,12
+19,13,20,13
+19,20,20,20
+20,11,20,12
+20,13,20,14
+20,14,20,15
+20,15,20,16
+20,16,20,17
+20,17,20,18
+20,18,20,19
+20,19,20,20
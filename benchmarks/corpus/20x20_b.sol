@@ -0,0 +1,128 @@
+1,1,1,2
+1,1,2,1
+1,2,1,3
+1,3,1,4
+1,4,1,5
+1,5,1,6
+1,6,1,7
+1,7,1,8
+1,8,1,9
+1,9,1,10
+1,10,1,11
+1,11,1,12
+1,12,1,13
+1,13,1,14
+1,14,1,15
+1,15,1,16
+1,16,1,17
+1,17,1,18
+1,18,2,18
+2,1,3,1
+2,18,2,19
+2,19,2,20
+2,20,3,20
+3,1,4,1
+3,20,4,20
+4,1,5,1
+4,16,4,17
+4,16,5,16
+4,17,4,18
+4,18,5,18
+4,20,5,20
+5,1,6,1
+5,16,5,17
+5,17,6,17
+5,18,5,19
+5,19,5,20
+6,1,7,1
+6,17,6,18
+6,18,7,18
+7,1,8,1
+7,18,7,19
+7,19,7,20
+7,20,8,20
+8,1,9,1
+8,18,8,19
+8,18,9,18
+8,19,8,20
+9,1,10,1
+9,12,9,13
+9,12,10,12
+9,13,10,13
+9,18,10,18
+10,1,11,1
+10,12,11,12
+10,13,11,13
+10,18,11,18
+11,1,12,1
+11,5,11,6
+11,5,12,5
+11,6,11,7
+11,7,12,7
+11,12,12,12
+11,13,11,14
+11,14,11,15
+11,15,12,15
+11,17,11,18
+11,17,12,17
+12,1,13,1
+12,5,12,6
+12,6,13,6
+12,7,12,8
+12,8,13,8
+12,12,12,13
+12,13,12,14
+12,14,13,14
+12,15,13,15
+12,16,12,17
+12,16,13,16
+13,1,14,1
+13,6,13,7
+13,7,14,7
+13,8,13,9
+13,9,13,10
+13,10,13,11
+13,11,14,11
+13,14,14,14
+13,15,13,16
+14,1,15,1
+14,7,14,8
+14,8,14,9
+14,9,14,10
+14,10,15,10
+14,11,15,11
+14,14,14,15
+14,15,14,16
+14,16,15,16
+15,1,16,1
+15,10,16,10
+15,11,16,11
+15,12,15,13
+15,12,16,12
+15,13,15,14
+15,14,16,14
+15,15,15,16
+15,15,16,15
+16,1,17,1
+16,10,17,10
+16,11,16,12
+16,14,16,15
+17,1,18,1
+17,6,17,7
+17,6,18,6
+17,7,18,7
+17,9,17,10
+17,9,18,9
+18,1,18,2
+18,2,18,3
+18,3,19,3
+18,6,19,6
+18,7,19,7
+18,8,18,9
+18,8,19,8
+19,3,20,3
+19,5,19,6
+19,5,20,5
+19,7,19,8
+20,3,20,4
+20,4,20,5
@@ -0,0 +1,178 @@
+1,2,1,3
+1,2,2,2
+1,3,1,4
+1,4,1,5
+1,5,2,5
+1,7,1,8
+1,7,2,7
+1,8,1,9
+1,9,1,10
+1,10,1,11
+1,11,1,12
+1,12,1,13
+1,13,2,13
+1,14,1,15
+1,14,2,14
+1,15,1,16
+1,16,1,17
+1,17,1,18
+1,18,1,19
+1,19,1,20
+1,20,1,21
+1,21,1,22
+1,22,1,23
+1,23,1,24
+1,24,1,25
+1,25,1,26
+1,26,1,27
+1,27,1,28
+1,28,1,29
+1,29,1,30
+1,30,2,30
+2,1,2,2
+2,1,3,1
+2,5,2,6
+2,6,2,7
+2,13,2,14
+2,30,3,30
+3,1,4,1
+3,30,4,30
+4,1,5,1
+4,30,5,30
+5,1,5,2
+5,2,6,2
+5,29,5,30
+5,29,6,29
+6,2,7,2
+6,7,6,8
+6,7,7,7
+6,8,7,8
+6,29,6,30
+6,30,7,30
+7,1,7,2
+7,1,8,1
+7,7,8,7
+7,8,8,8
+7,30,8,30
+8,1,8,2
+8,2,9,2
+8,6,8,7
+8,6,9,6
+8,8,9,8
+8,30,9,30
+9,2,9,3
+9,3,9,4
+9,4,9,5
+9,5,9,6
+9,7,9,8
+9,7,10,7
+9,29,9,30
+9,29,10,29
+10,3,10,4
+10,3,11,3
+10,4,10,5
+10,5,10,6
+10,6,10,7
+10,29,11,29
+11,3,12,3
+11,24,11,25
+11,24,12,24
+11,25,12,25
+11,29,11,30
+11,30,12,30
+12,3,12,4
+12,4,13,4
+12,7,12,8
+12,7,13,7
+12,8,13,8
+12,22,12,23
+12,22,13,22
+12,23,13,23
+12,24,13,24
+12,25,13,25
+12,30,13,30
+13,4,14,4
+13,7,14,7
+13,8,14,8
+13,22,14,22
+13,23,14,23
+13,24,14,24
+13,25,14,25
+13,30,14,30
+14,4,15,4
+14,7,15,7
+14,8,15,8
+14,22,15,22
+14,23,15,23
+14,24,15,24
+14,25,15,25
+14,30,15,30
+15,4,15,5
+15,5,15,6
+15,6,16,6
+15,7,16,7
+15,8,16,8
+15,11,15,12
+15,11,16,11
+15,12,16,12
+15,18,15,19
+15,18,16,18
+15,19,16,19
+15,21,15,22
+15,21,16,21
+15,23,15,24
+15,25,16,25
+15,30,16,30
+16,6,16,7
+16,8,17,8
+16,11,17,11
+16,12,17,12
+16,18,17,18
+16,19,16,20
+16,20,17,20
+16,21,17,21
+16,23,16,24
+16,23,17,23
+16,24,16,25
+16,30,17,30
+17,6,17,7
+17,6,18,6
+17,7,17,8
+17,11,18,11
+17,12,17,13
+17,13,18,13
+17,18,17,19
+17,19,18,19
+17,20,17,21
+17,23,17,24
+17,24,18,24
+17,25,17,26
+17,25,18,25
+17,26,17,27
+17,27,17,28
+17,28,17,29
+17,29,17,30
+18,6,18,7
+18,7,19,7
+18,11,18,12
+18,12,19,12
+18,13,18,14
+18,14,18,15
+18,15,19,15
+18,17,18,18
+18,17,19,17
+18,18,18,19
+18,24,18,25
+19,7,19,8
+19,8,19,9
+19,9,20,9
+19,11,19,12
+19,11,20,11
+19,15,19,16
+19,16,20,16
+19,17,19,18
+19,18,20,18
+20,9,20,10
+20,10,20,11
+20,16,20,17
+20,17,20,18
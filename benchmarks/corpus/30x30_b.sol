@@ -0,0 +1,200 @@
+2,15,2,16
+2,15,3,15
+2,16,2,17
+2,17,3,17
+2,19,2,20
+2,19,3,19
+2,20,2,21
+2,21,3,21
+2,25,2,26
+2,25,3,25
+2,26,3,26
+3,15,3,16
+3,16,4,16
+3,17,3,18
+3,18,3,19
+3,21,3,22
+3,22,3,23
+3,23,4,23
+3,24,3,25
+3,24,4,24
+3,26,4,26
+4,12,4,13
+4,12,5,12
+4,13,5,13
+4,15,4,16
+4,15,5,15
+4,23,4,24
+4,25,4,26
+4,25,5,25
+5,12,6,12
+5,13,6,13
+5,15,6,15
+5,25,6,25
+6,9,6,10
+6,9,7,9
+6,10,6,11
+6,11,6,12
+6,13,7,13
+6,15,6,16
+6,16,7,16
+6,25,6,26
+6,26,6,27
+6,27,6,28
+6,28,7,28
+6,29,6,30
+6,29,7,29
+6,30,7,30
+7,8,7,9
+7,8,8,8
+7,12,7,13
+7,12,8,12
+7,14,7,15
+7,14,8,14
+7,15,7,16
+7,28,8,28
+7,29,8,29
+7,30,8,30
+8,7,8,8
+8,7,9,7
+8,12,8,13
+8,13,9,13
+8,14,8,15
+8,15,9,15
+8,28,9,28
+8,29,9,29
+8,30,9,30
+9,7,10,7
+9,13,10,13
+9,15,10,15
+9,27,9,28
+9,27,10,27
+9,29,10,29
+9,30,10,30
+10,7,10,8
+10,8,11,8
+10,13,10,14
+10,14,10,15
+10,27,11,27
+10,28,10,29
+10,28,11,28
+10,30,11,30
+11,8,11,9
+11,9,12,9
+11,27,12,27
+11,28,12,28
+11,30,12,30
+12,9,13,9
+12,27,13,27
+12,28,13,28
+12,30,13,30
+13,7,13,8
+13,7,14,7
+13,8,13,9
+13,27,14,27
+13,28,14,28
+13,30,14,30
+14,7,15,7
+14,27,15,27
+14,28,15,28
+14,30,15,30
+15,6,15,7
+15,6,16,6
+15,27,15,28
+15,30,16,30
+16,6,16,7
+16,7,16,8
+16,8,17,8
+16,30,17,30
+17,4,17,5
+17,4,18,4
+17,5,17,6
+17,6,18,6
+17,8,18,8
+17,30,18,30
+18,4,19,4
+18,6,19,6
+18,8,18,9
+18,9,19,9
+18,11,18,12
+18,11,19,11
+18,12,18,13
+18,13,19,13
+18,30,19,30
+19,4,20,4
+19,6,19,7
+19,7,19,8
+19,8,20,8
+19,9,19,10
+19,10,19,11
+19,12,19,13
+19,12,20,12
+19,30,20,30
+20,4,21,4
+20,8,20,9
+20,9,20,10
+20,10,20,11
+20,11,20,12
+20,30,21,30
+21,4,22,4
+21,30,22,30
+22,4,22,5
+22,5,22,6
+22,6,22,7
+22,7,23,7
+22,30,23,30
+23,4,23,5
+23,4,24,4
+23,5,23,6
+23,6,24,6
+23,7,24,7
+23,30,24,30
+24,2,24,3
+24,2,25,2
+24,3,25,3
+24,4,25,4
+24,6,25,6
+24,7,25,7
+24,30,25,30
+25,2,26,2
+25,3,25,4
+25,6,26,6
+25,7,26,7
+25,30,26,30
+26,2,26,3
+26,3,27,3
+26,6,26,7
+26,30,27,30
+27,3,28,3
+27,30,28,30
+28,3,29,3
+28,30,29,30
+29,3,29,4
+29,4,29,5
+29,5,30,5
+29,30,30,30
+30,5,30,6
+30,6,30,7
+30,7,30,8
+30,8,30,9
+30,9,30,10
+30,10,30,11
+30,11,30,12
+30,12,30,13
+30,13,30,14
+30,14,30,15
+30,15,30,16
+30,16,30,17
+30,17,30,18
+30,18,30,19
+30,19,30,20
+30,20,30,21
+30,21,30,22
+30,22,30,23
+30,23,30,24
+30,24,30,25
+30,25,30,26
+30,26,30,27
+30,27,30,28
+30,28,30,29
+30,29,30,30
@@ -0,0 +1,416 @@
+1,10,1,11
+1,10,2,10
+1,11,1,12
+1,12,1,13
+1,13,2,13
+1,14,1,15
+1,14,2,14
+1,15,1,16
+1,16,1,17
+1,17,2,17
+1,18,1,19
+1,18,2,18
+1,19,1,20
+1,20,1,21
+1,21,1,22
+1,22,1,23
+1,23,1,24
+1,24,1,25
+1,25,1,26
+1,26,1,27
+1,27,1,28
+1,28,1,29
+1,29,1,30
+1,30,1,31
+1,31,1,32
+1,32,1,33
+1,33,1,34
+1,34,1,35
+1,35,1,36
+1,36,1,37
+1,37,1,38
+1,38,1,39
+1,39,1,40
+1,40,1,41
+1,41,1,42
+1,42,1,43
+1,43,1,44
+1,44,1,45
+1,45,1,46
+1,46,1,47
+1,47,1,48
+1,48,1,49
+1,49,1,50
+1,50,2,50
+2,10,2,11
+2,11,3,11
+2,13,2,14
+2,17,3,17
+2,18,3,18
+2,50,3,50
+3,9,3,10
+3,9,4,9
+3,10,3,11
+3,17,4,17
+3,18,3,19
+3,19,3,20
+3,20,4,20
+3,50,4,50
+4,8,4,9
+4,8,5,8
+4,12,4,13
+4,12,5,12
+4,13,5,13
+4,17,4,18
+4,18,4,19
+4,19,4,20
+4,50,5,50
+5,8,6,8
+5,9,5,10
+5,9,6,9
+5,10,6,10
+5,11,5,12
+5,11,6,11
+5,13,6,13
+5,50,6,50
+6,8,6,9
+6,10,6,11
+6,12,6,13
+6,12,7,12
+6,50,7,50
+7,10,7,11
+7,10,8,10
+7,11,7,12
+7,50,8,50
+8,10,8,11
+8,11,8,12
+8,12,9,12
+8,14,8,15
+8,14,9,14
+8,15,8,16
+8,16,8,17
+8,17,8,18
+8,18,8,19
+8,19,8,20
+8,20,9,20
+8,50,9,50
+9,12,9,13
+9,13,10,13
+9,14,10,14
+9,15,9,16
+9,15,10,15
+9,16,9,17
+9,17,9,18
+9,18,9,19
+9,19,9,20
+9,50,10,50
+10,12,10,13
+10,12,11,12
+10,14,11,14
+10,15,11,15
+10,50,11,50
+11,12,11,13
+11,13,11,14
+11,15,12,15
+11,50,12,50
+12,11,12,12
+12,11,13,11
+12,12,12,13
+12,13,12,14
+12,14,12,15
+12,50,13,50
+13,11,13,12
+13,12,14,12
+13,50,14,50
+14,12,15,12
+14,50,15,50
+15,10,15,11
+15,10,16,10
+15,11,15,12
+15,50,16,50
+16,9,16,10
+16,9,17,9
+16,50,17,50
+17,9,18,9
+17,50,18,50
+18,9,18,10
+18,10,18,11
+18,11,19,11
+18,16,18,17
+18,16,19,16
+18,17,18,18
+18,18,19,18
+18,50,19,50
+19,11,20,11
+19,13,19,14
+19,13,20,13
+19,14,19,15
+19,15,19,16
+19,17,19,18
+19,17,20,17
+19,50,20,50
+20,10,20,11
+20,10,21,10
+20,13,21,13
+20,14,20,15
+20,14,21,14
+20,15,20,16
+20,16,20,17
+20,50,21,50
+21,10,21,11
+21,11,21,12
+21,12,21,13
+21,14,22,14
+21,50,22,50
+22,12,22,13
+22,12,23,12
+22,13,23,13
+22,14,23,14
+22,26,22,27
+22,26,23,26
+22,27,23,27
+22,50,23,50
+23,11,23,12
+23,11,24,11
+23,13,23,14
+23,26,24,26
+23,27,24,27
+23,50,24,50
+24,11,24,12
+24,12,24,13
+24,13,25,13
+24,14,24,15
+24,14,25,14
+24,15,25,15
+24,24,24,25
+24,24,25,24
+24,25,24,26
+24,27,25,27
+24,50,25,50
+25,12,25,13
+25,12,26,12
+25,14,26,14
+25,15,26,15
+25,24,26,24
+25,25,25,26
+25,25,26,25
+25,26,25,27
+25,43,25,44
+25,43,26,43
+25,44,26,44
+25,50,26,50
+26,12,27,12
+26,13,26,14
+26,13,27,13
+26,15,27,15
+26,24,27,24
+26,25,27,25
+26,39,26,40
+26,39,27,39
+26,40,26,41
+26,41,27,41
+26,43,27,43
+26,44,27,44
+26,50,27,50
+27,12,27,13
+27,15,28,15
+27,20,27,21
+27,20,28,20
+27,21,27,22
+27,22,27,23
+27,23,27,24
+27,25,28,25
+27,39,27,40
+27,40,28,40
+27,41,28,41
+27,43,28,43
+27,44,28,44
+27,49,27,50
+27,49,28,49
+28,15,29,15
+28,17,28,18
+28,17,29,17
+28,18,28,19
+28,19,29,19
+28,20,29,20
+28,21,28,22
+28,21,29,21
+28,22,28,23
+28,23,28,24
+28,24,28,25
+28,40,29,40
+28,41,29,41
+28,43,29,43
+28,44,29,44
+28,49,28,50
+28,50,29,50
+29,15,30,15
+29,17,29,18
+29,18,30,18
+29,19,29,20
+29,21,29,22
+29,22,30,22
+29,40,30,40
+29,41,29,42
+29,42,30,42
+29,43,30,43
+29,44,30,44
+29,49,29,50
+29,49,30,49
+30,15,31,15
+30,17,30,18
+30,17,31,17
+30,22,31,22
+30,23,30,24
+30,23,31,23
+30,24,30,25
+30,25,30,26
+30,26,31,26
+30,39,30,40
+30,39,31,39
+30,42,30,43
+30,44,31,44
+30,47,30,48
+30,47,31,47
+30,48,30,49
+31,15,31,16
+31,16,32,16
+31,17,31,18
+31,18,32,18
+31,22,31,23
+31,24,31,25
+31,24,32,24
+31,25,31,26
+31,32,31,33
+31,32,32,32
+31,33,31,34
+31,34,32,34
+31,39,31,40
+31,40,32,40
+31,41,31,42
+31,41,32,41
+31,42,32,42
+31,43,31,44
+31,43,32,43
+31,47,31,48
+31,48,32,48
+32,16,32,17
+32,17,32,18
+32,21,32,22
+32,21,33,21
+32,22,32,23
+32,23,32,24
+32,31,32,32
+32,31,33,31
+32,33,32,34
+32,33,33,33
+32,40,32,41
+32,42,33,42
+32,43,32,44
+32,44,33,44
+32,45,32,46
+32,45,33,45
+32,46,33,46
+32,47,32,48
+32,47,33,47
+33,21,34,21
+33,27,33,28
+33,27,34,27
+33,28,34,28
+33,31,34,31
+33,32,33,33
+33,32,34,32
+33,42,33,43
+33,43,34,43
+33,44,34,44
+33,45,34,45
+33,46,33,47
+34,21,34,22
+34,22,35,22
+34,23,34,24
+34,23,35,23
+34,24,35,24
+34,26,34,27
+34,26,35,26
+34,28,35,28
+34,30,34,31
+34,30,35,30
+34,32,35,32
+34,43,35,43
+34,44,35,44
+34,45,34,46
+34,46,35,46
+35,22,35,23
+35,24,36,24
+35,26,36,26
+35,27,35,28
+35,27,36,27
+35,30,35,31
+35,31,36,31
+35,32,36,32
+35,40,35,41
+35,40,36,40
+35,41,35,42
+35,42,35,43
+35,44,35,45
+35,45,36,45
+35,46,36,46
+36,24,36,25
+36,25,36,26
+36,27,36,28
+36,28,37,28
+36,30,36,31
+36,30,37,30
+36,32,37,32
+36,34,36,35
+36,34,37,34
+36,35,36,36
+36,36,37,36
+36,37,36,38
+36,37,37,37
+36,38,37,38
+36,40,37,40
+36,41,36,42
+36,41,37,41
+36,42,36,43
+36,43,37,43
+36,45,36,46
+37,26,37,27
+37,26,38,26
+37,27,37,28
+37,30,37,31
+37,31,38,31
+37,32,38,32
+37,34,37,35
+37,35,38,35
+37,36,37,37
+37,38,38,38
+37,40,37,41
+37,42,37,43
+37,42,38,42
+38,26,38,27
+38,27,38,28
+38,28,39,28
+38,30,38,31
+38,30,39,30
+38,32,38,33
+38,33,38,34
+38,34,39,34
+38,35,39,35
+38,38,39,38
+38,39,38,40
+38,39,39,39
+38,40,38,41
+38,41,39,41
+38,42,38,43
+38,43,39,43
+39,28,40,28
+39,30,40,30
+39,34,39,35
+39,38,40,38
+39,39,40,39
+39,41,39,42
+39,42,39,43
+40,28,40,29
+40,29,40,30
+40,38,40,39
@@ -0,0 +1,418 @@
+1,1,1,2
+1,1,2,1
+1,2,1,3
+1,3,1,4
+1,4,1,5
+1,5,1,6
+1,6,1,7
+1,7,1,8
+1,8,1,9
+1,9,1,10
+1,10,1,11
+1,11,1,12
+1,12,1,13
+1,13,1,14
+1,14,1,15
+1,15,1,16
+1,16,1,17
+1,17,1,18
+1,18,1,19
+1,19,1,20
+1,20,1,21
+1,21,1,22
+1,22,1,23
+1,23,1,24
+1,24,1,25
+1,25,1,26
+1,26,1,27
+1,27,1,28
+1,28,1,29
+1,29,1,30
+1,30,1,31
+1,31,1,32
+1,32,1,33
+1,33,1,34
+1,34,1,35
+1,35,1,36
+1,36,1,37
+1,37,1,38
+1,38,1,39
+1,39,1,40
+1,40,1,41
+1,41,2,41
+1,42,1,43
+1,42,2,42
+1,43,1,44
+1,44,1,45
+1,45,1,46
+1,46,1,47
+1,47,1,48
+1,48,1,49
+1,49,2,49
+2,1,3,1
+2,41,3,41
+2,42,3,42
+2,49,2,50
+2,50,3,50
+3,1,4,1
+3,41,4,41
+3,42,4,42
+3,48,3,49
+3,48,4,48
+3,49,3,50
+4,1,5,1
+4,37,4,38
+4,37,5,37
+4,38,4,39
+4,39,4,40
+4,40,4,41
+4,42,5,42
+4,46,4,47
+4,46,5,46
+4,47,4,48
+5,1,6,1
+5,37,5,38
+5,38,5,39
+5,39,5,40
+5,40,5,41
+5,41,5,42
+5,46,5,47
+5,47,5,48
+5,48,6,48
+6,1,7,1
+6,48,7,48
+7,1,8,1
+7,48,8,48
+8,1,9,1
+8,48,9,48
+8,49,8,50
+8,49,9,49
+8,50,9,50
+9,1,10,1
+9,48,9,49
+9,50,10,50
+10,1,11,1
+10,50,11,50
+11,1,12,1
+11,50,12,50
+12,1,13,1
+12,50,13,50
+13,1,14,1
+13,48,13,49
+13,48,14,48
+13,49,13,50
+14,1,15,1
+14,48,14,49
+14,49,14,50
+14,50,15,50
+15,1,16,1
+15,49,15,50
+15,49,16,49
+16,1,17,1
+16,48,16,49
+16,48,17,48
+17,1,18,1
+17,48,17,49
+17,49,18,49
+18,1,19,1
+18,42,18,43
+18,42,19,42
+18,43,18,44
+18,44,18,45
+18,45,18,46
+18,46,18,47
+18,47,19,47
+18,49,18,50
+18,50,19,50
+19,1,20,1
+19,42,19,43
+19,43,19,44
+19,44,19,45
+19,45,19,46
+19,46,20,46
+19,47,20,47
+19,48,19,49
+19,48,20,48
+19,49,19,50
+20,1,21,1
+20,32,20,33
+20,32,21,32
+20,33,20,34
+20,34,21,34
+20,46,21,46
+20,47,20,48
+21,1,22,1
+21,32,21,33
+21,33,22,33
+21,34,22,34
+21,46,21,47
+21,47,22,47
+22,1,23,1
+22,33,23,33
+22,34,23,34
+22,47,23,47
+23,1,24,1
+23,33,24,33
+23,34,24,34
+23,47,24,47
+24,1,25,1
+24,33,25,33
+24,34,25,34
+24,47,25,47
+25,1,26,1
+25,33,26,33
+25,34,26,34
+25,41,25,42
+25,41,26,41
+25,42,26,42
+25,46,25,47
+25,46,26,46
+26,1,27,1
+26,30,26,31
+26,30,27,30
+26,31,26,32
+26,32,26,33
+26,34,27,34
+26,41,27,41
+26,42,27,42
+26,46,27,46
+27,1,28,1
+27,8,27,9
+27,8,28,8
+27,9,28,9
+27,30,27,31
+27,31,27,32
+27,32,27,33
+27,33,28,33
+27,34,27,35
+27,35,27,36
+27,36,28,36
+27,41,28,41
+27,42,28,42
+27,44,27,45
+27,44,28,44
+27,45,27,46
+28,1,29,1
+28,8,29,8
+28,9,29,9
+28,33,28,34
+28,34,28,35
+28,35,29,35
+28,36,29,36
+28,38,28,39
+28,38,29,38
+28,39,28,40
+28,40,28,41
+28,42,28,43
+28,43,28,44
+29,1,30,1
+29,7,29,8
+29,7,30,7
+29,9,30,9
+29,17,29,18
+29,17,30,17
+29,18,29,19
+29,19,30,19
+29,35,30,35
+29,36,29,37
+29,37,30,37
+29,38,30,38
+30,1,31,1
+30,7,31,7
+30,8,30,9
+30,8,31,8
+30,17,30,18
+30,18,31,18
+30,19,31,19
+30,35,30,36
+30,36,31,36
+30,37,30,38
+31,1,32,1
+31,6,31,7
+31,6,32,6
+31,8,32,8
+31,18,32,18
+31,19,32,19
+31,36,31,37
+31,37,32,37
+32,1,33,1
+32,6,33,6
+32,7,32,8
+32,7,33,7
+32,18,33,18
+32,19,33,19
+32,32,32,33
+32,32,33,32
+32,33,32,34
+32,34,32,35
+32,35,32,36
+32,36,32,37
+33,1,34,1
+33,6,34,6
+33,7,34,7
+33,18,34,18
+33,19,33,20
+33,20,34,20
+33,27,33,28
+33,27,34,27
+33,28,34,28
+33,32,33,33
+33,33,33,34
+33,34,33,35
+33,35,33,36
+33,36,34,36
+34,1,35,1
+34,6,35,6
+34,7,35,7
+34,18,34,19
+34,19,35,19
+34,20,35,20
+34,27,35,27
+34,28,35,28
+34,33,34,34
+34,33,35,33
+34,34,35,34
+34,35,34,36
+34,35,35,35
+35,1,36,1
+35,6,36,6
+35,7,36,7
+35,19,36,19
+35,20,35,21
+35,21,35,22
+35,22,36,22
+35,25,35,26
+35,25,36,25
+35,26,35,27
+35,28,35,29
+35,29,35,30
+35,30,36,30
+35,32,35,33
+35,32,36,32
+35,34,36,34
+35,35,36,35
+36,1,37,1
+36,6,37,6
+36,7,37,7
+36,19,36,20
+36,20,36,21
+36,21,37,21
+36,22,37,22
+36,25,36,26
+36,26,36,27
+36,27,36,28
+36,28,36,29
+36,29,37,29
+36,30,37,30
+36,32,37,32
+36,34,37,34
+36,35,37,35
+37,1,38,1
+37,6,38,6
+37,7,38,7
+37,21,38,21
+37,22,37,23
+37,23,37,24
+37,24,37,25
+37,25,38,25
+37,26,37,27
+37,26,38,26
+37,27,38,27
+37,29,38,29
+37,30,38,30
+37,32,38,32
+37,34,37,35
+38,1,39,1
+38,6,39,6
+38,7,39,7
+38,21,38,22
+38,22,38,23
+38,23,38,24
+38,24,39,24
+38,25,39,25
+38,26,39,26
+38,27,38,28
+38,28,38,29
+38,30,39,30
+38,31,38,32
+38,31,39,31
+39,1,40,1
+39,6,40,6
+39,7,40,7
+39,24,40,24
+39,25,40,25
+39,26,40,26
+39,30,39,31
+40,1,41,1
+40,3,40,4
+40,3,41,3
+40,4,41,4
+40,6,41,6
+40,7,41,7
+40,23,40,24
+40,23,41,23
+40,25,41,25
+40,26,40,27
+40,27,41,27
+41,1,42,1
+41,3,42,3
+41,4,42,4
+41,5,41,6
+41,5,42,5
+41,7,42,7
+41,22,41,23
+41,22,42,22
+41,25,41,26
+41,26,41,27
+42,1,42,2
+42,2,42,3
+42,4,43,4
+42,5,43,5
+42,6,42,7
+42,6,43,6
+42,22,42,23
+42,23,43,23
+43,4,43,5
+43,6,44,6
+43,7,43,8
+43,7,44,7
+43,8,44,8
+43,11,43,12
+43,11,44,11
+43,12,43,13
+43,13,44,13
+43,22,43,23
+43,22,44,22
+44,6,44,7
+44,8,45,8
+44,10,44,11
+44,10,45,10
+44,13,44,14
+44,14,44,15
+44,15,45,15
+44,22,45,22
+45,8,46,8
+45,9,45,10
+45,9,46,9
+45,14,45,15
+45,14,46,14
+45,22,46,22
+46,8,46,9
+46,14,46,15
+46,15,47,15
+46,18,46,19
+46,18,47,18
+46,19,46,20
+46,20,47,20
+46,21,46,22
+46,21,47,21
+47,14,47,15
+47,14,48,14
+47,16,47,17
+47,16,48,16
+47,17,47,18
+47,20,48,20
+47,21,48,21
+48,14,48,15
+48,15,48,16
+48,20,48,21
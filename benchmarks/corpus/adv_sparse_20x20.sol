@@ -0,0 +1,100 @@
+1,7,1,8
+1,7,2,7
+1,8,1,9
+1,9,1,10
+1,10,2,10
+1,12,1,13
+1,12,2,12
+1,13,1,14
+1,14,2,14
+1,15,1,16
+1,15,2,15
+1,16,1,17
+1,17,1,18
+1,18,1,19
+1,19,1,20
+1,20,2,20
+2,5,2,6
+2,5,3,5
+2,6,3,6
+2,7,2,8
+2,8,3,8
+2,10,2,11
+2,11,3,11
+2,12,3,12
+2,14,2,15
+2,20,3,20
+3,5,4,5
+3,6,3,7
+3,7,3,8
+3,11,3,12
+3,20,4,20
+4,3,4,4
+4,3,5,3
+4,4,5,4
+4,5,4,6
+4,6,5,6
+4,20,5,20
+5,3,6,3
+5,4,5,5
+5,5,5,6
+5,20,6,20
+6,3,6,4
+6,4,7,4
+6,5,6,6
+6,5,7,5
+6,6,7,6
+6,20,7,20
+7,4,7,5
+7,6,8,6
+7,20,8,20
+8,6,9,6
+8,20,9,20
+9,6,10,6
+9,20,10,20
+10,6,10,7
+10,7,11,7
+10,20,11,20
+11,7,11,8
+11,8,11,9
+11,9,12,9
+11,20,12,20
+12,7,12,8
+12,7,13,7
+12,8,12,9
+12,11,12,12
+12,11,13,11
+12,12,12,13
+12,13,13,13
+12,20,13,20
+13,7,13,8
+13,8,13,9
+13,9,14,9
+13,11,14,11
+13,13,14,13
+13,20,14,20
+14,9,15,9
+14,11,14,12
+14,12,15,12
+14,13,15,13
+14,15,14,16
+14,15,15,15
+14,16,14,17
+14,17,15,17
+14,18,14,19
+14,18,15,18
+14,19,15,19
+14,20,15,20
+15,9,15,10
+15,10,15,11
+15,11,15,12
+15,13,15,14
+15,14,15,15
+15,17,15,18
+15,19,16,19
+15,20,16,20
+16,19,17,19
+16,20,17,20
+17,19,18,19
+17,20,18,20
+18,19,18,20
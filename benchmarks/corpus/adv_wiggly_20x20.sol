@@ -0,0 +1,252 @@
+1,12,1,13
+1,12,2,12
+1,13,2,13
+1,17,1,18
+1,17,2,17
+1,18,1,19
+1,19,1,20
+1,20,2,20
+2,11,2,12
+2,11,3,11
+2,13,3,13
+2,17,2,18
+2,18,2,19
+2,19,3,19
+2,20,3,20
+3,3,3,4
+3,3,4,3
+3,4,3,5
+3,5,4,5
+3,6,3,7
+3,6,4,6
+3,7,4,7
+3,11,4,11
+3,12,3,13
+3,12,4,12
+3,14,3,15
+3,14,4,14
+3,15,4,15
+3,17,3,18
+3,17,4,17
+3,18,4,18
+3,19,4,19
+3,20,4,20
+4,3,4,4
+4,4,5,4
+4,5,5,5
+4,6,5,6
+4,7,5,7
+4,8,4,9
+4,8,5,8
+4,9,5,9
+4,10,4,11
+4,10,5,10
+4,12,5,12
+4,14,5,14
+4,15,4,16
+4,16,5,16
+4,17,5,17
+4,18,5,18
+4,19,5,19
+4,20,5,20
+5,3,5,4
+5,3,6,3
+5,5,5,6
+5,7,6,7
+5,8,6,8
+5,9,5,10
+5,12,5,13
+5,13,6,13
+5,14,6,14
+5,15,5,16
+5,15,6,15
+5,17,6,17
+5,18,6,18
+5,19,6,19
+5,20,6,20
+6,3,6,4
+6,4,6,5
+6,5,6,6
+6,6,7,6
+6,7,7,7
+6,8,7,8
+6,9,6,10
+6,9,7,9
+6,10,6,11
+6,11,6,12
+6,12,7,12
+6,13,7,13
+6,14,7,14
+6,15,6,16
+6,16,6,17
+6,18,7,18
+6,19,7,19
+6,20,7,20
+7,4,7,5
+7,4,8,4
+7,5,8,5
+7,6,8,6
+7,7,8,7
+7,8,7,9
+7,10,7,11
+7,10,8,10
+7,11,8,11
+7,12,8,12
+7,13,7,14
+7,18,7,19
+7,20,8,20
+8,2,8,3
+8,2,9,2
+8,3,8,4
+8,5,8,6
+8,7,8,8
+8,8,8,9
+8,9,8,10
+8,11,8,12
+8,20,9,20
+9,2,9,3
+9,3,9,4
+9,4,9,5
+9,5,9,6
+9,6,9,7
+9,7,10,7
+9,20,10,20
+10,1,10,2
+10,1,11,1
+10,2,10,3
+10,3,10,4
+10,4,10,5
+10,5,10,6
+10,6,10,7
+10,20,11,20
+11,1,11,2
+11,2,11,3
+11,3,11,4
+11,4,11,5
+11,5,12,5
+11,7,11,8
+11,7,12,7
+11,8,12,8
+11,9,11,10
+11,9,12,9
+11,10,12,10
+11,15,11,16
+11,15,12,15
+11,16,12,16
+11,20,12,20
+12,1,12,2
+12,1,13,1
+12,2,12,3
+12,3,12,4
+12,4,12,5
+12,7,13,7
+12,8,13,8
+12,9,13,9
+12,10,12,11
+12,11,13,11
+12,15,13,15
+12,16,13,16
+12,19,12,20
+12,19,13,19
+13,1,14,1
+13,5,13,6
+13,5,14,5
+13,6,13,7
+13,8,14,8
+13,9,14,9
+13,10,13,11
+13,10,14,10
+13,12,13,13
+13,12,14,12
+13,13,13,14
+13,14,14,14
+13,15,14,15
+13,16,14,16
+13,17,13,18
+13,17,14,17
+13,18,14,18
+13,19,13,20
+13,20,14,20
+14,1,14,2
+14,2,14,3
+14,3,14,4
+14,4,15,4
+14,5,14,6
+14,6,15,6
+14,8,15,8
+14,9,15,9
+14,10,14,11
+14,11,15,11
+14,12,15,12
+14,14,15,14
+14,15,15,15
+14,16,15,16
+14,17,15,17
+14,18,15,18
+14,19,14,20
+14,19,15,19
+15,4,16,4
+15,6,16,6
+15,7,15,8
+15,7,16,7
+15,9,15,10
+15,10,16,10
+15,11,15,12
+15,13,15,14
+15,13,16,13
+15,15,16,15
+15,16,16,16
+15,17,16,17
+15,18,16,18
+15,19,15,20
+15,20,16,20
+16,4,16,5
+16,5,16,6
+16,7,17,7
+16,10,17,10
+16,13,17,13
+16,14,16,15
+16,14,17,14
+16,16,17,16
+16,17,17,17
+16,18,16,19
+16,19,17,19
+16,20,17,20
+17,5,17,6
+17,5,18,5
+17,6,17,7
+17,8,17,9
+17,8,18,8
+17,9,18,9
+17,10,17,11
+17,11,18,11
+17,12,17,13
+17,12,18,12
+17,14,17,15
+17,15,18,15
+17,16,18,16
+17,17,17,18
+17,18,18,18
+17,19,18,19
+17,20,18,20
+18,5,18,6
+18,6,18,7
+18,7,19,7
+18,8,19,8
+18,9,18,10
+18,10,19,10
+18,11,19,11
+18,12,18,13
+18,13,18,14
+18,14,19,14
+18,15,19,15
+18,16,19,16
+18,17,18,18
+18,17,19,17
+18,19,18,20
+19,7,19,8
+19,10,19,11
+19,14,20,14
+19,15,20,15
+19,16,19,17
+20,14,20,15
@@ -0,0 +1,358 @@
+1,1,1,2
+1,1,2,1
+1,2,1,3
+1,3,1,4
+1,4,1,5
+1,5,1,6
+1,6,1,7
+1,7,1,8
+1,8,1,9
+1,9,1,10
+1,10,1,11
+1,11,1,12
+1,12,1,13
+1,13,1,14
+1,14,1,15
+1,15,1,16
+1,16,1,17
+1,17,1,18
+1,18,1,19
+1,19,1,20
+1,20,1,21
+1,21,1,22
+1,22,1,23
+1,23,1,24
+1,24,1,25
+1,25,2,25
+2,1,3,1
+2,9,2,10
+2,9,3,9
+2,10,2,11
+2,11,2,12
+2,12,3,12
+2,16,2,17
+2,16,3,16
+2,17,2,18
+2,18,3,18
+2,19,2,20
+2,19,3,19
+2,20,3,20
+2,23,2,24
+2,23,3,23
+2,24,2,25
+3,1,4,1
+3,9,3,10
+3,10,3,11
+3,11,4,11
+3,12,4,12
+3,15,3,16
+3,15,4,15
+3,18,4,18
+3,19,4,19
+3,20,4,20
+3,21,3,22
+3,21,4,21
+3,22,3,23
+4,1,5,1
+4,11,5,11
+4,12,4,13
+4,13,5,13
+4,14,4,15
+4,14,5,14
+4,16,4,17
+4,16,5,16
+4,17,5,17
+4,18,4,19
+4,20,5,20
+4,21,4,22
+4,22,4,23
+4,23,5,23
+5,1,6,1
+5,3,5,4
+5,3,6,3
+5,4,5,5
+5,5,6,5
+5,7,5,8
+5,7,6,7
+5,8,6,8
+5,11,5,12
+5,12,6,12
+5,13,5,14
+5,16,6,16
+5,17,5,18
+5,18,5,19
+5,19,6,19
+5,20,5,21
+5,21,5,22
+5,22,5,23
+5,24,5,25
+5,24,6,24
+5,25,6,25
+6,1,7,1
+6,3,6,4
+6,4,7,4
+6,5,7,5
+6,7,7,7
+6,8,7,8
+6,12,7,12
+6,14,6,15
+6,14,7,14
+6,15,6,16
+6,18,6,19
+6,18,7,18
+6,21,6,22
+6,21,7,21
+6,22,6,23
+6,23,6,24
+6,25,7,25
+7,1,8,1
+7,3,7,4
+7,3,8,3
+7,5,7,6
+7,6,7,7
+7,8,8,8
+7,12,7,13
+7,13,7,14
+7,18,7,19
+7,19,7,20
+7,20,8,20
+7,21,8,21
+7,25,8,25
+8,1,9,1
+8,2,8,3
+8,2,9,2
+8,4,8,5
+8,4,9,4
+8,5,8,6
+8,6,8,7
+8,7,8,8
+8,20,8,21
+8,25,9,25
+9,1,10,1
+9,2,10,2
+9,4,9,5
+9,5,10,5
+9,7,9,8
+9,7,10,7
+9,8,9,9
+9,9,9,10
+9,10,10,10
+9,12,9,13
+9,12,10,12
+9,13,10,13
+9,15,9,16
+9,15,10,15
+9,16,10,16
+9,25,10,25
+10,1,10,2
+10,3,10,4
+10,3,11,3
+10,4,10,5
+10,7,11,7
+10,8,10,9
+10,8,11,8
+10,9,10,10
+10,12,11,12
+10,13,11,13
+10,15,11,15
+10,16,11,16
+10,17,10,18
+10,17,11,17
+10,18,11,18
+10,19,10,20
+10,19,11,19
+10,20,11,20
+10,22,10,23
+10,22,11,22
+10,23,10,24
+10,24,10,25
+11,1,11,2
+11,1,12,1
+11,2,11,3
+11,7,12,7
+11,8,12,8
+11,12,12,12
+11,13,12,13
+11,15,12,15
+11,16,12,16
+11,17,12,17
+11,18,12,18
+11,19,12,19
+11,20,12,20
+11,22,11,23
+11,23,12,23
+12,1,13,1
+12,5,12,6
+12,5,13,5
+12,6,13,6
+12,7,13,7
+12,8,13,8
+12,9,12,10
+12,9,13,9
+12,10,13,10
+12,12,13,12
+12,13,13,13
+12,15,13,15
+12,16,13,16
+12,17,13,17
+12,18,13,18
+12,19,13,19
+12,20,13,20
+12,22,12,23
+12,22,13,22
+13,1,14,1
+13,5,14,5
+13,6,14,6
+13,7,14,7
+13,8,14,8
+13,9,14,9
+13,10,14,10
+13,12,14,12
+13,13,14,13
+13,14,13,15
+13,14,14,14
+13,16,13,17
+13,18,14,18
+13,19,14,19
+13,20,14,20
+13,21,13,22
+13,21,14,21
+14,1,15,1
+14,4,14,5
+14,4,15,4
+14,6,15,6
+14,7,15,7
+14,8,15,8
+14,9,15,9
+14,10,14,11
+14,11,15,11
+14,12,15,12
+14,13,15,13
+14,14,15,14
+14,15,14,16
+14,15,15,15
+14,16,14,17
+14,17,14,18
+14,19,15,19
+14,20,15,20
+14,21,14,22
+14,22,15,22
+15,1,15,2
+15,2,16,2
+15,3,15,4
+15,3,16,3
+15,5,15,6
+15,5,16,5
+15,7,16,7
+15,8,16,8
+15,9,15,10
+15,10,16,10
+15,11,16,11
+15,12,16,12
+15,13,15,14
+15,15,15,16
+15,16,15,17
+15,17,15,18
+15,18,16,18
+15,19,16,19
+15,20,16,20
+15,22,15,23
+15,23,16,23
+16,2,16,3
+16,5,17,5
+16,7,17,7
+16,8,17,8
+16,10,17,10
+16,11,17,11
+16,12,16,13
+16,13,16,14
+16,14,16,15
+16,15,16,16
+16,16,17,16
+16,18,17,18
+16,19,17,19
+16,20,16,21
+16,21,17,21
+16,22,16,23
+16,22,17,22
+17,1,17,2
+17,1,18,1
+17,2,17,3
+17,3,18,3
+17,4,17,5
+17,4,18,4
+17,7,18,7
+17,8,18,8
+17,10,18,10
+17,11,18,11
+17,12,17,13
+17,12,18,12
+17,13,18,13
+17,14,17,15
+17,14,18,14
+17,15,17,16
+17,18,17,19
+17,21,17,22
+18,1,19,1
+18,3,18,4
+18,7,19,7
+18,8,19,8
+18,10,19,10
+18,11,19,11
+18,12,19,12
+18,13,19,13
+18,14,18,15
+18,15,19,15
+19,1,20,1
+19,2,19,3
+19,2,20,2
+19,3,19,4
+19,4,20,4
+19,5,19,6
+19,5,20,5
+19,6,20,6
+19,7,20,7
+19,8,20,8
+19,10,20,10
+19,11,20,11
+19,12,20,12
+19,13,20,13
+19,14,19,15
+19,14,20,14
+20,1,20,2
+20,4,21,4
+20,5,21,5
+20,6,21,6
+20,7,21,7
+20,8,20,9
+20,9,21,9
+20,10,21,10
+20,11,20,12
+20,13,20,14
+21,2,21,3
+21,2,22,2
+21,3,21,4
+21,5,22,5
+21,6,21,7
+21,9,22,9
+21,10,21,11
+21,11,22,11
+22,2,22,3
+22,3,22,4
+22,4,23,4
+22,5,22,6
+22,6,22,7
+22,7,23,7
+22,9,23,9
+22,10,22,11
+22,10,23,10
+23,4,23,5
+23,5,24,5
+23,7,23,8
+23,8,24,8
+23,9,23,10
+24,5,24,6
+24,6,25,6
+24,7,24,8
+24,7,25,7
+25,6,25,7
@@ -0,0 +1,28 @@
+"""Measure how many boards with a unique solution the generator creates per
+minute, using every core.
+
+python benchmarks/generator_throughput.py [boards per size] [sizes...]
+"""
+import io
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from Util.generate import run_generator  # noqa: E402
+
+
+def main():
+    boards = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    sizes = [int(arg) for arg in sys.argv[2:]] or [10, 20, 30]
+
+    print(f"{boards} boards per size on {os.cpu_count()} cores")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            rate = run_generator(boards, size, directory, output=io.StringIO())
+        print(f"{size:>3}x{size:<3}: {rate:7.2f} boards/minute")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Report the cold-start import time of the headless core and of the GUI.
+
+python benchmarks/import_time.py [-o results.json] [--repeat 5] [modules...]
+
+Every module is imported in a fresh interpreter with -X importtime, the
+best of --repeat runs is reported with the slowest modules it pulls in.
+The headless modules must not import pygame or tkinter, the exit status
+is 1 if one of them does.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src")
+
+# module: True if it is part of the headless core
+MODULES = {
+    "Logic.board": True,
+    "Logic.graph": True,
+    "Logic.game": True,
+    "Logic.ai": True,
+    "Logic.uniqueness": True,
+    "Logic.library": True,
+    "Util.batch": True,
+    "Util.generate": True,
+    "main": True,
+    "GUI.show_game": False,
+    "GUI.show_menu": False,
+}
+
+# Modules of the GUI that the headless core must not load
+GUI_MODULES = ("pygame", "tkinter")
+
+
+def import_time(module: str) -> tuple[float, int, list[tuple[str, int]]]:
+    """Import a module in a fresh interpreter
+
+    Args:
+        module (str): the name of the module
+
+    Returns:
+        tuple[float, int, list]: the wall time of the interpreter in seconds,
+        the cumulative import time of the module in microseconds and every
+        module imported with its cumulative time
+    """
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                             cwd=SRC, capture_output=True, text=True, check=True,
+                             env=dict(os.environ, PYTHONPATH=SRC))
+    wall = time.perf_counter() - start
+
+    imported = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        imported.append((name.strip(), int(cumulative)))
+    total = next((cumulative for name, cumulative in imported if name == module), 0)
+    return wall, total, imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", help="modules to import, all by default")
+    parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    modules = args.modules or list(MODULES)
+    results = {}
+    leaks = []
+    print(f"{'module':<20}{'import ms':>10}{'wall ms':>9}  gui  slowest imports")
+    for module in modules:
+        runs = [import_time(module) for _ in range(args.repeat)]
+        wall = min(run[0] for run in runs)
+        total, imported = min((run[1], run[2]) for run in runs)
+        names = {name for name, _ in imported}
+        gui = sorted(name for name in GUI_MODULES if name in names)
+        top = sorted((item for item in imported if item[0] != module
+                      and "." not in item[0]), key=lambda item: -item[1])[:3]
+        results[module] = {"import_us": total, "wall_s": wall, "gui": gui,
+                           "modules": len(imported)}
+        if MODULES.get(module, True) and gui:
+            leaks.append(module)
+        print(f"{module:<20}{total / 1e3:10.1f}{wall * 1e3:9.1f}  {'yes' if gui else 'no ':<4} "
+              + ", ".join(f"{name} {cumulative / 1e3:.1f}" for name, cumulative in top), flush=True)
+
+    if args.output:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "modules": results,
+        }
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2, sort_keys=True)
+
+    for module in leaks:
+        print(f"HEADLESS IMPORTS GUI: {module} loads {', '.join(results[module]['gui'])}")
+    if leaks:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
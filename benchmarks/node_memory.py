@@ -0,0 +1,63 @@
+"""Compare the memory used by the board cells with the compact Node against
+the list based Node it replaced.
+
+python benchmarks/node_memory.py [size] [boards]
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from Logic.node import Node  # noqa: E402
+
+
+class ListNode:
+    """The Node as it was before the __slots__ change"""
+    def __init__(self, color, x, y) -> None:
+        self.x = x
+        self.y = y
+        self.color = color
+        self.weight = 0
+        self.adjacency_list = []
+
+
+def measure(node_class, size: int, boards: int) -> tuple[int, int]:
+    """Build some boards of cells and measure the allocations
+
+    Args:
+        node_class (type): The class used for every cell
+        size (int): The size of each board
+        boards (int): The number of boards kept in memory
+
+    Returns:
+        tuple[int, int]: The bytes and the number of blocks allocated
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = [[[node_class(None, x, y) for y in range(size)] for x in range(size)]
+            for _ in range(boards)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    allocated = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del kept
+    return allocated, blocks
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    boards = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    cells = size * size * boards
+
+    print(f"{boards} boards of {size}x{size} ({cells} cells)")
+    for name, node_class in (("list Node", ListNode), ("slots Node", Node)):
+        allocated, blocks = measure(node_class, size, boards)
+        print(f"{name:>10}: {allocated / cells:7.1f} bytes/cell, "
+              f"{blocks / cells:4.2f} allocations/cell")
+
+
+if __name__ == "__main__":
+    main()
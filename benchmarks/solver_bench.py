@@ -0,0 +1,250 @@
+"""Time the hot paths on the benchmark corpus and compare with a baseline.
+
+python benchmarks/solver_bench.py [-o results.json] [-c baseline.json]
+                                  [--backend search|sat] [--timeout 10]
+                                  [--repeat 5] [--threshold 0.2] [boards...]
+
+For every board of benchmarks/corpus it measures:
+    load       Graph(file)
+    replay     adding every edge of the known solution to the Graph
+    check_win  Graph.check_win() on the known solution
+    solve      AI.solve() from scratch, with its search nodes and, for the
+               sat backend, the size of the CNF and the work of the solver
+with the wall time (best of --repeat, solve runs once) and the peak
+memory traced while it runs. With -c the results are compared with a
+stored run and the exit status is 1 if a board got slower, bigger or
+stopped being solved.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from Logic.ai import AI  # noqa: E402
+from Logic.graph import Graph  # noqa: E402
+from Logic.solver import SolverTimeout  # noqa: E402
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+# Differences below these values are noise, whatever the ratio
+TIME_FLOOR = 0.0002
+MEMORY_FLOOR = 16 * 1024
+
+
+def read_solution(path: str) -> list[tuple[int, int, int, int]]:
+    """Read the known solution of a board
+
+    Args:
+        path (str): the path of the .sol file
+
+    Returns:
+        list[tuple[int, int, int, int]]: the edges, counting from 0
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path) as file:
+        return [tuple(int(value) - 1 for value in line.split(","))
+                for line in file if line.strip()]
+
+
+def measure(function, repeat: int) -> tuple[float, int, object]:
+    """Run a function, timing the best of some runs and tracing the peak
+    memory of an extra run
+
+    Args:
+        function (Callable): the function to run
+        repeat (int): the number of timed runs
+
+    Returns:
+        tuple[float, int, object]: the best time, the peak memory in bytes
+        and the result of the last run
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def replay(path: str, solution: list) -> Graph:
+    """Build the graph of a board and add the edges of a solution
+
+    Args:
+        path (str): the path of the board
+        solution (list): the edges to add
+
+    Returns:
+        Graph: the graph with the edges
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        graph = Graph(path)
+        for s_x, s_y, e_x, e_y in solution:
+            graph.add_edge(s_x, s_y, e_x, e_y)
+    return graph
+
+
+def bench_board(path: str, backend: str, timeout: float, repeat: int) -> dict:
+    """Measure the hot paths of a board
+
+    Args:
+        path (str): the path of the board
+        backend (str): the solver of AI
+        timeout (float): the seconds AI.solve can take
+        repeat (int): the number of timed runs of the fast paths
+
+    Returns:
+        dict: the measures of the board
+    """
+    solution = read_solution(path[:-4] + ".sol")
+    result = {}
+
+    result["load_time"], result["load_peak"], graph = measure(lambda: Graph(path), repeat)
+    result["size"] = graph.size
+    result["clues"] = len(graph.clue_nodes)
+
+    if solution:
+        result["replay_time"], result["replay_peak"], graph = measure(
+            lambda: replay(path, solution), repeat)
+        result["check_win_time"], _, won = measure(graph.check_win, repeat)
+        result["check_win"] = won
+
+    def solve():
+        ai = AI(Graph(path), backend)
+        try:
+            status = "yes" if ai.solve(deadline=time.perf_counter() + timeout) else "no"
+        except SolverTimeout:
+            status = "timeout"
+        return status, ai.nodes, ai.stats
+
+    start = time.perf_counter()
+    result["solved"], result["nodes"], stats = solve()
+    result["solve_time"] = time.perf_counter() - start
+    if stats:
+        result["cnf"] = stats
+    if result["solved"] != "timeout":
+        tracemalloc.start()
+        solve()
+        result["solve_peak"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+
+def cnf_stats(stats: dict) -> str:
+    """Format the CNF stats of the sat backend for the table
+
+    Args:
+        stats (dict): the result of SatSolver.stats, None for the search
+            backend
+
+    Returns:
+        str: the stats, empty for the search backend
+    """
+    if not stats:
+        return ""
+    return (f"  {stats['variables']} vars {stats['clauses']} clauses "
+            f"{stats['conflicts']} conflicts {stats['learned']} learned "
+            f"{stats['subtours']} subtour cuts")
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Find the regressions of some results against a baseline
+
+    Args:
+        results (dict): the measures of every board
+        baseline (dict): the measures of every board of the baseline
+        threshold (float): the relative growth that is a regression
+
+    Returns:
+        list[str]: one line per regression
+    """
+    regressions = []
+    for name, current in sorted(results.items()):
+        old = baseline.get(name)
+        if old is None:
+            continue
+        if old.get("solved") == "yes" and current.get("solved") != "yes":
+            regressions.append(f"{name}: solved {old['solved']} -> {current['solved']}")
+        if old.get("check_win") and not current.get("check_win", True):
+            regressions.append(f"{name}: check_win True -> False")
+
+        for key, floor in (("load_time", TIME_FLOOR), ("replay_time", TIME_FLOOR),
+                           ("check_win_time", TIME_FLOOR), ("solve_time", TIME_FLOOR),
+                           ("load_peak", MEMORY_FLOOR), ("replay_peak", MEMORY_FLOOR),
+                           ("solve_peak", MEMORY_FLOOR), ("nodes", 0)):
+            if key not in old or key not in current:
+                continue
+            before, after = old[key], current[key]
+            if after > before * (1 + threshold) and after - before > floor:
+                regressions.append(f"{name}: {key} {before:.6g} -> {after:.6g} "
+                                   f"({(after / before - 1) * 100 if before else float('inf'):+.0f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("boards", nargs="*", help="names of the boards to run, all by default")
+    parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    parser.add_argument("-c", "--compare", help="baseline JSON file to compare with")
+    parser.add_argument("--backend", default="search", choices=("search", "sat"))
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--corpus", default=CORPUS)
+    args = parser.parse_args()
+
+    names = sorted(name[:-4] for name in os.listdir(args.corpus) if name.endswith(".txt"))
+    if args.boards:
+        names = [name for name in names if name in args.boards]
+
+    results = {}
+    print(f"{'board':<22}{'load ms':>9}{'replay ms':>11}{'win ms':>9}"
+          f"{'solve s':>9}{'nodes':>8}{'peak KB':>9}  solved")
+    for name in names:
+        result = bench_board(os.path.join(args.corpus, name + ".txt"),
+                             args.backend, args.timeout, args.repeat)
+        results[name] = result
+        print(f"{name:<22}{result['load_time'] * 1e3:9.2f}"
+              f"{result.get('replay_time', 0) * 1e3:11.2f}"
+              f"{result.get('check_win_time', 0) * 1e3:9.3f}"
+              f"{result['solve_time']:9.2f}{result['nodes']:8}"
+              f"{result.get('solve_peak', 0) / 1024:9.0f}  {result['solved']}"
+              + cnf_stats(result.get("cnf")), flush=True)
+
+    if args.output:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backend": args.backend,
+            "timeout": args.timeout,
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "boards": results,
+        }
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["boards"]
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print("REGRESSION", line)
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,17 @@
 # Imports
+from collections import OrderedDict
+
 import pygame
 
+import Util.trace as trace
+
+# Pre-rendered static layers of the boards, by board, size and theme, the
+# least recently used first
+static_layers = OrderedDict()
+
+# Number of static layers kept, one per recent board and theme
+MAX_STATIC_LAYERS = 4
+
 # Draw the game
 
 def drawAll(
@@ -14,8 +25,9 @@ def drawAll(
         ICON_THEME_SIZE,
         ICON_THEME_X,
         ICON_THEME_Y,
-        circle_data,
-        drawn_lines,
+        layers,
+        edges,
+        marked,
         colors):
     drawButtonTheme(
         screen,
@@ -31,8 +43,9 @@ def drawAll(
         N_CELLS,
         CELL_SIZE,
         MARGIN_SIZE,
-        circle_data,
-        drawn_lines,
+        layers,
+        edges,
+        marked,
         colors)
 
 # Draw the button theme
@@ -64,7 +77,8 @@ def drawButtonTheme(
          ICON_THEME_SIZE,
          ICON_THEME_SIZE))
 
-# Draw the structure of the game
+# Draw the structure of the game: the cached background, the lines and the
+# cached circles on top of them
 
 
 def drawStructure(
@@ -72,55 +86,145 @@ def drawStructure(
         N_CELLS,
         CELL_SIZE,
         MARGIN_SIZE,
-        circle_data,
-        drawn_lines,
+        layers,
+        edges,
+        marked,
         colors):
+    background, circles = layers
     # Draw the grid
-    for row in range(1, N_CELLS + 1):
-        for col in range(1, N_CELLS + 1):
-            x = (col - 1) * CELL_SIZE + MARGIN_SIZE
-            y = (row - 1) * CELL_SIZE + MARGIN_SIZE
-            # Draw the cell
-            pygame.draw.rect(
-                screen, colors.WHITE, (x, y, CELL_SIZE, CELL_SIZE))
-            # Draw the border of the cell
-            pygame.draw.rect(
-                screen, colors.BLACK, (x, y, CELL_SIZE, CELL_SIZE), 1)
+    screen.blit(background, (MARGIN_SIZE, MARGIN_SIZE))
 
     # Draw the circles and lines
-    for i in range(1, len(drawn_lines), 2):
-        cell_start = drawn_lines[i - 1]
-        cell_finish = drawn_lines[i]
-        # print(f"\n[{i}]: Celda inicio: {cell_start}, Celda final: {cell_finish}")
-        x1 = (cell_start[1] - 1) * CELL_SIZE + MARGIN_SIZE + CELL_SIZE // 2
-        y1 = (cell_start[0] - 1) * CELL_SIZE + MARGIN_SIZE + CELL_SIZE // 2
-        x2 = (cell_finish[1] - 1) * CELL_SIZE + MARGIN_SIZE + CELL_SIZE // 2
-        y2 = (cell_finish[0] - 1) * CELL_SIZE + MARGIN_SIZE + CELL_SIZE // 2
-        pygame.draw.line(screen, colors.BLACK, (x1, y1),
-                         (x2, y2), CELL_SIZE // 6)
+    for (s_x, s_y), (e_x, e_y) in edges:
+        drawLine(screen, (s_x + 1, s_y + 1), (e_x + 1, e_y + 1), CELL_SIZE, MARGIN_SIZE, colors)
 
     # Draw the circles
-    for row in range(1, N_CELLS + 1):
-        for col in range(1, N_CELLS + 1):
-            x = (col - 1) * CELL_SIZE + MARGIN_SIZE
-            y = (row - 1) * CELL_SIZE + MARGIN_SIZE
-            # Calculate the center of the cell
-            half_x = x + CELL_SIZE // 2
-            half_y = y + CELL_SIZE // 2
-
-            if (row, col) in circle_data:
-                circle_type = circle_data[(row, col)]
-                if circle_type == 1:
-                    # Draw a white circle
-                    pygame.draw.circle(
-                        screen, colors.WHITE, (half_x, half_y), (CELL_SIZE // 2.5))
-                    # Draw a black circle
-                    pygame.draw.circle(
-                        screen, colors.BLACK, (half_x, half_y), (CELL_SIZE // 2.5), 10)
-                elif circle_type == 2:
-                    pygame.draw.circle(
-                        screen, colors.BLACK, (half_x, half_y), (CELL_SIZE // 2.5))
-            else:
-                # Draw a black circle
-                pygame.draw.circle(
-                    screen, colors.BLACK, (half_x, half_y), (CELL_SIZE // 20))
+    screen.blit(circles, (MARGIN_SIZE, MARGIN_SIZE))
+
+    # Draw the conflicts
+    for cell in marked:
+        drawConflict(screen, cell // N_CELLS + 1, cell % N_CELLS + 1, CELL_SIZE, MARGIN_SIZE, colors)
+
+# Get the static layers of a board: the cells with their borders, and the
+# circles and center dots on a transparent surface, they only change with
+# the board, the cell size and the theme
+
+
+def getStaticLayers(board, circle_data, N_CELLS, CELL_SIZE, colors):
+    key = (board, N_CELLS, CELL_SIZE, colors.WHITE, colors.BLACK)
+    layers = static_layers.get(key)
+    if layers is not None:
+        static_layers.move_to_end(key)
+        return layers
+
+    with trace.span("render.static_layers", cells=N_CELLS * N_CELLS):
+        size = N_CELLS * CELL_SIZE
+        background = pygame.Surface((size, size))
+        circles = pygame.Surface((size, size), pygame.SRCALPHA)
+        for row in range(1, N_CELLS + 1):
+            for col in range(1, N_CELLS + 1):
+                drawCellBackground(background, row, col, CELL_SIZE, 0, colors)
+                drawCircle(circles, row, col, CELL_SIZE, 0, circle_data, colors)
+
+    # Forget the least recently used layers
+    while len(static_layers) >= MAX_STATIC_LAYERS:
+        static_layers.popitem(last=False)
+    static_layers[key] = (background, circles)
+    return background, circles
+
+# Get the rectangle of a cell, row and col count from 1
+
+
+def cellRect(row, col, CELL_SIZE, MARGIN_SIZE):
+    return pygame.Rect((col - 1) * CELL_SIZE + MARGIN_SIZE,
+                       (row - 1) * CELL_SIZE + MARGIN_SIZE, CELL_SIZE, CELL_SIZE)
+
+# Draw the background and the border of a cell
+
+
+def drawCellBackground(screen, row, col, CELL_SIZE, MARGIN_SIZE, colors):
+    rect = cellRect(row, col, CELL_SIZE, MARGIN_SIZE)
+    # Draw the cell
+    pygame.draw.rect(screen, colors.WHITE, rect)
+    # Draw the border of the cell
+    pygame.draw.rect(screen, colors.BLACK, rect, 1)
+
+# Draw a line between the centers of two cells
+
+
+def drawLine(screen, cell_start, cell_finish, CELL_SIZE, MARGIN_SIZE, colors):
+    x1 = (cell_start[1] - 1) * CELL_SIZE + MARGIN_SIZE + CELL_SIZE // 2
+    y1 = (cell_start[0] - 1) * CELL_SIZE + MARGIN_SIZE + CELL_SIZE // 2
+    x2 = (cell_finish[1] - 1) * CELL_SIZE + MARGIN_SIZE + CELL_SIZE // 2
+    y2 = (cell_finish[0] - 1) * CELL_SIZE + MARGIN_SIZE + CELL_SIZE // 2
+    pygame.draw.line(screen, colors.BLACK, (x1, y1),
+                     (x2, y2), CELL_SIZE // 6)
+
+# Draw the circle of a cell, or its center dot if it has no clue
+
+
+def drawCircle(screen, row, col, CELL_SIZE, MARGIN_SIZE, circle_data, colors):
+    x = (col - 1) * CELL_SIZE + MARGIN_SIZE
+    y = (row - 1) * CELL_SIZE + MARGIN_SIZE
+    # Calculate the center of the cell
+    half_x = x + CELL_SIZE // 2
+    half_y = y + CELL_SIZE // 2
+
+    if (row, col) in circle_data:
+        circle_type = circle_data[(row, col)]
+        if circle_type == 1:
+            # Draw a white circle
+            pygame.draw.circle(
+                screen, colors.WHITE, (half_x, half_y), (CELL_SIZE // 2.5))
+            # Draw a black circle
+            pygame.draw.circle(
+                screen, colors.BLACK, (half_x, half_y), (CELL_SIZE // 2.5), 10)
+        elif circle_type == 2:
+            pygame.draw.circle(
+                screen, colors.BLACK, (half_x, half_y), (CELL_SIZE // 2.5))
+    else:
+        # Draw a black circle
+        pygame.draw.circle(
+            screen, colors.BLACK, (half_x, half_y), (CELL_SIZE // 20))
+
+# Draw the mark of a cell with a conflict
+
+
+def drawConflict(screen, row, col, CELL_SIZE, MARGIN_SIZE, colors):
+    pygame.draw.rect(screen, colors.RED, cellRect(row, col, CELL_SIZE, MARGIN_SIZE),
+                     max(2, CELL_SIZE // 12))
+
+# Draw again only some cells, with the lines that touch them, and get the
+# rectangles that changed. A line only covers the cells of its two ends, so
+# clipping to the cell gives the same pixels as a full redraw
+
+
+def drawCells(
+        screen,
+        cells,
+        CELL_SIZE,
+        MARGIN_SIZE,
+        layers,
+        adjacency_matrix,
+        marked,
+        colors):
+    background, circles = layers
+    N_CELLS = len(adjacency_matrix)
+    rects = []
+    clip = screen.get_clip()
+    for row, col in cells:
+        rect = cellRect(row, col, CELL_SIZE, MARGIN_SIZE)
+        area = cellRect(row, col, CELL_SIZE, 0)
+        screen.set_clip(rect)
+        screen.blit(background, rect, area)
+        node = adjacency_matrix[row - 1][col - 1]
+        for other in (node.up, node.down, node.left, node.right):
+            if other is not None:
+                drawLine(screen, (row, col), (other.x + 1, other.y + 1),
+                         CELL_SIZE, MARGIN_SIZE, colors)
+        screen.blit(circles, rect, area)
+        if (row - 1) * N_CELLS + col - 1 in marked:
+            drawConflict(screen, row, col, CELL_SIZE, MARGIN_SIZE, colors)
+        rects.append(rect)
+    screen.set_clip(clip)
+    return rects
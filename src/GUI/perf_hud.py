@@ -0,0 +1,143 @@
+# Imports
+import time
+from collections import deque
+
+import pygame
+
+import GUI.text_cache as text_cache
+
+# Frames kept for the frame time percentiles
+FRAME_HISTORY = 240
+
+# Seconds between two renders of the text of the HUD, between them the
+# cached surface is used
+HUD_REFRESH = 0.25
+
+# Size of the text of the HUD
+FONT_SIZE = 16
+
+
+class PerfHud:
+    """
+    PerfHud class to show what each frame of the game costs, in the bottom
+    margin of the screen so it never covers the board
+
+    The frame time is the work of Game.draw, split in input, logic and
+    drawing. Game.draw times the three phases itself, the logic is the
+    Game_flow work of the frame: the moves, the journal keys, the check of
+    the win and the conflicts. Only the frames that were drawn are counted,
+    the game waits for events between them.
+
+    Attributes
+    ----------
+    rect : pygame.Rect
+        The region of the screen of the HUD
+    visible : bool
+        If the HUD is shown
+    frames : deque
+        The last frames as (end, frame, input, logic, draw), in seconds
+    check_win_time : Optional[float]
+        The seconds of the last check of the win, None if there is none
+    surface : Optional[pygame.Surface]
+        The last render of the HUD
+    rendered : float
+        The time.perf_counter() value of the last render
+
+    Methods
+    -------
+    toggle()
+        Show or hide the HUD
+    end_frame(start, input_end, logic_end, end)
+        Add the times of a frame
+    render(now, edge_count)
+        Render the text of the HUD
+    draw(screen, edge_count, force)
+        Draw the HUD, rendering it again if it is old
+    """
+    def __init__(self, rect) -> None:
+        self.rect = pygame.Rect(rect)
+        self.visible = False
+        self.frames = deque(maxlen=FRAME_HISTORY)
+        self.check_win_time = None
+        self.surface = None
+        self.rendered = 0.0
+
+    def toggle(self) -> None:
+        """Show or hide the HUD, the frames are kept only while it is shown"""
+        self.visible = not self.visible
+        if not self.visible:
+            self.frames.clear()
+            self.surface = None
+
+    def end_frame(self, start: float, input_end: float, logic_end: float, end: float) -> None:
+        """Add the times of a frame
+
+        Args:
+            start (float): the time.perf_counter() value when the frame started
+            input_end (float): the value when the input ended
+            logic_end (float): the value when the Game_flow work ended
+            end (float): the value when the drawing ended
+        """
+        self.frames.append((end, end - start, input_end - start, logic_end - input_end,
+                            end - logic_end))
+
+    def render(self, now: float, edge_count: int) -> pygame.Surface:
+        """Render the text of the HUD
+
+        Args:
+            now (float): the time.perf_counter() value of the render
+            edge_count (int): the number of edges of the game
+
+        Returns:
+            pygame.Surface: the HUD, the size of rect
+        """
+        frames = self.frames
+        # Frames are only drawn when something changed, so this is not the
+        # frame rate the game could reach
+        redraws = sum(1 for frame in frames if now - frame[0] <= 1.0)
+        if frames:
+            times = sorted(frame[1] for frame in frames)
+            p50, p95, p99 = (times[min(len(times) - 1, int(len(times) * q))] * 1e3
+                             for q in (0.5, 0.95, 0.99))
+            count = len(frames)
+            phases = [sum(frame[i] for frame in frames) / count * 1e3 for i in (2, 3, 4)]
+        else:
+            p50 = p95 = p99 = 0.0
+            phases = [0.0, 0.0, 0.0]
+        check_win = ("-" if self.check_win_time is None
+                     else f"{self.check_win_time * 1e6:.0f} us")
+        lines = [
+            f"redraws/s {redraws}  frame ms p50 {p50:.2f} p95 {p95:.2f} p99 {p99:.2f}",
+            f"ms/frame input {phases[0]:.2f} logic {phases[1]:.2f} draw {phases[2]:.2f}",
+            f"edges {edge_count}  check_win {check_win}",
+        ]
+
+        surface = pygame.Surface(self.rect.size)
+        surface.fill((0, 0, 0))
+        font = text_cache.get_font(FONT_SIZE)
+        for number, line in enumerate(lines):
+            surface.blit(font.render(line, True, (255, 255, 255)), (4, 2 + number * FONT_SIZE))
+        return surface
+
+    def draw(self, screen, edge_count: int, force: bool):
+        """Draw the HUD, its text is rendered again every HUD_REFRESH
+        seconds and the cached surface is drawn in between
+
+        Args:
+            screen: screen to draw the HUD
+            edge_count (int): the number of edges of the game
+            force (bool): draw it even if it did not change, after the
+                whole screen was drawn
+
+        Returns:
+            Optional[pygame.Rect]: the region of the HUD, None if it was not
+            drawn
+        """
+        now = time.perf_counter()
+        if self.surface is None or now - self.rendered >= HUD_REFRESH:
+            self.surface = self.render(now, edge_count)
+            self.rendered = now
+        elif not force:
+            return None
+        screen.blit(self.surface, self.rect)
+        return self.rect
@@ -1,21 +1,31 @@
+import os
+import sys
+import time
+
 import pygame
 
 import Util.colors as COLORS
+import Util.trace as trace
 import GUI.draw_game as draw_game
+import GUI.perf_hud as perf_hud
+import GUI.text_cache as text_cache
 from Controllers.mouse_controller import MouseController
 from Logic.game import Game_flow
+from Logic.journal import JournalError
+from Util.background_solve import BackgroundSolve
 
 
 class Game:
     def __init__(self, SCREEN_WIDTH, SCREEN_HEIGHT, filename):
-        # List to store the drawn lines
-        self.drawn_lines = []
         self.filename = filename
         
         # Create the graph
         self.game = Game_flow(self.filename)
         self.mc = MouseController(self.game)
 
+        # The drawn lines are the edges of the graph, the single copy of them
+        self.edges = self.game.edges
+
         # Define constants
 
         # Colors
@@ -57,23 +67,79 @@ class Game:
         
         # Win status
         self.has_won = False
+        # Win status kept up to date after every move
+        self.live_won = False
         # Button clicked status
         self.button_clicked = False
         
-        # Create the data with the file
-        self.circle_data = self.game.graph.create_circle_data(filename)
+        # The clues to draw, from the board the graph already parsed
+        self.circle_data = self.game.graph.board.circle_data()
 
         self.prev_cell_clicked = (-10, -10)
 
+        # File of the saved session of the board
+        self.session_path = os.path.splitext(filename)[0] + ".session"
+
+        # The whole screen has to be drawn on the next frame, after that only
+        # the cells of the moves are drawn again
+        self.full_redraw = True
+
+        # Solve of the AI in a worker process, and the edges of its solution
+        # that are still to be drawn
+        self.ai = None
+        self.animation = []
+
+        # Result of the last save or load of the session, shown in the status
+        # of the AI until the AI starts again
+        self.message = ""
+
+        # Status of the AI, between the check win and the theme buttons
+        self.AI_STATUS_X = self.BUTTON_WIN_X + self.BUTTON_WIN_WIDTH + 10
+        self.AI_STATUS_Y = self.BUTTON_WIN_Y
+        self.AI_STATUS_WIDTH = self.BUTTON_THEME_X - 10 - self.AI_STATUS_X
+        self.AI_STATUS_HEIGHT = self.BUTTON_WIN_HEIGHT
+
+        # Seconds the solution takes to be drawn edge by edge
+        self.AI_ANIMATION_TIME = 2
+
+        # Performance HUD in the bottom margin, F3 shows and hides it
+        self.hud = perf_hud.PerfHud((0, self.SCREEN_HEIGHT - self.MARGIN_SIZE + 4,
+                                     self.SCREEN_WIDTH, self.MARGIN_SIZE - 4))
+
+    def invalidate(self):
+        """Draw the whole game on the next frame, when something else was
+        drawn on the screen
+        """
+        self.full_redraw = True
+
+    def static_layers(self):
+        """Get the pre-rendered cells and circles of the board, they are
+        rendered again only when the theme or the cell size changes
+
+        Returns:
+            tuple[pygame.Surface, pygame.Surface]: the background and the
+            circles layers
+        """
+        return draw_game.getStaticLayers(
+            self.game.graph.board, self.circle_data, self.N_CELLS, self.CELL_SIZE, self.colors)
+
     def draw(self, screen, events):
-        """Draws the game on the screen
+        """Draws the game on the screen, only the parts that changed since the
+        last frame
 
         Args:
             screen: screen to draw the game
             events: events to check if the user clicked on the theme button
+
+        Returns:
+            list[pygame.Rect]: the regions of the screen that changed, for
+            pygame.display.update
         """
-        screen.fill(self.colors.BLACK)
-        
+        start = time.perf_counter()
+        # The clicks and the keys only ask for Game_flow work here, it is
+        # done in the logic phase of the frame
+        keys = []
+        check = False
         for event in events:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 # Check if the mouse is over the theme button
@@ -81,30 +147,98 @@ class Game:
                 if self.BUTTON_THEME_X <= mouse_x <= self.BUTTON_THEME_X + self.BUTTON_THEME_SIZE and \
                         self.BUTTON_THEME_Y <= mouse_y <= self.BUTTON_THEME_Y + self.BUTTON_THEME_SIZE:
                     self.colors.change_dark_mode()
+                    self.full_redraw = True
                 # Check if the mouse is over the check win button
                 elif self.BUTTON_WIN_X <= mouse_x <= self.BUTTON_WIN_X + self.BUTTON_WIN_WIDTH and \
                         self.BUTTON_WIN_Y <= mouse_y <= self.BUTTON_WIN_Y + self.BUTTON_WIN_HEIGHT:
-                    self.check_win()
-                    
+                    check = True
+                    self.full_redraw = True
+            elif event.type == pygame.KEYDOWN and event.mod & pygame.KMOD_CTRL:
+                # The board belongs to the AI until its solution is drawn
+                if not self.busy():
+                    keys.append(event.key)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.hud.toggle()
+                self.full_redraw = True
+
+        with trace.span("render.input"):
+            if not self.busy():
+                mouse_buttons = pygame.mouse.get_pressed()
+                mouse_pos = pygame.mouse.get_pos()
+
+                self.prev_cell_clicked = self.mc.detects_lines(
+                    mouse_buttons, mouse_pos, self.CELL_SIZE, self.MARGIN_SIZE, self.N_CELLS, self.prev_cell_clicked)
+        input_end = time.perf_counter()
+
+        with trace.span("render.logic"):
+            if self.busy():
+                # The board belongs to the AI until its solution is drawn
+                status_changed = self.step_ai()
+            else:
+                status_changed = False
+                for added, edge in self.mc.moves:
+                    if added:
+                        self.game.make_move(*edge)
+                    else:
+                        self.game.undo_move(*edge)
+            self.mc.moves.clear()
+            for key in keys:
+                self.journal_key(key)
+            if check:
+                self.check_win()
+            self.follow_conflicts()
+        logic_end = time.perf_counter()
+
+        full = self.full_redraw
+        if not full:
+            with trace.span("render.cells", cells=len(self.mc.changed_cells)):
+                rects = draw_game.drawCells(
+                    screen,
+                    self.mc.changed_cells,
+                    self.CELL_SIZE,
+                    self.MARGIN_SIZE,
+                    self.static_layers(),
+                    self.game.graph.adjacency_matrix,
+                    self.game.conflicts.marked,
+                    self.colors)
+            self.mc.changed_cells.clear()
+            if status_changed:
+                rects.append(self.draw_ai_status(screen))
+        else:
+            self.full_redraw = False
+            self.mc.changed_cells.clear()
+            with trace.span("render.full"):
+                self.draw_screen(screen)
+            rects = [screen.get_rect()]
+
+        # The HUD is drawn after the frame is timed
+        if self.hud.visible:
+            self.hud.end_frame(start, input_end, logic_end, time.perf_counter())
+            rect = self.hud.draw(screen, self.game.graph.edge_count, full)
+            if rect is not None and not full:
+                rects.append(rect)
+        return rects
+
+    def draw_screen(self, screen):
+        """Draw the whole game
+
+        Args:
+            screen: screen to draw the game
+        """
+        screen.fill(self.colors.BLACK)
+
         if self.button_clicked:
-            font = pygame.font.Font(None, 54)
             if self.has_won:
-                text = font.render("You Win!", True, self.colors.GREEN)
+                text = text_cache.render("You Win!", 54, self.colors.GREEN)
             else:
-                text = font.render("You have errors", True, self.colors.RED)
+                text = text_cache.render("You have errors", 54, self.colors.RED)
             text_rect = text.get_rect(center=(self.SCREEN_WIDTH / 2, 50))
-            
+        
             # Add a white background behind the text
             pygame.draw.rect(screen, self.colors.WHITE, (text_rect.x - 2,
                              text_rect.y - 2, text_rect.width + 10, text_rect.height + 10))
             screen.blit(text, text_rect)
 
-        mouse_buttons = pygame.mouse.get_pressed()
-        mouse_pos = pygame.mouse.get_pos()
-
-        self.drawn_lines, self.prev_cell_clicked = self.mc.detects_lines(
-            mouse_buttons, mouse_pos, self.CELL_SIZE, self.MARGIN_SIZE, self.N_CELLS, self.prev_cell_clicked, self.drawn_lines)
-
         draw_game.drawAll(
             screen,
             self.N_CELLS,
@@ -116,20 +250,170 @@ class Game:
             self.ICON_THEME_SIZE,
             self.ICON_THEME_X,
             self.ICON_THEME_Y,
-            self.circle_data,
-            self.drawn_lines,
+            self.static_layers(),
+            self.edges,
+            self.game.conflicts.marked,
             self.colors)
 
         # Draw the check win button
         pygame.draw.rect(screen, self.colors.WHITE, (self.BUTTON_WIN_X,
                          self.BUTTON_WIN_Y, self.BUTTON_WIN_WIDTH, self.BUTTON_WIN_HEIGHT))
-        font = pygame.font.Font(None, 24)
-        text = font.render("Check Win", True, self.colors.BLACK)
+        text = text_cache.render("Check Win", 24, self.colors.BLACK)
         screen.blit(text, (self.BUTTON_WIN_X + 10, self.BUTTON_WIN_Y + 10))
+        if self.ai is not None or self.message:
+            self.draw_ai_status(screen)
+
+    def follow_conflicts(self):
+        """Draw again the cells whose conflict mark changed with the last
+        moves, and show the win message as soon as the board is solved
+        """
+        conflicts = self.game.conflicts
+        for cell in conflicts.changed:
+            self.mc.changed_cells.add((cell // self.N_CELLS + 1, cell % self.N_CELLS + 1))
+        conflicts.changed.clear()
+
+        won = conflicts.won()
+        if won != self.live_won:
+            self.live_won = won
+            self.has_won = won
+            self.button_clicked = won
+            self.full_redraw = True
+
+    def start_ai(self, backend="sat"):
+        """Start solving the board in a worker process, the window keeps
+        drawing and the solution is drawn on the board when it arrives
+
+        Args:
+            backend: the solver to use, a key of Logic.ai.BACKENDS
+        """
+        if self.busy():
+            return
+        self.ai = BackgroundSolve(self.game.graph.board, backend)
+        self.animation = []
+        self.message = ""
+
+    def cancel_ai(self):
+        """Stop the AI, the edges of the solution already drawn are kept"""
+        if self.ai is not None and self.busy():
+            self.ai.cancel()
+            self.animation = []
+            self.full_redraw = True
+
+    def busy(self):
+        """Check if the AI is solving the board or drawing its solution
+
+        Returns:
+            bool: True if the player has to wait for the AI
+        """
+        return self.ai is not None and (self.ai.running() or bool(self.animation))
+
+    def step_ai(self):
+        """Read the progress of the AI and draw the next edges of its
+        solution through Game_flow, so they can be undone like any move
+
+        Returns:
+            bool: True if the status of the AI has to be drawn again
+        """
+        if self.ai.running():
+            if self.ai.poll() and self.ai.status == "solved":
+                self.start_animation()
+            # The elapsed time changes on every frame
+            return True
+
+        # Draw the solution in AI_ANIMATION_TIME seconds, whatever its length
+        count = max(1, len(self.ai.solution) // (self.FPS * self.AI_ANIMATION_TIME))
+        for (s_x, s_y), (e_x, e_y) in self.animation[:count]:
+            self.game.make_move(s_x, s_y, e_x, e_y)
+            self.mc.changed_cells.add((s_x + 1, s_y + 1))
+            self.mc.changed_cells.add((e_x + 1, e_y + 1))
+        del self.animation[:count]
+        return not self.animation
+
+    def start_animation(self):
+        """Remove the edges of the player that are not in the solution and
+        queue the edges of the solution that are missing
+        """
+        edges = self.game.edges
+        solution = {edges.key(s_x, s_y, e_x, e_y) for (s_x, s_y), (e_x, e_y) in self.ai.solution}
+        for key in [key for key in edges.keys if key not in solution]:
+            (s_x, s_y), (e_x, e_y) = edges.ends(key)
+            self.game.undo_move(s_x, s_y, e_x, e_y)
+            self.mc.changed_cells.add((s_x + 1, s_y + 1))
+            self.mc.changed_cells.add((e_x + 1, e_y + 1))
+        self.animation = [edge for edge in self.ai.solution
+                          if not edges.has(edge[0][0], edge[0][1], edge[1][0], edge[1][1])]
+
+    def draw_ai_status(self, screen):
+        """Draw the progress or the result of the AI, or the result of the
+        last save or load of the session
+
+        Args:
+            screen: screen to draw the status
+
+        Returns:
+            pygame.Rect: the region of the status
+        """
+        ai = self.ai
+        if self.message:
+            message = self.message
+        elif ai.running():
+            message = f"AI {ai.nodes:,} nodes {ai.elapsed():.1f}s (ESC cancels)"
+        elif ai.status == "solved":
+            message = f"AI solved {ai.nodes:,} nodes {ai.elapsed():.1f}s"
+        elif ai.status == "unsolvable":
+            message = f"AI: no solution, {ai.elapsed():.1f}s"
+        elif ai.status == "cancelled":
+            message = f"AI cancelled after {ai.elapsed():.1f}s"
+        else:
+            message = f"AI error: {ai.error}"
+
+        rect = pygame.Rect(self.AI_STATUS_X, self.AI_STATUS_Y, self.AI_STATUS_WIDTH, self.AI_STATUS_HEIGHT)
+        pygame.draw.rect(screen, self.colors.BLACK, rect)
+        # The text changes on every frame, it is not worth caching
+        text = text_cache.get_font(20).render(message, True, (255, 255, 255))
+        clip = screen.get_clip()
+        screen.set_clip(rect)
+        screen.blit(text, text.get_rect(midleft=(rect.x, rect.centery)))
+        screen.set_clip(clip)
+        return rect
+
+    def journal_key(self, key):
+        """Undo (Ctrl+Z), redo (Ctrl+Y), save (Ctrl+S) or load (Ctrl+L) the
+        moves of the game
+
+        Args:
+            key: the key pressed with Ctrl
+        """
+        if key in (pygame.K_z, pygame.K_y):
+            move = self.game.undo() if key == pygame.K_z else self.game.redo()
+            if move is not None:
+                # The journal uses cells from 0, the screen from 1
+                for x, y in move:
+                    self.mc.changed_cells.add((x + 1, y + 1))
+        elif key == pygame.K_s:
+            try:
+                self.game.save_session(self.session_path)
+                self.message = "Session saved"
+            except OSError as error:
+                # The whole error goes to the terminal, the status is short
+                print(f"Session not saved: {error}", file=sys.stderr)
+                self.message = "Session not saved"
+            self.full_redraw = True
+        elif key == pygame.K_l:
+            try:
+                self.game.load_session(self.session_path)
+                self.message = "Session loaded"
+            except FileNotFoundError:
+                self.message = "No saved session"
+            except (OSError, JournalError) as error:
+                print(f"Session not loaded: {error}", file=sys.stderr)
+                self.message = "Session not loaded"
+            self.full_redraw = True
 
     def check_win(self):
-        print("///////////////////////////////////////////////////")
-        print("Button clicked!")
+        start = time.perf_counter()
         self.has_won = self.game.check_solved()
+        self.hud.check_win_time = time.perf_counter() - start
         self.button_clicked = True
-        print(self.has_won)
\ No newline at end of file
+        if trace.enabled:
+            trace.event("game.check_win", trace.INFO, won=self.has_won)
\ No newline at end of file
@@ -2,6 +2,7 @@
 import pygame
 import sys
 
+import GUI.text_cache as text_cache
 import Util.colors as COLORS
 
 from Util.read_files import select_file
@@ -15,16 +16,16 @@ class Menu:
         self.colors = COLORS.colors()
         self.filename = ""
         self.new_game = False
+        # The AI has to solve the game that is shown next
+        self.ai_game = False
 
     # Function to show text on the screen
     def show_text(self, screen, text, x, y, color, size, isCenter):
-        font = pygame.font.Font(None, size)
-        rendered_text = font.render(text, True, color)
+        rendered_text = text_cache.render(text, size, color)
         if isCenter:
             screen.blit(rendered_text,
                         (x - (rendered_text.get_width() // 2),
                          y - (rendered_text.get_height() // 2)))
-            rendered_text.get_height()
         else:
             screen.blit(rendered_text, (x, y))
 
@@ -98,13 +99,23 @@ class Menu:
             if self.filename is not None:
                 self.current_state = "game"
         elif ia_button.collidepoint((mouse_x, mouse_y)) and click:
-            print("AI game")
+            # The AI solves the current game, or a new one if there is none
+            if actual_filename != "":
+                self.new_game = False
+                self.filename = actual_filename
+                self.current_state = "game"
+                self.ai_game = True
+            else:
+                self.new_game = True
+                self.filename = select_file()
+                if self.filename is not None:
+                    self.current_state = "game"
+                    self.ai_game = True
         elif quit_button.collidepoint((mouse_x, mouse_y)) and click:
             pygame.quit()
             sys.exit()
 
-        # Update the screen
-        pygame.display.update()
+        # The screen is presented by the main loop, once per frame
 
         # Check if the user wants to quit the game
         for evento in events:
@@ -0,0 +1,65 @@
+# Imports
+from collections import OrderedDict
+
+import pygame
+
+# Number of rendered texts kept, the screens only show a few labels
+MAX_TEXTS = 64
+
+# Fonts by (face, size), a font is only loaded once
+fonts = {}
+
+# Rendered texts by (text, face, size, color), least recently used first
+texts = OrderedDict()
+
+
+def get_font(size, face=None):
+    """Get a font, loading it the first time it is used
+
+    Args:
+        size (int): the size of the font
+        face (Optional[str]): the path of the font file, None for the
+            default font of pygame
+
+    Returns:
+        pygame.font.Font: the font
+    """
+    key = (face, size)
+    font = fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(face, size)
+        fonts[key] = font
+    return font
+
+
+def render(text, size, color, face=None):
+    """Get the antialiased surface of a text, rendering it only the first
+    time it is used with the same size and color
+
+    Args:
+        text (str): the text to render
+        size (int): the size of the font
+        color (tuple[int, int, int]): the color of the text
+        face (Optional[str]): the path of the font file, None for the
+            default font of pygame
+
+    Returns:
+        pygame.Surface: the rendered text, it must not be drawn on
+    """
+    key = (text, face, size, tuple(color))
+    surface = texts.get(key)
+    if surface is not None:
+        texts.move_to_end(key)
+        return surface
+
+    surface = get_font(size, face).render(text, True, color)
+    texts[key] = surface
+    if len(texts) > MAX_TEXTS:
+        texts.popitem(last=False)
+    return surface
+
+
+def clear():
+    """Forget every font and rendered text"""
+    fonts.clear()
+    texts.clear()
@@ -1,19 +1,69 @@
-from graph import Graph
+from Logic.graph import Graph
+from Logic.solver import Solver
+from Logic.sat import SatSolver
+
+# Solvers that AI can use, by name
+BACKENDS = {"search": Solver, "sat": SatSolver}
+
+
+def solver_class(backend: str):
+    """get the solver of a backend, every user of BACKENDS checks the name
+    here
+
+    Args:
+        backend (str): the name of the backend
+
+    Raises:
+        ValueError: if there is no backend with that name
+
+    Returns:
+        type: Solver or SatSolver
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend}, use one of {', '.join(BACKENDS)}")
+    return BACKENDS[backend]
+
 
 class AI:
     """AI class to solve the board using the graph
     """
-    def __init__(self, graph: Graph) -> None:
+    def __init__(self, graph: Graph, backend: str = "search") -> None:
+        """
+        Args:
+            graph (Graph): the graph of the board
+            backend (str): the solver to use, "search" for constraint
+                propagation and backtracking or "sat" for the CNF encoding
+        """
+        solver_class(backend)
         self.graph = graph
+        self.backend = backend
+        self.solution = []
+        self.nodes = 0
+        self.stats = {}
+
+    def create_solver(self, **kwargs):
+        """Create a solver of the backend with the clues of the graph
+
+        Returns:
+            Solver | SatSolver: the solver of the board
+        """
+        return solver_class(self.backend)(self.graph.size, dict(self.graph.board.clues), **kwargs)
         
-    def solve(self) -> bool:
-        """Solve the board using the graph
+    def solve(self, **kwargs) -> bool:
+        """Solve the board using the graph, the edges of the solution are kept
+        in solution as ((s_x, s_y), (e_x, e_y)) pairs along the loop, so they
+        can be replayed with Game_flow.make_move. The work of the solver is
+        kept in nodes and, for the sat backend, the CNF stats in stats
 
         Returns:
             bool: True if the board is solved, False otherwise
         """
-        # Get the start and end nodes
-        start_node = self.graph.start_node
-        end_node = self.graph.end_node
-        
-        return False
\ No newline at end of file
+        solver = self.create_solver(**kwargs)
+        try:
+            solved = solver.solve()
+        finally:
+            self.nodes = solver.nodes
+            if isinstance(solver, SatSolver):
+                self.stats = solver.stats()
+        self.solution = solver.solutions[0] if solved else []
+        return solved
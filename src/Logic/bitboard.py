@@ -0,0 +1,282 @@
+from Logic.board import BLACK, WHITE, Board, load_board
+
+
+class BitGraph:
+    """
+    BitGraph class to represent the board with packed integer bitmasks
+
+    Every cell (x, y) is the bit x * size + y of an integer. An edge is
+    stored once, on the bit of its top/left cell, so the whole board state
+    is two integers and every board-wide check is a handful of word-level
+    operations instead of a walk over Node objects.
+
+    Attributes
+    ----------
+    board : Board
+        The parsed board the masks were built from
+    size : int
+        The size of the board
+    h_edges : int
+        Bit x * size + y is set if (x, y) is connected to (x, y + 1)
+    v_edges : int
+        Bit x * size + y is set if (x, y) is connected to (x + 1, y)
+    white : int
+        Bitmask of the white clue cells
+    black : int
+        Bitmask of the black clue cells
+    degree : bytearray
+        The number of connections of every cell, indexed by cell id
+
+    Methods
+    -------
+    create_masks(board)
+        Create the clue bitmasks from a board
+    add_edge(s_x, s_y, e_x, e_y)
+        Add an edge between two nodes
+    remove_edge(s_x, s_y, e_x, e_y)
+        Remove an edge between two nodes
+    has_edge(s_x, s_y, e_x, e_y)
+        Check if there is an edge between two nodes
+    connection_masks()
+        Get the left, right, up and down connection bitmasks
+    over_degree_mask()
+        Get the bitmask of the cells with more than two connections
+    dead_end_mask()
+        Get the bitmask of the cells with exactly one connection
+    all_valid_connections()
+        Check if all connections in the board are valid
+    valid_black_mask()
+        Get the bitmask of the satisfied black clues
+    valid_white_mask()
+        Get the bitmask of the satisfied white clues
+    is_single_loop()
+        Check if the edges form exactly one closed loop
+    check_win()
+        Check if the game is over, this is when the board is solved
+    """
+    def __init__(self, board) -> None:
+        """
+        Args:
+            board (Board | str): the parsed board, or the path of a board
+                file to load
+        """
+        if not isinstance(board, Board):
+            board = load_board(board)
+        self.board = board
+        self.size = board.size
+        self.white = 0
+        self.black = 0
+        self.create_masks(board)
+
+        # An edge never starts on the last column, so the horizontal shifts
+        # cannot wrap into the next row, only the top bits need masking
+        self.full = (1 << (self.size * self.size)) - 1
+
+        self.h_edges = 0
+        self.v_edges = 0
+        self.degree = bytearray(self.size * self.size)
+
+    def create_masks(self, board: Board) -> None:
+        """Create the clue bitmasks from a board
+
+        Args:
+            board (Board): the parsed board
+        """
+        for (x, y), color in board.clues.items():
+            bit = 1 << (x * self.size + y)
+            if color == WHITE:
+                self.white |= bit
+            elif color == BLACK:
+                self.black |= bit
+
+    def edge_bit(self, s_x: int, s_y: int, e_x: int, e_y: int) -> tuple[bool, int]:
+        """Get the mask and bit that store the edge between two nodes
+
+        Args:
+            s_x (int): start node x position
+            s_y (int): start node y position
+            e_x (int): end node x position
+            e_y (int): end node y position
+
+        Raises:
+            ValueError: if the nodes are not adjacent cells of the board
+
+        Returns:
+            tuple[bool, int]: True if the edge is horizontal, and its bit
+        """
+        if (abs(s_x - e_x) + abs(s_y - e_y) != 1
+                or not 0 <= min(s_x, e_x) <= max(s_x, e_x) < self.size
+                or not 0 <= min(s_y, e_y) <= max(s_y, e_y) < self.size):
+            raise ValueError(f"({s_x}, {s_y}) and ({e_x}, {e_y}) are not adjacent")
+        x, y = min(s_x, e_x), min(s_y, e_y)
+        return s_x == e_x, 1 << (x * self.size + y)
+
+    def add_edge(self, s_x: int, s_y: int, e_x: int, e_y: int) -> None:
+        """Add an edge between two nodes
+
+        Args:
+            s_x (int): start node x position
+            s_y (int): start node y position
+            e_x (int): end node x position
+            e_y (int): end node y position
+        """
+        horizontal, bit = self.edge_bit(s_x, s_y, e_x, e_y)
+        if horizontal:
+            if self.h_edges & bit:
+                return
+            self.h_edges |= bit
+        else:
+            if self.v_edges & bit:
+                return
+            self.v_edges |= bit
+
+        self.degree[s_x * self.size + s_y] += 1
+        self.degree[e_x * self.size + e_y] += 1
+
+    def remove_edge(self, s_x: int, s_y: int, e_x: int, e_y: int) -> None:
+        """Remove an edge between two nodes
+
+        Args:
+            s_x (int): start node x position
+            s_y (int): start node y position
+            e_x (int): end node x position
+            e_y (int): end node y position
+        """
+        horizontal, bit = self.edge_bit(s_x, s_y, e_x, e_y)
+        if horizontal:
+            if not self.h_edges & bit:
+                return
+            self.h_edges &= ~bit
+        else:
+            if not self.v_edges & bit:
+                return
+            self.v_edges &= ~bit
+
+        self.degree[s_x * self.size + s_y] -= 1
+        self.degree[e_x * self.size + e_y] -= 1
+
+    def has_edge(self, s_x: int, s_y: int, e_x: int, e_y: int) -> bool:
+        """Check if there is an edge between two nodes
+
+        Args:
+            s_x (int): start node x position
+            s_y (int): start node y position
+            e_x (int): end node x position
+            e_y (int): end node y position
+
+        Returns:
+            bool: True if the edge exists, False otherwise
+        """
+        horizontal, bit = self.edge_bit(s_x, s_y, e_x, e_y)
+        return bool((self.h_edges if horizontal else self.v_edges) & bit)
+
+    def connection_masks(self) -> tuple[int, int, int, int]:
+        """Get the bitmasks of the cells connected to the left, right, up
+        and down
+
+        Returns:
+            tuple[int, int, int, int]: The left, right, up and down masks
+        """
+        right = self.h_edges
+        down = self.v_edges
+        left = (right << 1) & self.full
+        up = (down << self.size) & self.full
+        return left, right, up, down
+
+    def over_degree_mask(self) -> int:
+        """Get the bitmask of the cells with more than two connections
+
+        Returns:
+            int: The bitmask of the cells with three or four connections
+        """
+        left, right, up, down = self.connection_masks()
+        return (left & right & (up | down)) | (up & down & (left | right))
+
+    def dead_end_mask(self) -> int:
+        """Get the bitmask of the cells with exactly one connection
+
+        Returns:
+            int: The bitmask of the cells with one connection
+        """
+        left, right, up, down = self.connection_masks()
+        # An odd number of connections is either one or three
+        return (left ^ right ^ up ^ down) & ~self.over_degree_mask()
+
+    def all_valid_connections(self) -> bool:
+        """check if all connections in the board are valid
+
+        Returns:
+            bool: True if all connections are valid, False otherwise
+        """
+        return self.over_degree_mask() == 0
+
+    def valid_black_mask(self) -> int:
+        """Get the bitmask of the satisfied black clues, a black clue must
+        turn and go straight for one more cell on both sides
+
+        Returns:
+            int: The bitmask of the satisfied black clues
+        """
+        left, right, up, down = self.connection_masks()
+        # Connections that keep going straight on the next cell
+        left2 = left & (left << 1)
+        right2 = right & (right >> 1)
+        up2 = up & (up << self.size)
+        down2 = down & (down >> self.size)
+
+        turn = (left | right) & (up | down) & ~(left & right) & ~(up & down)
+        straight_arms = (~(left ^ left2) & ~(right ^ right2)
+                         & ~(up ^ up2) & ~(down ^ down2))
+        return self.black & turn & straight_arms & ~self.over_degree_mask()
+
+    def valid_white_mask(self) -> int:
+        """Get the bitmask of the satisfied white clues, a white clue must
+        go straight and turn on at least one of the next cells
+
+        Returns:
+            int: The bitmask of the satisfied white clues
+        """
+        left, right, up, down = self.connection_masks()
+        left2 = left & (left << 1)
+        right2 = right & (right >> 1)
+        up2 = up & (up << self.size)
+        down2 = down & (down >> self.size)
+
+        across = left & right & ~(up | down) & ~(left2 & right2)
+        along = up & down & ~(left | right) & ~(up2 & down2)
+        return self.white & (across | along)
+
+    def is_single_loop(self) -> bool:
+        """Check if the edges form exactly one closed loop
+
+        Returns:
+            bool: True if there is a single closed loop, False otherwise
+        """
+        left, right, up, down = self.connection_masks()
+        used = left | right | up | down
+        if used == 0 or self.over_degree_mask() or self.dead_end_mask():
+            return False
+
+        # Flood fill the loop of the lowest used cell
+        reached = used & -used
+        while True:
+            grown = (reached
+                     | ((reached & right) << 1)
+                     | ((reached & left) >> 1)
+                     | ((reached & down) << self.size)
+                     | ((reached & up) >> self.size))
+            if grown == reached:
+                break
+            reached = grown
+
+        return reached == used
+
+    def check_win(self) -> bool:
+        """
+        Check if the game is over, this is when the edges form a single loop
+        that goes through every clue and satisfies all of them
+        """
+        if not self.is_single_loop():
+            return False
+        return (self.valid_black_mask() == self.black
+                and self.valid_white_mask() == self.white)
@@ -0,0 +1,179 @@
+from types import MappingProxyType
+from typing import Mapping
+
+# Colors of the clues
+WHITE = 1
+BLACK = 2
+
+
+class BoardFormatError(ValueError):
+    """
+    Error of a board file that can not be read, with the line it comes from
+
+    Attributes
+    ----------
+    file_name : str
+        The path of the board
+    line : int
+        The line of the error, counting from 1
+    """
+    def __init__(self, file_name: str, line: int, message: str) -> None:
+        super().__init__(f"{file_name}:{line}: {message}")
+        self.file_name = file_name
+        self.line = line
+
+
+class Board:
+    """
+    Board class with the parsed clues of a puzzle, it is read once and never
+    changes, so the graph, the renderer and the solvers can share it
+
+    Attributes
+    ----------
+    size : int
+        The size of the board
+    cells : bytes
+        The color of every cell id (x * size + y), 0 if there is no clue
+    clues : Mapping[tuple[int, int], int]
+        The color of every clue, by (x, y) position counting from 0
+
+    Methods
+    -------
+    clue_edges()
+        Get the clue cells that every edge can change
+    color(x, y)
+        Get the color of a cell, None if there is no clue
+    circle_data()
+        Get the clues by (row, col) position counting from 1, as they are
+        drawn
+    """
+    __slots__ = ("size", "cells", "clues", "_clue_edges")
+
+    def __init__(self, size: int, clues: Mapping[tuple[int, int], int]) -> None:
+        """
+        Args:
+            size (int): the size of the board
+            clues (Mapping[tuple[int, int], int]): the color of every clue,
+                by (x, y) position counting from 0
+        """
+        cells = bytearray(size * size)
+        for (x, y), color in clues.items():
+            cells[x * size + y] = color
+        object.__setattr__(self, "size", size)
+        object.__setattr__(self, "cells", bytes(cells))
+        object.__setattr__(self, "clues", MappingProxyType(dict(clues)))
+        object.__setattr__(self, "_clue_edges", None)
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError("Board is immutable")
+
+    def __reduce__(self):
+        return Board, (self.size, dict(self.clues))
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Board) and self.size == other.size and self.cells == other.cells
+
+    def __hash__(self) -> int:
+        return hash((self.size, self.cells))
+
+    def __repr__(self) -> str:
+        return f"Board(size={self.size}, clues={len(self.clues)})"
+
+    def clue_edges(self) -> Mapping[tuple[int, int], tuple[int, ...]]:
+        """Get the clue cells that every edge can change, a clue only depends
+        on its own four edges and on the edges that continue them on the
+        next cell. It is computed once per board and shared by every graph
+        built from it
+
+        Returns:
+            Mapping[tuple[int, int], tuple[int, ...]]: the cell ids of the
+            clues of every edge, the edge key is the pair of cell ids
+            (x * size + y) in order
+        """
+        if self._clue_edges is None:
+            size = self.size
+            index = {}
+            for (x, y) in self.clues:
+                cell = x * size + y
+                for d_x, d_y in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                    # the edge of the clue and the one that continues it
+                    for step in (0, 1):
+                        s_x, s_y = x + d_x * step, y + d_y * step
+                        e_x, e_y = s_x + d_x, s_y + d_y
+                        if 0 <= e_x < size and 0 <= e_y < size:
+                            start, end = s_x * size + s_y, e_x * size + e_y
+                            key = (start, end) if start < end else (end, start)
+                            index.setdefault(key, []).append(cell)
+            object.__setattr__(self, "_clue_edges", MappingProxyType(
+                {key: tuple(cells) for key, cells in index.items()}))
+        return self._clue_edges
+
+    def color(self, x: int, y: int):
+        """Get the color of a cell
+
+        Args:
+            x (int): the row of the cell, from 0
+            y (int): the column of the cell, from 0
+
+        Returns:
+            Optional[int]: the color of the clue, None if there is none
+        """
+        return self.cells[x * self.size + y] or None
+
+    def circle_data(self) -> dict[tuple[int, int], int]:
+        """Get the clues by (row, col) position counting from 1, as they are
+        drawn
+
+        Returns:
+            dict[tuple[int, int], int]: the color of every clue
+        """
+        return {(x + 1, y + 1): color for (x, y), color in self.clues.items()}
+
+
+def load_board(file_name: str) -> Board:
+    """Read a board file in one pass, the first line is the size and every
+    other line a row,col,color clue counting from 1
+
+    Args:
+        file_name (str): the path of the board
+
+    Raises:
+        BoardFormatError: if the size or a clue is malformed, out of the
+            board, of an unknown color or repeated
+
+    Returns:
+        Board: the parsed board
+    """
+    with open(file_name, 'r') as file:
+        lines = file.read().splitlines()
+
+    if not lines or not lines[0].strip():
+        raise BoardFormatError(file_name, 1, "missing the size of the board")
+    try:
+        size = int(lines[0])
+    except ValueError:
+        raise BoardFormatError(file_name, 1, f"the size {lines[0].strip()!r} is not a number") from None
+    if size < 2:
+        raise BoardFormatError(file_name, 1, f"the size {size} is too small")
+
+    clues = {}
+    first_line = {}
+    for number, line in enumerate(lines[1:], start=2):
+        if not line.strip():
+            continue
+        values = line.split(',')
+        try:
+            row, col, color = map(int, values)
+        except ValueError:
+            raise BoardFormatError(file_name, number, f"expected row,col,color, got {line.strip()!r}") from None
+        if not (1 <= row <= size and 1 <= col <= size):
+            raise BoardFormatError(file_name, number, f"({row}, {col}) is out of the {size}x{size} board")
+        if color not in (WHITE, BLACK):
+            raise BoardFormatError(file_name, number, f"unknown color {color}, expected 1 (white) or 2 (black)")
+        cell = (row - 1, col - 1)
+        if cell in clues:
+            raise BoardFormatError(file_name, number, f"({row}, {col}) is repeated, first set on line {first_line[cell]}")
+        clues[cell] = color
+        first_line[cell] = number
+
+    return Board(size, clues)
@@ -0,0 +1,131 @@
+import os
+import sys
+from collections import OrderedDict
+
+from Logic.board import Board, load_board
+import Util.trace as trace
+
+# Limits of the cache shared by the game
+MAX_BOARDS = 32
+MAX_BYTES = 16 * 1024 * 1024
+
+
+def board_bytes(board: Board) -> int:
+    """Estimate the memory of a parsed board
+
+    Args:
+        board (Board): the board
+
+    Returns:
+        int: the bytes of the clue array and the clue dict
+    """
+    return sys.getsizeof(board.cells) + sys.getsizeof(dict(board.clues)) + 64 * len(board.clues)
+
+
+class BoardCache:
+    """
+    BoardCache class to keep the last parsed boards, a board is found by its
+    path and the modification time and size of the file, so a board edited
+    on disk is read again
+
+    Attributes
+    ----------
+    max_boards : int
+        The number of boards kept
+    max_bytes : int
+        The estimated memory of the boards kept
+    boards : OrderedDict
+        The boards by key, from the least to the most recently used
+    used_bytes : int
+        The estimated memory of the boards
+    hits : int
+        The number of loads served from the cache
+    misses : int
+        The number of loads that read the file
+
+    Methods
+    -------
+    key(file_name)
+        Get the key of a board file
+    load(file_name)
+        Get the board of a file, reading it only if it is not cached
+    evict()
+        Remove the least recently used boards until the limits are met
+    clear()
+        Remove every board
+    """
+    def __init__(self, max_boards: int = MAX_BOARDS, max_bytes: int = MAX_BYTES) -> None:
+        self.max_boards = max_boards
+        self.max_bytes = max_bytes
+        self.boards = OrderedDict()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.boards)
+
+    def key(self, file_name: str) -> tuple[str, int, int]:
+        """Get the key of a board file
+
+        Args:
+            file_name (str): the path of the board
+
+        Returns:
+            tuple[str, int, int]: the absolute path, the modification time in
+            nanoseconds and the size of the file
+        """
+        stat = os.stat(file_name)
+        return os.path.abspath(file_name), stat.st_mtime_ns, stat.st_size
+
+    def load(self, file_name: str) -> Board:
+        """Get the board of a file, reading it only if it is not cached
+
+        Args:
+            file_name (str): the path of the board
+
+        Raises:
+            BoardFormatError: if the board file is malformed
+
+        Returns:
+            Board: the parsed board
+        """
+        key = self.key(file_name)
+        entry = self.boards.get(key)
+        if entry is not None:
+            self.boards.move_to_end(key)
+            self.hits += 1
+            if trace.enabled:
+                trace.count("board.cache_hits")
+            return entry[0]
+
+        self.misses += 1
+        with trace.span("board.load", file=key[0]):
+            board = load_board(file_name)
+
+        # An older version of the same file is never used again
+        for old in [old for old in self.boards if old[0] == key[0]]:
+            self.used_bytes -= self.boards.pop(old)[1]
+
+        size = board_bytes(board)
+        self.boards[key] = (board, size)
+        self.used_bytes += size
+        self.evict()
+        return board
+
+    def evict(self) -> None:
+        """Remove the least recently used boards until the limits are met,
+        the last board is always kept"""
+        while len(self.boards) > 1 and (len(self.boards) > self.max_boards
+                                        or self.used_bytes > self.max_bytes):
+            _, (_, size) = self.boards.popitem(last=False)
+            self.used_bytes -= size
+
+    def clear(self) -> None:
+        """Remove every board"""
+        self.boards.clear()
+        self.used_bytes = 0
+
+
+# The cache of the boards opened by the game
+boards = BoardCache()
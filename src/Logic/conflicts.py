@@ -0,0 +1,245 @@
+from Logic.board import BLACK, WHITE
+from Logic.graph import Graph
+from Logic.node import Node
+
+# Slots of the neighbors of a node, their opposite and the (x, y) offsets
+OPPOSITE = {"up": "down", "down": "up", "left": "right", "right": "left"}
+PERPENDICULAR = {"up": ("left", "right"), "down": ("left", "right"),
+                 "left": ("up", "down"), "right": ("up", "down")}
+OFFSETS = {"up": (-1, 0), "down": (1, 0), "left": (0, -1), "right": (0, 1)}
+
+
+class Conflicts:
+    """
+    Conflicts class to keep the mistakes of the edges of a graph up to date
+    after every move, looking only around the edge that changed
+
+    A cell is marked if it has more than two connections, if it is a clue
+    that no added edge can satisfy any more, or if it is on a closed loop
+    that is not the whole solution: there are more loops, edges out of it
+    or clues it does not go through. A loop is only walked when the union of
+    the added edge in the graph closed a cycle, or when an edge is removed
+    from a node with three connections, so the work of a move grows with
+    the loop it closes or opens and not with the board.
+
+    Attributes
+    ----------
+    graph : Graph
+        The graph of the game
+    over_degree : set
+        The cell ids (x * size + y) with more than two connections
+    broken_clues : set
+        The cell ids of the clues that can not be satisfied by adding edges
+    loops : dict
+        The cell ids and the number of clues of every closed loop, by id
+    loop_of : dict
+        The id of the loop of every cell on a closed loop
+    loop_conflicted : bool
+        If the closed loops were mistakes after the last update
+    marked : set
+        The cell ids that are drawn as conflicts
+    changed : set
+        The cell ids whose mark changed, until the renderer clears them
+
+    Methods
+    -------
+    update(s_x, s_y, e_x, e_y)
+        Check again the cells around an edge that was added or removed
+    clue_broken(node)
+        Check if a clue can not be satisfied by adding edges
+    walk_loop(node)
+        Get the cells of the closed loop through a node
+    loop_conflict()
+        Check if the closed loops are mistakes
+    won()
+        Check if the edges solve the board
+    """
+    def __init__(self, graph: Graph) -> None:
+        self.graph = graph
+        self.over_degree = set()
+        self.broken_clues = set()
+        self.loops = {}
+        self.loop_of = {}
+        self.next_loop = 0
+        self.loop_conflicted = False
+        self.marked = set()
+        self.changed = set()
+
+    def __len__(self) -> int:
+        return len(self.marked)
+
+    def is_marked(self, cell: int) -> bool:
+        return (cell in self.over_degree or cell in self.broken_clues
+                or (cell in self.loop_of and self.loop_conflict()))
+
+    def update(self, s_x: int, s_y: int, e_x: int, e_y: int) -> None:
+        """Check again the cells around an edge that was added or removed,
+        the cells whose mark changes are added to changed
+
+        Args:
+            s_x (int): start node x position
+            s_y (int): start node y position
+            e_x (int): end node x position
+            e_y (int): end node y position
+        """
+        size = self.graph.size
+        matrix = self.graph.adjacency_matrix
+        ends = (matrix[s_x][s_y], matrix[e_x][e_y])
+        candidates = set()
+
+        # The clues a move can break are on the edge or next to its cells
+        for node in ends:
+            cell = node.x * size + node.y
+            candidates.add(cell)
+            if node.weight > 2:
+                self.over_degree.add(cell)
+            else:
+                self.over_degree.discard(cell)
+            for d_x, d_y in OFFSETS.values():
+                x, y = node.x + d_x, node.y + d_y
+                if 0 <= x < size and 0 <= y < size:
+                    candidates.add(x * size + y)
+
+        for cell in candidates:
+            node = matrix[cell // size][cell % size]
+            if node.color in (WHITE, BLACK) and self.clue_broken(node):
+                self.broken_clues.add(cell)
+            else:
+                self.broken_clues.discard(cell)
+
+        # A loop through an end is broken by the move, an edge was added to
+        # it or one of its edges was removed
+        for node in ends:
+            loop = self.loop_of.get(node.x * size + node.y)
+            if loop is not None:
+                cells, _ = self.loops.pop(loop)
+                for cell in cells:
+                    del self.loop_of[cell]
+                candidates |= cells
+
+        # A new loop goes through the edge added if it closed a cycle, or
+        # through an end that lost its third connection
+        if self.graph.edges.has(s_x, s_y, e_x, e_y):
+            starts = ()
+            if (ends[0].weight == 2 and ends[1].weight == 2
+                    and self.graph.closed_cycle(s_x, s_y, e_x, e_y) is not False):
+                starts = ends[:1]
+        else:
+            starts = [node for node in ends if node.weight == 2]
+        for node in starts:
+            if node.x * size + node.y not in self.loop_of:
+                cells = self.walk_loop(node)
+                if cells:
+                    clues = sum(1 for cell in cells
+                                if matrix[cell // size][cell % size].color in (WHITE, BLACK))
+                    self.loops[self.next_loop] = (cells, clues)
+                    for cell in cells:
+                        self.loop_of[cell] = self.next_loop
+                    self.next_loop += 1
+                    candidates |= cells
+
+        # The edge count changes with every move, when the loops start or
+        # stop being mistakes every loop cell changes
+        conflicted = self.loop_conflict()
+        if conflicted != self.loop_conflicted:
+            self.loop_conflicted = conflicted
+            candidates |= self.loop_of.keys()
+
+        for cell in candidates:
+            marked = self.is_marked(cell)
+            if marked != (cell in self.marked):
+                if marked:
+                    self.marked.add(cell)
+                else:
+                    self.marked.discard(cell)
+                self.changed.add(cell)
+
+    def clue_broken(self, node: Node) -> bool:
+        """Check if a clue can not be satisfied by adding edges
+
+        Args:
+            node (Node): the white or black node
+
+        Returns:
+            bool: True if only removing edges can satisfy the clue
+        """
+        size = self.graph.size
+        slots = [slot for slot in OFFSETS if getattr(node, slot) is not None]
+
+        if node.color == BLACK:
+            for slot in slots:
+                # a black clue turns
+                if getattr(node, OPPOSITE[slot]) is not None:
+                    return True
+                # and goes straight through the next node, that must have room
+                # to do it
+                other = getattr(node, slot)
+                if any(getattr(other, side) is not None for side in PERPENDICULAR[slot]):
+                    return True
+                d_x, d_y = OFFSETS[slot]
+                if not (0 <= other.x + d_x < size and 0 <= other.y + d_y < size):
+                    return True
+            return False
+
+        for slot in slots:
+            # a white clue goes straight
+            if any(getattr(node, side) is not None for side in PERPENDICULAR[slot]):
+                return True
+            d_x, d_y = OFFSETS[OPPOSITE[slot]]
+            if not (0 <= node.x + d_x < size and 0 <= node.y + d_y < size):
+                return True
+        # and turns on one of the next nodes
+        for slot in ("up", "left"):
+            first, second = getattr(node, slot), getattr(node, OPPOSITE[slot])
+            if (first is not None and second is not None
+                    and getattr(first, slot) is not None
+                    and getattr(second, OPPOSITE[slot]) is not None):
+                return True
+        return False
+
+    def walk_loop(self, node: Node) -> frozenset:
+        """Get the cells of the closed loop through a node, every node of a
+        closed loop has exactly two connections
+
+        Args:
+            node (Node): the node to start from
+
+        Returns:
+            frozenset: the cell ids of the loop, empty if there is none
+        """
+        size = self.graph.size
+        cells = []
+        previous, current = None, node
+        while True:
+            if current.weight != 2:
+                return frozenset()
+            cells.append(current.x * size + current.y)
+            first, second = [getattr(current, slot) for slot in OFFSETS
+                             if getattr(current, slot) is not None]
+            previous, current = current, (second if first is previous else first)
+            if current is node:
+                return frozenset(cells)
+
+    def loop_conflict(self) -> bool:
+        """Check if the closed loops are mistakes, they are unless there is a
+        single one with every edge and every clue
+
+        Returns:
+            bool: True if the loop cells have to be marked
+        """
+        if not self.loops:
+            return False
+        if len(self.loops) > 1:
+            return True
+        cells, clues = next(iter(self.loops.values()))
+        return len(cells) != self.graph.edge_count or clues != len(self.graph.clue_nodes)
+
+    def won(self) -> bool:
+        """Check if the edges solve the board, from the counters kept by
+        update and by the graph
+
+        Returns:
+            bool: True if the board is solved
+        """
+        return (len(self.loops) == 1 and not self.loop_conflict() and not self.over_degree
+                and self.graph.satisfied_clues == len(self.graph.clue_nodes))
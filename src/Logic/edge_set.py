@@ -0,0 +1,140 @@
+from typing import Iterator
+
+# Directions of an edge from its top/left cell
+RIGHT = 0
+DOWN = 1
+
+
+class EdgeSet:
+    """
+    EdgeSet class to store the edges of a board, every edge is the key
+    (cell * 2 + direction) of its top/left cell (x * size + y), so adding,
+    removing and looking up an edge is one set operation whatever the order
+    of its ends
+
+    Attributes
+    ----------
+    size : int
+        The size of the board
+    keys : set
+        The keys of the edges
+
+    Methods
+    -------
+    key(s_x, s_y, e_x, e_y)
+        Get the key of the edge between two cells
+    ends(key)
+        Get the cells of an edge key
+    has(s_x, s_y, e_x, e_y)
+        Check if there is an edge between two cells
+    add(s_x, s_y, e_x, e_y)
+        Add the edge between two cells
+    remove(s_x, s_y, e_x, e_y)
+        Remove the edge between two cells
+    toggle(s_x, s_y, e_x, e_y)
+        Add the edge if it is missing, remove it otherwise
+    clear()
+        Remove every edge
+    """
+    __slots__ = ("size", "keys")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.keys = set()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[tuple[tuple[int, int], tuple[int, int]]]:
+        """Iterate the edges as ((s_x, s_y), (e_x, e_y)), top/left end first"""
+        return map(self.ends, self.keys)
+
+    def __contains__(self, edge) -> bool:
+        (s_x, s_y), (e_x, e_y) = edge
+        return self.has(s_x, s_y, e_x, e_y)
+
+    def key(self, s_x: int, s_y: int, e_x: int, e_y: int) -> int:
+        """Get the key of the edge between two cells
+
+        Args:
+            s_x (int): start node x position
+            s_y (int): start node y position
+            e_x (int): end node x position
+            e_y (int): end node y position
+
+        Raises:
+            ValueError: if the cells are not adjacent cells of the board
+
+        Returns:
+            int: the key of the edge
+        """
+        if (abs(s_x - e_x) + abs(s_y - e_y) != 1
+                or not 0 <= min(s_x, e_x) <= max(s_x, e_x) < self.size
+                or not 0 <= min(s_y, e_y) <= max(s_y, e_y) < self.size):
+            raise ValueError(f"({s_x}, {s_y}) and ({e_x}, {e_y}) are not adjacent")
+        cell = min(s_x, e_x) * self.size + min(s_y, e_y)
+        return cell * 2 + (RIGHT if s_x == e_x else DOWN)
+
+    def ends(self, key: int) -> tuple[tuple[int, int], tuple[int, int]]:
+        """Get the cells of an edge key
+
+        Args:
+            key (int): the key of the edge
+
+        Returns:
+            tuple[tuple[int, int], tuple[int, int]]: the top/left cell and
+            the other one
+        """
+        x, y = divmod(key >> 1, self.size)
+        if key & 1 == RIGHT:
+            return (x, y), (x, y + 1)
+        return (x, y), (x + 1, y)
+
+    def has(self, s_x: int, s_y: int, e_x: int, e_y: int) -> bool:
+        """Check if there is an edge between two cells
+
+        Returns:
+            bool: True if the edge is in the set
+        """
+        return self.key(s_x, s_y, e_x, e_y) in self.keys
+
+    def add(self, s_x: int, s_y: int, e_x: int, e_y: int) -> bool:
+        """Add the edge between two cells
+
+        Returns:
+            bool: True if the edge was added, False if it was already there
+        """
+        key = self.key(s_x, s_y, e_x, e_y)
+        if key in self.keys:
+            return False
+        self.keys.add(key)
+        return True
+
+    def remove(self, s_x: int, s_y: int, e_x: int, e_y: int) -> bool:
+        """Remove the edge between two cells
+
+        Returns:
+            bool: True if the edge was removed, False if it was not there
+        """
+        key = self.key(s_x, s_y, e_x, e_y)
+        if key not in self.keys:
+            return False
+        self.keys.remove(key)
+        return True
+
+    def toggle(self, s_x: int, s_y: int, e_x: int, e_y: int) -> bool:
+        """Add the edge if it is missing, remove it otherwise
+
+        Returns:
+            bool: True if the edge is in the set after the toggle
+        """
+        key = self.key(s_x, s_y, e_x, e_y)
+        if key in self.keys:
+            self.keys.remove(key)
+            return False
+        self.keys.add(key)
+        return True
+
+    def clear(self) -> None:
+        """Remove every edge"""
+        self.keys.clear()
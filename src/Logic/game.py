@@ -1,20 +1,128 @@
+import zlib
+
+from Logic.board_cache import boards
+from Logic.conflicts import Conflicts
 from Logic.graph import Graph
+from Logic.journal import Journal
+import Util.trace as trace
 
 class Game_flow:
     def __init__(self, filename) -> None:
-        self.graph = Graph(filename)
+        # The parsed board is shared through the cache, only the edges of
+        # the graph are new
+        self.graph = Graph(boards.load(filename))
+
+        # History of the moves, for undo, redo and saved sessions
+        self.journal = Journal()
+
+        # Mistakes of the edges, checked again around every move
+        self.conflicts = Conflicts(self.graph)
+
+    @property
+    def edges(self):
+        """
+        The edges of the game, the graph keeps them and the GUI draws them
+        """
+        return self.graph.edges
     
     def make_move(self, s_x, s_y, e_x, e_y):
         """
-        Make a move in the game
+        Make a move in the game, only the clues next to the edge are
+        checked again
         """
-        self.graph.add_edge(s_x, s_y, e_x, e_y)
+        if self.graph.edges.has(s_x, s_y, e_x, e_y):
+            return
+        with trace.span("game.make_move"):
+            self.graph.add_edge(s_x, s_y, e_x, e_y)
+            if self.graph.edges.has(s_x, s_y, e_x, e_y):
+                self.conflicts.update(s_x, s_y, e_x, e_y)
+                self.record(s_x, s_y, e_x, e_y, True)
         
     def undo_move(self, s_x, s_y, e_x, e_y):
         """
-        Undo a move in the game
+        Undo a move in the game, only the clues next to the edge are
+        checked again
+        """
+        if not self.graph.edges.has(s_x, s_y, e_x, e_y):
+            return
+        with trace.span("game.undo_move"):
+            self.graph.remove_edge(s_x, s_y, e_x, e_y)
+            self.conflicts.update(s_x, s_y, e_x, e_y)
+            self.record(s_x, s_y, e_x, e_y, False)
+
+    def record(self, s_x, s_y, e_x, e_y, added):
+        """
+        Add a move to the journal
+        """
+        edges = self.graph.edges
+        self.journal.record(edges.key(s_x, s_y, e_x, e_y), added, edges.keys)
+
+    def apply(self, key, added):
+        """
+        Add or remove the edge of a key without recording it, and get its
+        cells
+        """
+        (s_x, s_y), (e_x, e_y) = self.graph.edges.ends(key)
+        if added:
+            self.graph.add_edge(s_x, s_y, e_x, e_y)
+        else:
+            self.graph.remove_edge(s_x, s_y, e_x, e_y)
+        self.conflicts.update(s_x, s_y, e_x, e_y)
+        return (s_x, s_y), (e_x, e_y)
+
+    def undo(self):
+        """
+        Undo the last move of the journal, get the cells of its edge or None
+        if there is nothing to undo
+        """
+        move = self.journal.undo()
+        if move is None:
+            return None
+        key, added = move
+        return self.apply(key, not added)
+
+    def redo(self):
+        """
+        Redo the last undone move of the journal, get the cells of its edge
+        or None if there is nothing to redo
+        """
+        move = self.journal.redo()
+        if move is None:
+            return None
+        return self.apply(*move)
+
+    def checksum(self):
+        """
+        Get the checksum of the board, a session can only be loaded on the
+        board it was saved from
+        """
+        board = self.graph.board
+        return zlib.crc32(board.size.to_bytes(4, "little") + board.cells)
+
+    def save_session(self, path):
+        """
+        Save the journal of the game to a file
         """
-        self.graph.remove_edge(s_x, s_y, e_x, e_y)
+        self.journal.save(path, self.checksum())
+
+    def load_session(self, path):
+        """
+        Load the journal of a file and rebuild the board from its nearest
+        snapshot and the moves after it
+
+        Raises:
+            JournalError: if the file is not a journal of this board
+        """
+        journal = Journal.load(path, self.checksum())
+        for key in list(self.graph.edges.keys):
+            self.apply(key, False)
+
+        snapshot, moves = journal.restore_point()
+        for key in snapshot:
+            self.apply(key, True)
+        for move in moves:
+            self.apply(move >> 1, move & 1)
+        self.journal = journal
     
     def check_solved(self):
         """
@@ -22,6 +130,12 @@ class Game_flow:
         """
         return self.graph.check_win()
     
+    def clue_counts(self):
+        """
+        Get the number of satisfied and violated clues
+        """
+        return self.graph.satisfied_clues, self.graph.violated_clues
+    
     def get_graph_size(self):
         """
         Get the size of the graph
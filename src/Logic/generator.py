@@ -0,0 +1,345 @@
+import random
+from typing import Optional
+
+from Logic.solver import SolverTimeout
+from Logic.uniqueness import UniquenessChecker
+
+# Colors of the clues
+WHITE = 1
+BLACK = 2
+
+# The 8 faces around a face, in order, to check that growing the region
+# keeps its border a single loop
+RING = ((-1, -1), (-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1))
+
+Edge = tuple[tuple[int, int], tuple[int, int]]
+
+
+def random_loop(size: int, rnd: random.Random, fill: float = 0.5,
+                wiggle: float = 0.5) -> list[Edge]:
+    """Build a random single closed loop, the border of a random region of
+    the (size - 1) x (size - 1) faces between the cells. The region grows one
+    face at a time and only while it stays simply connected, so its border is
+    always one loop
+
+    Args:
+        size (int): the size of the board
+        rnd (random.Random): the source of randomness
+        fill (float): the fraction of the faces to put in the region
+        wiggle (float): the chance to skip a face that touches the region on
+            more than one side, higher values give more turns
+
+    Returns:
+        list[Edge]: the edges of the loop
+    """
+    faces = size - 1
+    region = [(rnd.randrange(faces), rnd.randrange(faces))]
+    inside = set(region)
+    target = max(1, int(faces * faces * fill))
+    tries = 0
+    while len(region) < target and tries < faces * faces * 50:
+        tries += 1
+        f_x, f_y = rnd.choice(region)
+        d_x, d_y = rnd.choice(((1, 0), (-1, 0), (0, 1), (0, -1)))
+        face = (f_x + d_x, f_y + d_y)
+        if not (0 <= face[0] < faces and 0 <= face[1] < faces) or face in inside:
+            continue
+
+        # The faces of the region around the new one must be one run, that
+        # does not only touch it on a corner
+        ring = [(face[0] + r_x, face[1] + r_y) in inside for r_x, r_y in RING]
+        starts = [k for k in range(8) if ring[k] and not ring[k - 1]]
+        if len(starts) != 1:
+            continue
+        ends = [k for k in range(8) if ring[k] and not ring[(k + 1) % 8]]
+        if starts[0] == ends[0] and starts[0] % 2 == 0:
+            continue
+        if sum(ring[k] for k in (1, 3, 5, 7)) > 1 and rnd.random() < wiggle:
+            continue
+
+        region.append(face)
+        inside.add(face)
+
+    # The edges of the faces that are next to a face out of the region
+    edges = []
+    for i, j in region:
+        for (d_x, d_y), edge in (((-1, 0), ((i, j), (i, j + 1))),
+                                 ((1, 0), ((i + 1, j), (i + 1, j + 1))),
+                                 ((0, -1), ((i, j), (i + 1, j))),
+                                 ((0, 1), ((i, j + 1), (i + 1, j + 1)))):
+            if (i + d_x, j + d_y) not in inside:
+                edges.append(edge)
+    return edges
+
+
+def loop_neighbors(edges: list[Edge]) -> dict[tuple[int, int], list[tuple[int, int]]]:
+    """Get the two neighbors of every cell of a loop
+
+    Args:
+        edges (list[Edge]): the edges of the loop
+
+    Returns:
+        dict[tuple[int, int], list[tuple[int, int]]]: the neighbors by cell
+    """
+    neighbors = {}
+    for start, end in edges:
+        neighbors.setdefault(start, []).append(end)
+        neighbors.setdefault(end, []).append(start)
+    return neighbors
+
+
+def clue_color(neighbors: dict[tuple[int, int], list[tuple[int, int]]],
+               cell: tuple[int, int]) -> int:
+    """Get the clue that a loop satisfies on a cell
+
+    Args:
+        neighbors (dict): the neighbors of every cell of the loop
+        cell (tuple[int, int]): the cell
+
+    Returns:
+        int: 1 if a white clue is satisfied, 2 if a black clue is, 0 if none
+    """
+    if cell not in neighbors:
+        return 0
+
+    def straight(other):
+        a, b = neighbors[other]
+        return a[0] == b[0] or a[1] == b[1]
+
+    if straight(cell):
+        return WHITE if not all(straight(other) for other in neighbors[cell]) else 0
+    return BLACK if all(straight(other) for other in neighbors[cell]) else 0
+
+
+def loop_clues(edges: list[Edge]) -> dict[tuple[int, int], int]:
+    """Get every clue that a loop satisfies
+
+    Args:
+        edges (list[Edge]): the edges of the loop
+
+    Returns:
+        dict[tuple[int, int], int]: the color of the clue of every cell
+    """
+    neighbors = loop_neighbors(edges)
+    clues = {}
+    for cell in neighbors:
+        color = clue_color(neighbors, cell)
+        if color:
+            clues[cell] = color
+    return clues
+
+
+def board_text(size: int, clues: dict[tuple[int, int], int]) -> str:
+    """Write a board in the format of the game files, the size and then one
+    row,col,color line per clue counting from 1
+
+    Args:
+        size (int): the size of the board
+        clues (dict[tuple[int, int], int]): the color of every clue
+
+    Returns:
+        str: the text of the board file
+    """
+    lines = [str(size)]
+    lines.extend(f"{x + 1},{y + 1},{color}" for (x, y), color in sorted(clues.items()))
+    return "\n".join(lines) + "\n"
+
+
+class Generator:
+    """
+    Generator class to create boards with a unique solution
+
+    A random loop is the target. While the clues allow more than one loop,
+    a clue of the target that the other loop breaks is added, so every
+    clue rules out at least one wrong loop. Once the solution is unique the
+    clues are removed greedily, in random order, as long as the solver still
+    confirms that the solution is unique.
+
+    Attributes
+    ----------
+    size : int
+        The size of the board
+    timeout : float
+        The seconds that every solver call can take
+    loop : list
+        The edges of the solution of the last board
+    loops : int
+        The number of random loops tried
+    checks : int
+        The number of solver calls
+    checker : UniquenessChecker
+        The solution counter of the board being created
+    witnesses : list
+        The second solutions found for the board being created
+
+    Methods
+    -------
+    generate()
+        Create a board with a unique solution
+    count(clues, known)
+        Find up to two solutions of some clues, one of them known
+    place_clues(edges)
+        Add clues of a loop until the solution is unique
+    remove_clues(clues)
+        Remove the clues that are not needed for the solution to be unique
+    """
+    def __init__(self, size: int, seed: Optional[int] = None,
+                 timeout: float = 2.0, fill: float = 0.5, wiggle: float = 0.5,
+                 seed_clues: float = 0.5) -> None:
+        """
+        Args:
+            size (int): the size of the board
+            seed (Optional[int]): the seed of the randomness
+            timeout (float): the seconds that every solver call can take
+            fill (float): the fraction of the board inside the random loops
+            wiggle (float): how often the random loops turn, from 0 to 1
+            seed_clues (float): the fraction of the clues of the target loop
+                to start with
+        """
+        if size < 3:
+            raise ValueError("The board must be at least 3x3")
+        self.size = size
+        self.timeout = timeout
+        self.fill = fill
+        self.wiggle = wiggle
+        self.seed_clues = seed_clues
+        self.random = random.Random(seed)
+        self.loop = []
+        self.loops = 0
+        self.checks = 0
+        self.checker = None
+        self.witnesses = []
+
+    def generate(self) -> dict[tuple[int, int], int]:
+        """Create a board with a unique solution, the solution is kept in
+        loop
+
+        Returns:
+            dict[tuple[int, int], int]: the color of every clue
+        """
+        # One checker for the whole board, what it learns from a set of
+        # clues is kept for the next ones
+        self.checker = UniquenessChecker(self.size)
+        self.witnesses = []
+        while True:
+            self.loops += 1
+            edges = random_loop(self.size, self.random, self.fill, self.wiggle)
+            clues = self.place_clues(edges)
+            if clues is not None:
+                return self.remove_clues(clues)
+
+    def count(self, clues: dict[tuple[int, int], int],
+              known: list[Edge]) -> Optional[list[list[Edge]]]:
+        """Find up to two solutions of some clues. The second solutions
+        found before are tried first, while clues are only removed or fit
+        them they are still solutions and the solver is not needed
+
+        Args:
+            clues (dict[tuple[int, int], int]): the color of every clue
+            known (list[Edge]): a solution of the clues
+
+        Returns:
+            Optional[list[list[Edge]]]: the solutions, the known one first,
+            None if the solver ran out of time
+        """
+        known_edges = {frozenset(edge) for edge in known}
+        for neighbors, edge_set, edges in reversed(self.witnesses):
+            if edge_set != known_edges and all(clue_color(neighbors, cell) == color
+                                               for cell, color in clues.items()):
+                return [known, edges]
+
+        self.checks += 1
+        try:
+            solutions = self.checker.check(clues, known, self.timeout).witnesses
+        except SolverTimeout:
+            return None
+        if len(solutions) > 1:
+            other = solutions[1]
+            self.witnesses.append((loop_neighbors(other),
+                                   {frozenset(edge) for edge in other}, other))
+        return solutions
+
+    def place_clues(self, edges: list[Edge]) -> Optional[dict[tuple[int, int], int]]:
+        """Add clues of a loop until the solution is unique
+
+        Args:
+            edges (list[Edge]): the edges of the target loop
+
+        Returns:
+            Optional[dict[tuple[int, int], int]]: the clues, None if no clue
+            can tell the target from another solution
+        """
+        target = loop_neighbors(edges)
+        # Start from a part of the clues of the target, most of them are
+        # needed anyway and every one saves a round
+        clues = loop_clues(edges)
+        cells = sorted(clues)
+        self.random.shuffle(cells)
+        for cell in cells[int(len(cells) * self.seed_clues):]:
+            del clues[cell]
+        while True:
+            solutions = self.count(clues, edges)
+            if solutions is None:
+                # Too hard to decide, more clues make it easier
+                unused = [cell for cell in target if cell not in clues
+                          and clue_color(target, cell)]
+                if not unused:
+                    return None
+                cell = self.random.choice(unused)
+                clues[cell] = clue_color(target, cell)
+                continue
+
+            if len(solutions) == 1:
+                self.loop = solutions[0]
+                return clues
+
+            other = solutions[1]
+            cells = self.telling_cells(target, loop_neighbors(other))
+            if not cells:
+                # Every clue of the target fits the other loop too, aim for
+                # the other loop if one of its clues tells them apart
+                target, other_neighbors = loop_neighbors(other), target
+                edges = other
+                cells = self.telling_cells(target, other_neighbors)
+                if not cells:
+                    return None
+            cell = self.random.choice(cells)
+            clues[cell] = clue_color(target, cell)
+
+    def telling_cells(self, target: dict, other: dict) -> list[tuple[int, int]]:
+        """Get the cells with a clue of the target loop that the other loop
+        breaks
+
+        Args:
+            target (dict): the neighbors of every cell of the target loop
+            other (dict): the neighbors of every cell of the other loop
+
+        Returns:
+            list[tuple[int, int]]: the cells, sorted
+        """
+        cells = []
+        for cell in sorted(target):
+            color = clue_color(target, cell)
+            if color and clue_color(other, cell) != color:
+                cells.append(cell)
+        return cells
+
+    def remove_clues(self, clues: dict[tuple[int, int], int]) -> dict[tuple[int, int], int]:
+        """Remove the clues that are not needed for the solution to be
+        unique, trying them in random order
+
+        Args:
+            clues (dict[tuple[int, int], int]): the clues of a unique board
+
+        Returns:
+            dict[tuple[int, int], int]: the remaining clues
+        """
+        clues = dict(clues)
+        cells = sorted(clues)
+        self.random.shuffle(cells)
+        for cell in cells:
+            color = clues.pop(cell)
+            solutions = self.count(clues, self.loop)
+            if solutions is None or len(solutions) != 1:
+                clues[cell] = color
+        return clues
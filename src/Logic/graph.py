@@ -1,4 +1,8 @@
+from Logic.board import Board, load_board
+from Logic.edge_set import EdgeSet
 from Logic.node import Node
+from Logic.traversal import LoopReport, first_invalid_clue, walk, walk_loop
+import Util.trace as trace
 
 
 class Graph:
@@ -7,23 +11,57 @@ class Graph:
     
     Attributes
     ----------
+    board : Board
+        The parsed board the graph was built from
     adjacency_matrix : list
         The adjacency matrix of the graph
     size : int
         The size of the graph
     connected_nodes : list
         The list of connected nodes in the graph
+    clue_nodes : list
+        The list of white and black nodes in the graph
+    clue_index : dict
+        The white and black nodes that each edge can change
+    satisfied_clues : int
+        The number of white and black nodes that are valid
+    edges : EdgeSet
+        The edges of the graph, shared with the GUI
+    edge_count : int
+        The number of edges in the graph
+    used_nodes : int
+        The number of nodes with at least one connection
+    over_degree_nodes : int
+        The number of nodes with more than two connections
+    dead_end_nodes : int
+        The number of nodes with exactly one connection
+    components : int
+        The number of connected components formed by the edges
     
     Methods
     -------
-    create_adjacency_matrix(file_name)
-        Create an adjacency matrix from a file
-    create_circle_data(file_name)
-        Create circle data from a file
+    from_library(library, number)
+        Create a graph from a board of a library
+    build(adjacency_matrix)
+        Set up the graph state for an adjacency matrix
+    create_matrix(size, clues)
+        Create an adjacency matrix from the clues of a board
     add_edge(s_x, s_y, e_x, e_y)
         Add an edge between two nodes
     remove_edge(s_x, s_y, e_x, e_y)
         Remove an edge between two nodes
+    update_weight(node, delta)
+        Change the weight of a node and the loop counters
+    find(cell)
+        Find the representative cell of a component
+    union(edge, start_node, end_node)
+        Join the components of an edge, keeping it to roll it back
+    rebuild_components()
+        Rebuild the components from the edges of the graph
+    closed_cycle(s_x, s_y, e_x, e_y)
+        Check if the last edge added joined a component with itself
+    is_single_loop()
+        Check if the edges form exactly one closed loop
     get_connected_nodes()
         Get all connected nodes in the graph
     remove_all_connected_nodes()
@@ -31,9 +69,12 @@ class Graph:
     all_valid_connections()
         Check if all connections in the graph are valid
     check_win()
-        Check if the game is over, this is when the graph is cyclic
+        Check if the game is over, this is when the edges form a single
+        loop and every clue is valid
     dfs(current_node, visited, parent_node)
         Depth-first search from a node
+    traverse(start_node)
+        Walk the edges from a node and report if they form a single loop
     is_cyclic()
         Check if the graph is cyclic
     check_valid_black(node)
@@ -44,67 +85,86 @@ class Graph:
         Check the adjacent black nodes of a node
     check_adyacent_white(x, y)
         Check the adjacent white nodes of a node
-    print_connected_nodes()
-        Print all connected nodes in the graph
-    print_graph()
-        Print the graph
+    create_clue_index()
+        Create an index from each edge to the clues it can change
+    edge_key(s_x, s_y, e_x, e_y)
+        Get the key of an edge in the clue index
+    check_clue(node)
+        Check if a white or black node is valid
+    revalidate_clues(s_x, s_y, e_x, e_y)
+        Check again the clues that depend on an edge
     """
-    def __init__(self, file_name) -> None:
-        self.adjacency_matrix = self.create_adjacency_matrix(file_name)
-        self.size = len(self.adjacency_matrix)
-        self.connected_nodes = []
+    def __init__(self, board) -> None:
+        """
+        Args:
+            board (Board | str): the parsed board, or the path of a board
+                file to load
+        """
+        if not isinstance(board, Board):
+            board = load_board(board)
+        self.board = board
+        self.build(self.create_matrix(board.size, board.clues))
 
-    def create_adjacency_matrix(self, file_name: str) -> list[list[Node]]:
-        """Create an adjacency matrix from a file
+    @classmethod
+    def from_library(cls, library, number: int) -> "Graph":
+        """Create a graph from a board of a library, without parsing text
 
         Args:
-            file_name (str): The name of the file
+            library (Library): the open library
+            number (int): the number of the board, from 0
 
         Returns:
-            list[list[Node]]: The adjacency matrix
+            Graph: the graph of the board
         """
-        with open(file_name, 'r') as file:
-            # Read the first line to get the dimensions of the matrix
-            dimensions = int(file.readline().strip())
-
-            adjacency_matrix = [[None for _ in range(
-                dimensions)] for _ in range(dimensions)]
-
-            # Read the rest of the file to fill the matrix
-            for line in file:
-                row, col, color = map(int, line.strip().split(','))
-                # print(adjacency_matrix[row - 1][col - 1])
-                adjacency_matrix[row - 1][col -
-                                          1] = Node(color, row - 1, col - 1)
-                # print(adjacency_matrix[row - 1][col - 1])
+        return cls(Board(*library.board(number)))
 
-        # Fill the matrix with the spaces
-        for i in range(dimensions):
-            for j in range(dimensions):
-                if adjacency_matrix[i][j] is None:
-                    adjacency_matrix[i][j] = Node(None, i, j)
+    def build(self, adjacency_matrix: list[list[Node]]) -> None:
+        """Set up the graph state for an adjacency matrix
 
-        return adjacency_matrix
-
-    def create_circle_data(self, file_name: str) -> dict:
-        """Create circle data from a file
+        Args:
+            adjacency_matrix (list[list[Node]]): the nodes of the board
+        """
+        self.adjacency_matrix = adjacency_matrix
+        self.size = len(self.adjacency_matrix)
+        self.connected_nodes = []
+        self.clue_nodes = [node for row in self.adjacency_matrix
+                           for node in row if node.color in (1, 2)]
+
+        # Clues that each edge can change, and the clues that are satisfied,
+        # kept up to date by add_edge and remove_edge
+        self.clue_index = self.create_clue_index()
+        self.clue_state = {node: False for node in self.clue_nodes}
+        self.satisfied_clues = 0
+
+        # Loop state, kept up to date by add_edge and remove_edge
+        self.edges = EdgeSet(self.size)
+        self.edge_count = 0
+        self.used_nodes = 0
+        self.over_degree_nodes = 0
+        self.dead_end_nodes = 0
+
+        # Union-find over the cell ids (x * size + y) without path
+        # compression, so the last unions can be rolled back when the last
+        # edges are removed. Any other removal marks it dirty and it is
+        # rebuilt the next time it is needed
+        self.parent = list(range(self.size * self.size))
+        self.rank = bytearray(self.size * self.size)
+        self.unions = 0
+        self.union_history = []
+        self.components_dirty = False
+
+    def create_matrix(self, size: int, clues: dict[tuple[int, int], int]) -> list[list[Node]]:
+        """Create an adjacency matrix from the clues of a board
 
         Args:
-            file_name (str): The name of the file
+            size (int): The size of the board
+            clues (dict[tuple[int, int], int]): The color of every clue, by
+                (x, y) position counting from 0
 
         Returns:
-            dict: The circle data
+            list[list[Node]]: The adjacency matrix
         """
-        circle_data = {}
-        with open(file_name, 'r') as file:
-            # Skip the first line (dimensions)
-            next(file)
-
-            # Read the rest of the file to fill the dictionary
-            for line in file:
-                row, col, color = map(int, line.strip().split(','))
-                circle_data[(row, col)] = color
-        return circle_data
+        return [[Node(clues.get((i, j)), i, j) for j in range(size)] for i in range(size)]
 
     def add_edge(self, s_x: int, s_y: int, e_x: int, e_y: int) -> None:
         """Add an edge between two nodes
@@ -117,29 +177,24 @@ class Graph:
         """
         start_node = self.adjacency_matrix[s_x][s_y]
         end_node = self.adjacency_matrix[e_x][e_y]
-        print("adding")
-        print(start_node, end_node)
-
-        # add weight
-        end_node.weight += 1
-        start_node.weight += 1
+        if trace.enabled:
+            trace.event("graph.add_edge", start=[s_x, s_y], end=[e_x, e_y])
 
         # add node in the start node adjacent list
-        start_node.add_adjacent_node(end_node)
+        if not start_node.add_adjacent_node(end_node):
+            return
         end_node.add_adjacent_node(start_node)
+        self.edges.add(s_x, s_y, e_x, e_y)
+
+        # add weight
+        self.update_weight(end_node, 1)
+        self.update_weight(start_node, 1)
+        self.edge_count += 1
 
-        # print()
-        # print("Start node...")
-        # print(f"Adjacent nodes of {start_node}:")
-        # for node in start_node.adjacency_list:
-        #     print(node, end= " ")
-        # print()
+        if not self.components_dirty:
+            self.union((start_node, end_node), start_node, end_node)
 
-        # print("End node...")
-        # print(f"Adjacent nodes of {end_node}:")
-        # for node in end_node.adjacency_list:
-        #     print(node, end=" ")
-        # print()
+        self.revalidate_clues(s_x, s_y, e_x, e_y)
 
     def remove_edge(self, s_x: int, s_y: int, e_x: int, e_y: int) -> None:
         """Remove an edge between two nodes
@@ -152,23 +207,156 @@ class Graph:
         """
         start_node = self.adjacency_matrix[s_x][s_y]
         end_node = self.adjacency_matrix[e_x][e_y]
-        print("removing")
-        print(start_node, end_node)
+        if trace.enabled:
+            trace.event("graph.remove_edge", start=[s_x, s_y], end=[e_x, e_y])
+        if not start_node.has_adjacent_node(end_node):
+            return
+
         # decrease weight
-        end_node.weight -= 1
-        start_node.weight -= 1
+        self.update_weight(end_node, -1)
+        self.update_weight(start_node, -1)
+        self.edge_count -= 1
 
         # remove node from the start node adjacent list
         start_node.remove_adjacent_node(end_node)
         end_node.remove_adjacent_node(start_node)
+        self.edges.remove(s_x, s_y, e_x, e_y)
+
+        # roll back the union of the edge if it was the last one
+        history = self.union_history
+        if (not self.components_dirty and history
+                and history[-1][0] in ((start_node, end_node), (end_node, start_node))):
+            _, child, root, rank_grown = history.pop()
+            if child is not None:
+                self.parent[child] = child
+                if rank_grown:
+                    self.rank[root] -= 1
+                self.unions -= 1
+        else:
+            self.components_dirty = True
+            history.clear()
 
-    def get_connected_nodes(self):
-        """get all connected nodes in the graph
+        self.revalidate_clues(s_x, s_y, e_x, e_y)
+
+    def update_weight(self, node: Node, delta: int) -> None:
+        """Change the weight of a node and the loop counters
+
+        Args:
+            node (Node): the node to update
+            delta (int): 1 when an edge is added, -1 when it is removed
+        """
+        old_weight = node.weight
+        node.weight += delta
+
+        self.used_nodes += (node.weight > 0) - (old_weight > 0)
+        self.over_degree_nodes += (node.weight > 2) - (old_weight > 2)
+        self.dead_end_nodes += (node.weight == 1) - (old_weight == 1)
+
+    def find(self, cell: int) -> int:
+        """Find the representative cell of a component
+
+        Args:
+            cell (int): the cell id, x * size + y
+
+        Returns:
+            int: the cell id of the representative
+        """
+        parent = self.parent
+        while parent[cell] != cell:
+            cell = parent[cell]
+        return cell
+
+    def union(self, edge: tuple, start_node: Node, end_node: Node) -> None:
+        """Join the components of the nodes of an edge and keep it in the
+        history to roll it back
+
+        Args:
+            edge (tuple): the edge, to recognize it when it is removed
+            start_node (Node): the start node of the edge
+            end_node (Node): the end node of the edge
         """
+        start_root = self.find(start_node.x * self.size + start_node.y)
+        end_root = self.find(end_node.x * self.size + end_node.y)
+        if start_root == end_root:
+            self.union_history.append((edge, None, None, False))
+            return
+
+        if self.rank[start_root] < self.rank[end_root]:
+            start_root, end_root = end_root, start_root
+        rank_grown = self.rank[start_root] == self.rank[end_root]
+        self.parent[end_root] = start_root
+        if rank_grown:
+            self.rank[start_root] += 1
+        self.unions += 1
+        self.union_history.append((edge, end_root, start_root, rank_grown))
+
+    def rebuild_components(self) -> None:
+        """Rebuild the components from the edges of the graph
+        """
+        self.parent = list(range(self.size * self.size))
+        self.rank = bytearray(self.size * self.size)
+        self.unions = 0
+        self.union_history = []
+        self.components_dirty = False
+
         for row in self.adjacency_matrix:
             for node in row:
-                if node.list_size() > 0 and node not in self.connected_nodes:
-                    self.connected_nodes.append(node)
+                if node.right is not None:
+                    self.union((node, node.right), node, node.right)
+                if node.down is not None:
+                    self.union((node, node.down), node, node.down)
+
+    def closed_cycle(self, s_x: int, s_y: int, e_x: int, e_y: int):
+        """check if the last edge added joined a component with itself, from
+        the union of the edge, without walking the component
+
+        Args:
+            s_x (int): start node x position
+            s_y (int): start node y position
+            e_x (int): end node x position
+            e_y (int): end node y position
+
+        Returns:
+            Optional[bool]: True if the edge closed a cycle, False if it
+            joined two components, None if the components are not known
+            because they have to be rebuilt
+        """
+        start_node = self.adjacency_matrix[s_x][s_y]
+        end_node = self.adjacency_matrix[e_x][e_y]
+        history = self.union_history
+        if (self.components_dirty or not history
+                or history[-1][0] not in ((start_node, end_node), (end_node, start_node))):
+            return None
+        return history[-1][1] is None
+
+    @property
+    def components(self) -> int:
+        """The number of connected components formed by the edges
+
+        Returns:
+            int: the number of components with at least one edge
+        """
+        if self.components_dirty:
+            self.rebuild_components()
+        return self.used_nodes - self.unions
+
+    def is_single_loop(self) -> bool:
+        """check if the edges form exactly one closed loop, this is when
+        every used node has two connections and they are all connected
+
+        Returns:
+            bool: True if there is a single closed loop, False otherwise
+        """
+        if (self.edge_count == 0 or self.over_degree_nodes
+                or self.dead_end_nodes):
+            return False
+        return self.components == 1
+
+    def get_connected_nodes(self):
+        """get all connected nodes in the graph
+        """
+        self.connected_nodes = [node for row in self.adjacency_matrix
+                                for node in row if node.list_size() > 0]
 
     def remove_all_connected_nodes(self):
         """remove all connected nodes from the graph
@@ -189,22 +377,23 @@ class Graph:
 
     def check_win(self) -> bool:
         """
-        Check if the game is over, this is when the graph is cyclic
+        Check if the game is over, this is when the edges form a single loop
+        that goes through every clue and every clue is valid
         """
-        self.remove_all_connected_nodes()
-        self.get_connected_nodes()
-        self.print_connected_nodes()
-        return self.is_cyclic()
+        with trace.span("graph.check_win"):
+            return self.satisfied_clues == len(self.clue_nodes) and self.is_single_loop()
 
     class InvalidNodeException(Exception):
         pass
     
-    def dfs(self, current_node: Node, visited: list[Node], parent_node: Node) -> bool:
-        """do a depth-first search from a node to check if the graph is cyclic
+    def dfs(self, current_node: Node, visited: bytearray, parent_node: Node) -> bool:
+        """do a depth-first search from a node to check if the graph is
+        cyclic, it uses a stack instead of recursion so long loops can not
+        reach the recursion limit
 
         Args:
             current_node (Node): the current node
-            visited (Node): the list of visited nodes
+            visited (bytearray): the visited flag of every cell id (x * size + y)
             parent_node (Node): the parent node
 
         Raises:
@@ -213,59 +402,40 @@ class Graph:
         Returns:
             bool: True if a cycle is found, False otherwise
         """
-        print(f"Visiting node: {current_node}", current_node.color)
-        visited.append(current_node)
-    
-        # Validate the node based on its color
-        if current_node.color == 1:  # White
-            if not self.check_valid_white(current_node):
-                print("Node is white, checking validity...")
-                print("Node is not valid, raising InvalidNodeException")
-                raise Graph.InvalidNodeException
-            print("Node is valid")
-    
-        elif current_node.color == 2:  # Black
-            if not self.check_valid_black(current_node):
-                print("Node is black, checking validity...")
-                print("Node is not valid, raising InvalidNodeException")
-                raise Graph.InvalidNodeException
-            print("Node is valid")
-    
-        for adjacent_node in current_node.adjacency_list:
-            if adjacent_node not in visited:
-                # print(f"Node {adjacent_node} is not visited, visiting it...")
-                self.dfs(adjacent_node, visited, current_node)
-            elif adjacent_node != parent_node:
-                print("Found a cycle, returning True")
-                return True
-    
-        # print("Finished visiting all adjacent nodes, returning False")
-        return False
+        with trace.span("graph.dfs"):
+            order, has_cycle = walk(self, current_node, visited, parent_node)
+        if trace.enabled:
+            trace.count("graph.dfs_nodes", len(order))
+        if first_invalid_clue(self, order) is not None:
+            raise Graph.InvalidNodeException
+        return has_cycle
+
+    def traverse(self, start_node: Node = None) -> LoopReport:
+        """walk the edges from a node and report if they form a single loop
+
+        Args:
+            start_node (Node): the node to start from, the first connected
+                node if it is None
+
+        Returns:
+            LoopReport: if it is one loop, its length, the unvisited nodes
+            and the first invalid clue
+        """
+        with trace.span("graph.traverse"):
+            return walk_loop(self, start_node)
     
     def is_cyclic(self) -> bool:
-        """check if the graph is cyclic
+        """check if the graph is cyclic, this is when the edges form a single
+        loop and every clue on it is valid
 
         Returns:
             bool: True if the graph is cyclic, False otherwise
         """
         if not self.all_valid_connections():
             return False
-    
-        self.get_connected_nodes()
-        
-        if len(self.connected_nodes) == 0:
-            return False
-        
-        node = self.connected_nodes[0]
-        visited = []  # Clear the visited list for each new starting node
-
-        try:
-            if self.dfs(node, visited, None) is True:
-                print("Found a cycle, graph is cyclic")
-                return True
-        except Graph.InvalidNodeException:
-            print("Invalid node found, stopping DFS")
-            return False
+
+        report = self.traverse()
+        return report.is_loop and report.invalid_clue is None
 
     def check_valid_black(self, node: Node) -> bool:
         """check if the black node is valid or not
@@ -277,7 +447,7 @@ class Graph:
             bool: True if the node is valid, False otherwise
         """
         valid = False
-        if self.check_adyacent_black(node.x, node.y):
+        if node.weight == 2 and self.check_adyacent_black(node.x, node.y):
             valid = True
 
         return valid
@@ -292,13 +462,13 @@ class Graph:
             bool: True if the node is valid, False otherwise
         """
         valid = False
-        # print("fasfda", self.adjacency_matrix[x][y].weight)
-        if self.check_adyacent_white(node.x, node.y):
+        if node.weight == 2 and self.check_adyacent_white(node.x, node.y):
             valid = True
         return valid
 
-    def check_adyacent_black(self, x: int, y:int) -> bool:
-        """return in what positions are the two adyacent nodes that are connected to the node
+    def check_adyacent_black(self, x: int, y: int) -> bool:
+        """check that the loop turns on a black node and goes straight
+        through the next node on both sides
 
         Args:
             x (int): the x position of the node
@@ -307,46 +477,28 @@ class Graph:
         Returns:
             bool: True if the node is valid, False otherwise
         """
-        pos_adyacent = []
-        # print(x + 1, y + 1, self.size)
-
-        # check down
-        if (0 <= (x + 1) <= (self.size - 2)):
-            # print("check down")
-            if (self.adjacency_matrix[x + 1][y].valid_connections()
-                    and self.adjacency_matrix[x + 2][y].valid_connections()):
-                pos_adyacent.append(1)
-
-        # check left
-        if (3 <= (y + 1) <= self.size):
-            # print("check left")
-            if (self.adjacency_matrix[x][y - 1].valid_connections()
-                    and self.adjacency_matrix[x][y - 2].valid_connections()):
-                pos_adyacent.append(2)
-
-        # check right
-        if (0 <= (y + 1) <= (self.size - 2)):
-            # print("check right")
-            if (self.adjacency_matrix[x][y + 1].valid_connections()
-                and self.adjacency_matrix[x][y + 2].valid_connections()
-                    and not 2 in pos_adyacent):
-                pos_adyacent.append(3)
-
-        # check up
-        if (3 <= (x + 1) <= self.size):
-            # print("check up")
-            if (self.adjacency_matrix[x - 1][y].valid_connections()
-                and self.adjacency_matrix[x - 2][y].valid_connections()
-                    and not 1 in pos_adyacent):
-                pos_adyacent.append(4)
-
-        print(len(pos_adyacent))
-        if len(pos_adyacent) == 2:
-            return True
-        return False
+        node = self.adjacency_matrix[x][y]
 
-    def check_adyacent_white(self, x: int, y:int) -> bool:
-        """return in what positions are the two adyacent nodes that are connected to the node
+        # it must leave once horizontally and once vertically
+        if (node.left is None) == (node.right is None):
+            return False
+        if (node.up is None) == (node.down is None):
+            return False
+
+        # and keep going straight on the next node
+        if node.left is not None and node.left.left is None:
+            return False
+        if node.right is not None and node.right.right is None:
+            return False
+        if node.up is not None and node.up.up is None:
+            return False
+        if node.down is not None and node.down.down is None:
+            return False
+        return True
+
+    def check_adyacent_white(self, x: int, y: int) -> bool:
+        """check that the loop goes straight through a white node and turns
+        on at least one of the next nodes
 
         Args:
             x (int): the x position of the node
@@ -355,158 +507,86 @@ class Graph:
         Returns:
             bool: True if the node is valid, False otherwise
         """
-        in_column = False
-        in_row = False
-        first_row = False
-        last_row = False
-        first_col = False
-        last_col = False
-        # check an adyacent connection
-
-        # if is on the first row
-        # check left and right
-        if (x == 0):
-            # print("auida1")
-            if (self.adjacency_matrix[x][y - 1].valid_connections()
-                    and self.adjacency_matrix[x][y + 1].valid_connections()):
-                first_row = True
-
-        # if is on the last row
-        # check left and right
-        elif ((x + 1) == self.size):
-            # print("auida2")
-            if (self.adjacency_matrix[x][y - 1].valid_connections()
-                    and self.adjacency_matrix[x][y + 1].valid_connections()):
-                last_row = True
-
-        # if is on the first column
-        # check up and down
-        elif (y == 0):
-            # print("auida3")
-            if (self.adjacency_matrix[x - 1][y].valid_connections()
-                    and self.adjacency_matrix[x - 1][y].valid_connections()):
-                first_col = True
-
-        # if is on the last column
-        # check up and down
-        elif ((y + 1) == self.size):
-            # print("auida4")
-            if (self.adjacency_matrix[x - 1][y].valid_connections()
-                    and self.adjacency_matrix[x - 1][y].valid_connections()):
-                last_col = True
+        node = self.adjacency_matrix[x][y]
 
-        else:
+        # in row
+        if node.left is not None and node.right is not None:
+            if node.up is not None or node.down is not None:
+                return False
+            return node.left.left is None or node.right.right is None
 
-            #print(self.adjacency_matrix[x - 1][y].valid_connections(), self.adjacency_matrix[x + 1][y].valid_connections())
-            if ((self.adjacency_matrix[x - 1][y].valid_connections()
-                and self.adjacency_matrix[x - 1][y] in self.adjacency_matrix[x][y].adjacency_list)
-                and (self.adjacency_matrix[x + 1][y].valid_connections()
-                and self.adjacency_matrix[x + 1][y] in self.adjacency_matrix[x][y].adjacency_list)):
-                # print("in col")
-                in_column = True
-
-            elif ((self.adjacency_matrix[x][y - 1].valid_connections()
-                and self.adjacency_matrix[x][y - 1] in self.adjacency_matrix[x][y].adjacency_list) 
-                and (self.adjacency_matrix[x][y + 1].valid_connections()
-                and self.adjacency_matrix[x][y + 1] in self.adjacency_matrix[x][y].adjacency_list)):
-                # print("in row")
-                in_row = True
-            # print("validaciones")
-            # print(in_column, in_row)
-            if in_column == False and in_row == False:
-                # print("entre aqui2")
+        # in column
+        if node.up is not None and node.down is not None:
+            if node.left is not None or node.right is not None:
                 return False
-        # check turns
-
-        # if is on the first row
-        if first_row:
-            if ((self.adjacency_matrix[x + 1][y - 1].valid_connections()
-                and self.adjacency_matrix[x + 1][y - 1] in self.adjacency_matrix[x][y - 1].adjacency_list)
-                or (self.adjacency_matrix[x + 1][y + 1].valid_connections()
-                and self.adjacency_matrix[x + 1][y + 1] in self.adjacency_matrix[x][y + 1].adjacency_list)):                    
-                return True
-        # if is on the last row
-        elif last_row:
-            if ((self.adjacency_matrix[x - 1][y - 1].valid_connections()
-                and self.adjacency_matrix[x - 1][y - 1] in self.adjacency_matrix[x][y - 1].adjacency_list)
-                or (self.adjacency_matrix[x - 1][y + 1].valid_connections()
-                and self.adjacency_matrix[x - 1][y + 1] in self.adjacency_matrix[x][y + 1].adjacency_list)):
-                return True
-        # if is on the first column
-        elif first_col:
-            if ((self.adjacency_matrix[x - 1][y + 1].valid_connections()
-                and self.adjacency_matrix[x - 1][y + 1] in self.adjacency_matrix[x - 1][y].adjacency_list)
-                or (self.adjacency_matrix[x + 1][y + 1].valid_connections()
-                and self.adjacency_matrix[x + 1][y + 1] in self.adjacency_matrix[x + 1][y].adjacency_list)):
-                return True
-        # if is on the last column
-        elif last_col:
-            if ((self.adjacency_matrix[x - 1][y - 1].valid_connections()
-                and self.adjacency_matrix[x - 1][y - 1] in self.adjacency_matrix[x - 1][y].adjacency_list)
-                or (self.adjacency_matrix[x + 1][y - 1].valid_connections()
-                and self.adjacency_matrix[x + 1][y - 1] in self.adjacency_matrix[x + 1][y].adjacency_list)):
-                return True
-
-        # check turn
-        elif in_column:
-            # check connection turn to a column or row
-            # check left
-            # print(
-            #     (self.adjacency_matrix[x - 1][y + 1],
-            #     self.adjacency_matrix[x - 1][y + 1] in self.adjacency_matrix[x][y].adjacency_list))
-            
-            # x - 1 
-            if self.adjacency_matrix[x - 1][y - 1] in self.adjacency_matrix[x - 1][y].adjacency_list:
-                return True
-            elif self.adjacency_matrix[x - 1][y + 1] in self.adjacency_matrix[x - 1][y].adjacency_list:
-                return True
-            
-            # x + 1
-            elif self.adjacency_matrix[x + 1][y - 1] in self.adjacency_matrix[x + 1][y].adjacency_list:
-                return True
-            elif self.adjacency_matrix[x + 1][y + 1] in self.adjacency_matrix[x + 1][y].adjacency_list:
-                return True
-            
-            # if ((self.adjacency_matrix[x - 1][y - 1].valid_connections()
-            #     and self.adjacency_matrix[x - 1][y - 1] in self.adjacency_matrix[x][y].adjacency_list)
-            #     or (self.adjacency_matrix[x + 1][y - 1].valid_connections()
-            #     and self.adjacency_matrix[x + 1][y - 1] in self.adjacency_matrix[x][y].adjacency_list)
-            #     or (self.adjacency_matrix[x - 1][y + 1].valid_connections()
-            #     and self.adjacency_matrix[x - 1][y + 1] in self.adjacency_matrix[x][y].adjacency_list)
-            #     or (self.adjacency_matrix[x + 1][y + 1].valid_connections()
-            #     and self.adjacency_matrix[x + 1][y + 1] in self.adjacency_matrix[x][y].adjacency_list)):
-            #     # print("entre aqui3")
-            #     return True
-            
-        elif in_row:
-            # y - 1
-            if self.adjacency_matrix[x - 1][y - 1] in self.adjacency_matrix[x][y - 1].adjacency_list:
-                return True
-            elif self.adjacency_matrix[x + 1][y - 1] in self.adjacency_matrix[x][y - 1].adjacency_list:
-                return True
-            # y + 1
-            elif self.adjacency_matrix[x - 1][y + 1] in self.adjacency_matrix[x][y + 1].adjacency_list:
-                return True
-            elif self.adjacency_matrix[x + 1][y + 1] in self.adjacency_matrix[x][y + 1].adjacency_list:
-                return True
+            return node.up.up is None or node.down.down is None
 
         return False
 
-    def print_connected_nodes(self):
-        print("----SEE CONNECTED NODES----")
-        for node in self.connected_nodes:
-            print(f"Adjacent nodes of {node}:", end=" ")
-            for adjacent in node.adjacency_list:
-                print(adjacent, end=" ")
-            print()
-        print()
-
-    def print_graph(self):
-        print("----SEE GRAPH----")
-        for row in self.adjacency_matrix:
-            for cell in row:
-                print(f"Adjacent nodes of {cell}:", end=" ")
-                for node in cell.adjacency_list:
-                    print(node, end=" ")
-                print()
-            print()
+    def create_clue_index(self) -> dict[tuple[int, int], list[Node]]:
+        """create an index from each edge slot to the clues it can change,
+        from the cell ids of Board.clue_edges, which the board computes
+        once for every graph built from it
+
+        Returns:
+            dict[tuple[int, int], list[Node]]: the clue nodes of every edge,
+            the edge key is the pair of cell ids (x * size + y) in order
+        """
+        size = self.size
+        matrix = self.adjacency_matrix
+        return {key: [matrix[cell // size][cell % size] for cell in cells]
+                for key, cells in self.board.clue_edges().items()}
+
+    def edge_key(self, s_x: int, s_y: int, e_x: int, e_y: int) -> tuple[int, int]:
+        """get the key of the edge between two nodes in the clue index
+
+        Args:
+            s_x (int): start node x position
+            s_y (int): start node y position
+            e_x (int): end node x position
+            e_y (int): end node y position
+
+        Returns:
+            tuple[int, int]: the cell ids of both nodes, smallest first
+        """
+        start = s_x * self.size + s_y
+        end = e_x * self.size + e_y
+        return (start, end) if start < end else (end, start)
+
+    def check_clue(self, node: Node) -> bool:
+        """check if a white or black node is valid
+
+        Args:
+            node (Node): the clue node to check
+
+        Returns:
+            bool: True if the node is valid, False otherwise
+        """
+        if node.color == 1:
+            return self.check_valid_white(node)
+        return self.check_valid_black(node)
+
+    def revalidate_clues(self, s_x: int, s_y: int, e_x: int, e_y: int) -> None:
+        """check again the clues that depend on an edge that has changed and
+        update the satisfied clues count
+
+        Args:
+            s_x (int): start node x position
+            s_y (int): start node y position
+            e_x (int): end node x position
+            e_y (int): end node y position
+        """
+        for node in self.clue_index.get(self.edge_key(s_x, s_y, e_x, e_y), ()):
+            valid = self.check_clue(node)
+            if valid != self.clue_state[node]:
+                self.clue_state[node] = valid
+                self.satisfied_clues += 1 if valid else -1
+
+    @property
+    def violated_clues(self) -> int:
+        """The number of clues that are not satisfied
+
+        Returns:
+            int: the number of white and black nodes that are not valid
+        """
+        return len(self.clue_nodes) - self.satisfied_clues
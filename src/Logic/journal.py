@@ -0,0 +1,193 @@
+import struct
+from array import array
+from bisect import bisect_right
+from typing import Iterable, Optional
+
+# Header: magic, version, reserved, board checksum, moves, position and
+# number of snapshots
+HEADER = struct.Struct("<8sHHIIII")
+MAGIC = b"MASYUJNL"
+VERSION = 1
+
+# Snapshot entry: the journal position and the number of edges
+SNAPSHOT = struct.Struct("<II")
+
+# A board snapshot is taken every SNAPSHOT_INTERVAL moves
+SNAPSHOT_INTERVAL = 256
+
+# A move is the key of its edge (Logic.edge_set.EdgeSet) * 2 + operation
+REMOVE = 0
+ADD = 1
+
+
+class JournalError(Exception):
+    pass
+
+
+class Journal:
+    """
+    Journal class with the append-only history of the moves of a game
+
+    Every move is one 32-bit record, the key of its edge and if it was added
+    or removed. Undo and redo only move the position in the records, and a
+    new move after an undo drops the moves that could be redone. Every
+    SNAPSHOT_INTERVAL moves the edges of the board are kept, so a session is
+    restored from the nearest snapshot and only the moves after it.
+
+    Attributes
+    ----------
+    records : array
+        The moves, key * 2 + operation
+    position : int
+        The number of moves applied, the moves after it can be redone
+    snapshots : dict
+        The edge keys of the board after every snapshot position
+    positions : list
+        The snapshot positions in order
+
+    Methods
+    -------
+    record(key, added, edges)
+        Add a move at the position
+    undo()
+        Step back one move
+    redo()
+        Step forward one move
+    restore_point()
+        Get the snapshot and the moves that rebuild the board at the position
+    save(path, checksum)
+        Write the journal to a file
+    load(path, checksum)
+        Read a journal from a file
+    """
+    def __init__(self) -> None:
+        self.records = array("I")
+        self.position = 0
+        self.snapshots = {0: array("I")}
+        self.positions = [0]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def can_undo(self) -> bool:
+        return self.position > 0
+
+    def can_redo(self) -> bool:
+        return self.position < len(self.records)
+
+    def record(self, key: int, added: bool, edges: Iterable[int]) -> None:
+        """Add a move at the position, dropping the moves that could be redone
+
+        Args:
+            key (int): the key of the edge
+            added (bool): True if the edge was added, False if removed
+            edges (Iterable[int]): the edge keys of the board after the move,
+                only read when a snapshot is taken
+        """
+        if self.position < len(self.records):
+            del self.records[self.position:]
+            while self.positions[-1] > self.position:
+                del self.snapshots[self.positions.pop()]
+
+        self.records.append(key * 2 + (ADD if added else REMOVE))
+        self.position += 1
+        if self.position % SNAPSHOT_INTERVAL == 0:
+            self.snapshots[self.position] = array("I", sorted(edges))
+            self.positions.append(self.position)
+
+    def undo(self) -> Optional[tuple[int, bool]]:
+        """Step back one move
+
+        Returns:
+            Optional[tuple[int, bool]]: the key of the edge and True if the
+            move added it, None if there is nothing to undo
+        """
+        if self.position == 0:
+            return None
+        self.position -= 1
+        move = self.records[self.position]
+        return move >> 1, move & 1 == ADD
+
+    def redo(self) -> Optional[tuple[int, bool]]:
+        """Step forward one move
+
+        Returns:
+            Optional[tuple[int, bool]]: the key of the edge and True if the
+            move adds it, None if there is nothing to redo
+        """
+        if self.position == len(self.records):
+            return None
+        move = self.records[self.position]
+        self.position += 1
+        return move >> 1, move & 1 == ADD
+
+    def restore_point(self) -> tuple[array, array]:
+        """Get what rebuilds the board at the position
+
+        Returns:
+            tuple[array, array]: the edge keys of the nearest snapshot before
+            the position, and the moves after it up to the position
+        """
+        start = self.positions[bisect_right(self.positions, self.position) - 1]
+        return self.snapshots[start], self.records[start:self.position]
+
+    def save(self, path: str, checksum: int) -> None:
+        """Write the journal to a file: the header, the snapshot index, the
+        snapshot edges and the moves
+
+        Args:
+            path (str): the path of the file
+            checksum (int): the checksum of the board of the game
+        """
+        positions = self.positions[1:]
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, 0, checksum, len(self.records),
+                                   self.position, len(positions)))
+            for position in positions:
+                file.write(SNAPSHOT.pack(position, len(self.snapshots[position])))
+            for position in positions:
+                file.write(self.snapshots[position].tobytes())
+            file.write(self.records.tobytes())
+
+    @classmethod
+    def load(cls, path: str, checksum: int) -> "Journal":
+        """Read a journal from a file
+
+        Args:
+            path (str): the path of the file
+            checksum (int): the checksum of the board of the game
+
+        Raises:
+            JournalError: if the file is not a journal of the board
+
+        Returns:
+            Journal: the journal
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        if len(data) < HEADER.size:
+            raise JournalError(f"{path} is not a game journal")
+        magic, version, _, board, moves, position, count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise JournalError(f"{path} is not a game journal")
+        if version != VERSION:
+            raise JournalError(f"{path} has version {version}, expected {VERSION}")
+        if board != checksum:
+            raise JournalError(f"{path} is the journal of another board")
+
+        journal = cls()
+        offset = HEADER.size + SNAPSHOT.size * count
+        itemsize = journal.records.itemsize
+        for number in range(count):
+            snapshot, edges = SNAPSHOT.unpack_from(data, HEADER.size + number * SNAPSHOT.size)
+            keys = array("I")
+            keys.frombytes(data[offset:offset + edges * itemsize])
+            offset += edges * itemsize
+            journal.snapshots[snapshot] = keys
+            journal.positions.append(snapshot)
+
+        journal.records.frombytes(data[offset:offset + moves * itemsize])
+        if len(journal.records) != moves or position > moves:
+            raise JournalError(f"{path} is truncated")
+        journal.position = position
+        return journal
@@ -0,0 +1,228 @@
+import mmap
+import os
+import struct
+from typing import Iterable
+
+from Logic.board import load_board
+
+# Header: magic, version, reserved, number of boards
+HEADER = struct.Struct("<8sHHI")
+MAGIC = b"MASYULIB"
+VERSION = 1
+
+# Index entry of every board: offset of its record, size and clue count
+ENTRY = struct.Struct("<QII")
+
+# Every cell takes 2 bits: 0 empty, 1 white, 2 black, four cells per byte
+CELLS_PER_BYTE = 4
+
+
+class LibraryError(Exception):
+    pass
+
+
+def record_length(size: int) -> int:
+    """Get the bytes of the packed grid of a board
+
+    Args:
+        size (int): the size of the board
+
+    Returns:
+        int: the length of the record
+    """
+    return (size * size + CELLS_PER_BYTE - 1) // CELLS_PER_BYTE
+
+
+def pack_board(size: int, clues: dict[tuple[int, int], int]) -> bytes:
+    """Pack the clues of a board into a grid of 2 bits per cell
+
+    Args:
+        size (int): the size of the board
+        clues (dict[tuple[int, int], int]): the color of every clue, by
+            (x, y) position counting from 0
+
+    Returns:
+        bytes: the record of the board
+    """
+    grid = bytearray(record_length(size))
+    for (x, y), color in clues.items():
+        cell = x * size + y
+        grid[cell >> 2] |= color << ((cell & 3) * 2)
+    return bytes(grid)
+
+
+def unpack_board(size: int, record: bytes) -> dict[tuple[int, int], int]:
+    """Unpack the clues of a board from its record
+
+    Args:
+        size (int): the size of the board
+        record (bytes): the packed grid
+
+    Returns:
+        dict[tuple[int, int], int]: the color of every clue
+    """
+    clues = {}
+    for index, byte in enumerate(record):
+        # Most bytes of a board are empty
+        if not byte:
+            continue
+        for shift in range(CELLS_PER_BYTE):
+            color = (byte >> (shift * 2)) & 3
+            if color:
+                clues[divmod(index * CELLS_PER_BYTE + shift, size)] = color
+    return clues
+
+
+def write_library(path: str, boards: Iterable[tuple[int, dict[tuple[int, int], int]]]) -> int:
+    """Write boards to a library file
+
+    Args:
+        path (str): the path of the library
+        boards (Iterable[tuple[int, dict]]): the size and clues of every
+            board
+
+    Returns:
+        int: the number of boards written
+    """
+    boards = list(boards)
+    offset = HEADER.size + ENTRY.size * len(boards)
+    index = []
+    records = []
+    for size, clues in boards:
+        record = pack_board(size, clues)
+        index.append(ENTRY.pack(offset, size, len(clues)))
+        records.append(record)
+        offset += len(record)
+
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, 0, len(boards)))
+        file.writelines(index)
+        file.writelines(records)
+    return len(boards)
+
+
+def read_text_board(file_name: str) -> tuple[int, dict[tuple[int, int], int]]:
+    """Read a board in the text format of the game
+
+    Args:
+        file_name (str): the path of the board
+
+    Raises:
+        BoardFormatError: if the board file is malformed
+
+    Returns:
+        tuple[int, dict]: the size and the clues, counting from 0
+    """
+    board = load_board(file_name)
+    return board.size, dict(board.clues)
+
+
+def convert_files(paths: list[str], output: str) -> int:
+    """Convert board files of the text format to a library, the boards keep
+    the order of the paths
+
+    Args:
+        paths (list[str]): the paths of the .txt boards
+        output (str): the path of the library
+
+    Returns:
+        int: the number of boards written
+    """
+    return write_library(output, (read_text_board(path) for path in paths))
+
+
+class Library:
+    """
+    Library class to read the boards of a library file, the file is memory
+    mapped and a board is one slice of it found through the index
+
+    Attributes
+    ----------
+    path : str
+        The path of the library
+    count : int
+        The number of boards
+
+    Methods
+    -------
+    entry(number)
+        Get the offset, size and clue count of a board
+    record(number)
+        Get the packed grid of a board
+    board(number)
+        Get the size and clues of a board
+    close()
+        Close the file
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.file = open(path, "rb")
+        if os.fstat(self.file.fileno()).st_size < HEADER.size:
+            self.file.close()
+            raise LibraryError(f"{path} is not a board library")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, self.count = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            self.close()
+            raise LibraryError(f"{path} is not a board library")
+        if version != VERSION:
+            self.close()
+            raise LibraryError(f"{path} has version {version}, expected {VERSION}")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __enter__(self) -> "Library":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def entry(self, number: int) -> tuple[int, int, int]:
+        """Get the index entry of a board
+
+        Args:
+            number (int): the number of the board, from 0
+
+        Raises:
+            IndexError: if there is no such board
+
+        Returns:
+            tuple[int, int, int]: the offset of the record, the size and the
+            number of clues
+        """
+        if not 0 <= number < self.count:
+            raise IndexError(f"board {number} out of range, the library has {self.count}")
+        return ENTRY.unpack_from(self.data, HEADER.size + number * ENTRY.size)
+
+    def record(self, number: int) -> bytes:
+        """Get the packed grid of a board
+
+        Args:
+            number (int): the number of the board, from 0
+
+        Returns:
+            bytes: the record
+        """
+        offset, size, _ = self.entry(number)
+        return self.data[offset:offset + record_length(size)]
+
+    def board(self, number: int) -> tuple[int, dict[tuple[int, int], int]]:
+        """Get the size and clues of a board
+
+        Args:
+            number (int): the number of the board, from 0
+
+        Returns:
+            tuple[int, dict]: the size and the clues, counting from 0
+        """
+        offset, size, _ = self.entry(number)
+        return size, unpack_board(size, self.data[offset:offset + record_length(size)])
+
+    def close(self) -> None:
+        """Close the file"""
+        if getattr(self, "data", None) is not None:
+            self.data.close()
+            self.data = None
+        self.file.close()
@@ -5,6 +5,9 @@ class Node:
     """
     Node class to represent a node in the graph
 
+    The node uses __slots__ and four fixed neighbor slots instead of an
+    adjacency list, a cell can only be connected to the cells around it
+
     Parameters
     ----------
     color : Optional[int]
@@ -14,14 +17,14 @@ class Node:
         None = empty
     value : int
         The weight of the node (default is 0), to know the connections of the node
-    left : False
-        If the node has a connection to the left
-    right : False
-        If the node has a connection to the right
-    up : False
-        If the node has a connection to the up
-    down : False
-        If the node has a connection to the down
+    left : Optional[Node]
+        The node connected to the left, None if there is no connection
+    right : Optional[Node]
+        The node connected to the right, None if there is no connection
+    up : Optional[Node]
+        The node connected to the up, None if there is no connection
+    down : Optional[Node]
+        The node connected to the down, None if there is no connection
 
     Methods
     -------
@@ -31,7 +34,13 @@ class Node:
         Add a node to the adjacency list
     remove_adjacent_node(node)
         Remove a node from the adjacency list
+    has_adjacent_node(node)
+        Check if a node is in the adjacency list
+    list_size()
+        Get the size of the adjacency list
     """
+    __slots__ = ("x", "y", "color", "weight", "up", "down", "left", "right")
+
     def __init__(self, color: Optional[int], x: int, y: int) -> None:
         """
         Args:
@@ -43,7 +52,41 @@ class Node:
         self.y = y
         self.color = color
         self.weight = 0
-        self.adjacency_list = []
+        self.up = None
+        self.down = None
+        self.left = None
+        self.right = None
+
+    @property
+    def adjacency_list(self) -> list:
+        """The connected nodes, in up, right, down, left order
+
+        Returns:
+            list[Node]: The connected nodes
+        """
+        return [node for node in (self.up, self.right, self.down, self.left)
+                if node is not None]
+
+    def slot_of(self, node) -> Optional[str]:
+        """Get the name of the slot that would hold a node
+
+        Args:
+            node (Node): The node to look for
+
+        Returns:
+            Optional[str]: The slot name, None if the node is not next to this one
+        """
+        if node.y == self.y:
+            if node.x == self.x - 1:
+                return "up"
+            if node.x == self.x + 1:
+                return "down"
+        elif node.x == self.x:
+            if node.y == self.y - 1:
+                return "left"
+            if node.y == self.y + 1:
+                return "right"
+        return None
 
     def valid_connections(self) -> bool:
         """Check if the node has more than two connections
@@ -64,11 +107,28 @@ class Node:
         Returns:
             bool: True if the node was added, False otherwise
         """
-        return self.adjacency_list.append(node)
+        slot = self.slot_of(node)
+        if slot is None or getattr(self, slot) is node:
+            return False
+        setattr(self, slot, node)
+        return True
     
     def remove_adjacent_node(self, node) -> None:
-        if node in self.adjacency_list:
-            self.adjacency_list.remove(node)
+        slot = self.slot_of(node)
+        if slot is not None and getattr(self, slot) is node:
+            setattr(self, slot, None)
+
+    def has_adjacent_node(self, node) -> bool:
+        """Check if a node is in the adjacency list
+
+        Args:
+            node (Node): The node to check
+
+        Returns:
+            bool: True if the node is connected to this one, False otherwise
+        """
+        slot = self.slot_of(node)
+        return slot is not None and getattr(self, slot) is node
             
     def list_size(self) -> int:
         """get the size of the adjacency list
@@ -76,7 +136,8 @@ class Node:
         Returns:
             int: The size of the adjacency list
         """
-        return len(self.adjacency_list)
+        return ((self.up is not None) + (self.right is not None)
+                + (self.down is not None) + (self.left is not None))
         
     def __str__(self) -> str:
-        return f"({self.x}, {self.y})"
\ No newline at end of file
+        return f"({self.x}, {self.y})"
@@ -0,0 +1,815 @@
+import heapq
+import time
+from itertools import combinations
+from typing import Callable, Optional, TextIO
+
+from Logic.solver import SolverTimeout
+
+# Colors of the clues
+WHITE = 1
+BLACK = 2
+
+# Conflicts of the first restart, scaled by the Luby sequence
+RESTART_CONFLICTS = 64
+
+
+def luby(i: int) -> int:
+    """Get the i-th element (from 0) of the Luby sequence 1 1 2 1 1 2 4 ...
+
+    Args:
+        i (int): the position in the sequence
+
+    Returns:
+        int: the element of the sequence
+    """
+    size, seq = 1, 0
+    while size < i + 1:
+        seq += 1
+        size = 2 * size + 1
+    while size - 1 != i:
+        size = (size - 1) >> 1
+        seq -= 1
+        i %= size
+    return 1 << seq
+
+
+class CNF:
+    """
+    CNF class with the clauses of a board, every edge of the board is a
+    variable that is true when the edge is on the loop
+
+    Attributes
+    ----------
+    size : int
+        The size of the board
+    clues : dict
+        The color of every clue, by (x, y) position
+    num_vars : int
+        The number of variables
+    clauses : list
+        The clauses, lists of DIMACS literals (v or -v)
+    edges : list
+        The cells of the edge of every variable, edges[v - 1]
+    cell_vars : list
+        The variables of the edges of every cell, indexed by cell id
+
+    Methods
+    -------
+    add_clause(literals)
+        Add a clause
+    encode()
+        Add the degree and clue clauses of the board
+    clue_clauses(x, y, color)
+        Get the clauses of a clue
+    boundary(cells)
+        Get the edges that leave a set of cells
+    subtour_clause(cells, loop)
+        Get the clause that forbids a loop that misses some clues
+    loops(model)
+        Split the edges of a model into its loops
+    loop_edges(loop)
+        Get the edges of a loop in loop order
+    write_dimacs(file)
+        Write the clauses in DIMACS format
+    """
+    def __init__(self, size: int, clues: dict[tuple[int, int], int]) -> None:
+        """
+        Args:
+            size (int): the size of the board
+            clues (dict[tuple[int, int], int]): the color of every clue
+                1: White
+                2: Black
+        """
+        self.size = size
+        self.clues = clues
+        self.clauses = []
+
+        self.edges = []
+        self.edge_var = {}
+        self.cell_vars = [[] for _ in range(size * size)]
+        for x in range(size):
+            for y in range(size):
+                if y + 1 < size:
+                    self.new_edge((x, y), (x, y + 1))
+                if x + 1 < size:
+                    self.new_edge((x, y), (x + 1, y))
+        self.num_vars = len(self.edges)
+        self.encode()
+
+    def new_edge(self, start: tuple[int, int], end: tuple[int, int]) -> None:
+        """Create the variable of an edge
+
+        Args:
+            start (tuple[int, int]): the top/left cell of the edge
+            end (tuple[int, int]): the bottom/right cell of the edge
+        """
+        self.edges.append((start, end))
+        var = len(self.edges)
+        self.edge_var[(start, end)] = var
+        self.cell_vars[start[0] * self.size + start[1]].append(var)
+        self.cell_vars[end[0] * self.size + end[1]].append(var)
+
+    def var(self, s_x: int, s_y: int, e_x: int, e_y: int) -> int:
+        """Get the variable of the edge between two cells
+
+        Args:
+            s_x (int): start node x position
+            s_y (int): start node y position
+            e_x (int): end node x position
+            e_y (int): end node y position
+
+        Returns:
+            int: the variable, 0 if the edge is out of the board
+        """
+        start, end = sorted(((s_x, s_y), (e_x, e_y)))
+        return self.edge_var.get((start, end), 0)
+
+    def add_clause(self, literals: list[int]) -> None:
+        """Add a clause
+
+        Args:
+            literals (list[int]): the DIMACS literals of the clause
+        """
+        self.clauses.append(literals)
+
+    def encode(self) -> None:
+        """Add the degree and clue clauses of the board"""
+        # Every cell has zero or two edges on the loop
+        for edges in self.cell_vars:
+            for var in edges:
+                self.add_clause([-var] + [other for other in edges if other != var])
+            for a, b, c in combinations(edges, 3):
+                self.add_clause([-a, -b, -c])
+
+        for (x, y), color in self.clues.items():
+            for clause in self.clue_clauses(x, y, color):
+                self.add_clause(clause)
+
+        # At least one edge if there are no clues to keep on the loop
+        if not self.clues:
+            self.add_clause(list(range(1, self.num_vars + 1)))
+
+    def clue_clauses(self, x: int, y: int, color: int) -> list[list[int]]:
+        """Get the clauses of a clue
+
+        Args:
+            x (int): the x position of the clue
+            y (int): the y position of the clue
+            color (int): the color of the clue, 1 white or 2 black
+
+        Returns:
+            list[list[int]]: the clauses
+        """
+        up = self.var(x, y, x - 1, y)
+        right = self.var(x, y, x, y + 1)
+        down = self.var(x, y, x + 1, y)
+        left = self.var(x, y, x, y - 1)
+        # Continuations of every arm on the next cell
+        up2 = self.var(x - 1, y, x - 2, y)
+        right2 = self.var(x, y + 1, x, y + 2)
+        down2 = self.var(x + 1, y, x + 2, y)
+        left2 = self.var(x, y - 1, x, y - 2)
+
+        # Every clue is on the loop
+        clauses = [[var for var in (up, right, down, left) if var]]
+
+        if color == BLACK:
+            # Turn, and go straight on the next cell of both arms
+            for a, b in ((up, down), (left, right)):
+                if a and b:
+                    clauses.append([-a, -b])
+            for arm, arm2 in ((up, up2), (right, right2),
+                              (down, down2), (left, left2)):
+                if arm:
+                    clauses.append([-arm, arm2] if arm2 else [-arm])
+        elif color == WHITE:
+            # Go straight, and turn on at least one of the next cells
+            for a in (up, down):
+                for b in (left, right):
+                    if a and b:
+                        clauses.append([-a, -b])
+            for arm, arm2, other2 in ((left, left2, right2), (up, up2, down2)):
+                if arm and arm2 and other2:
+                    clauses.append([-arm, -arm2, -other2])
+        return clauses
+
+    def boundary(self, cells: set[tuple[int, int]]) -> list[int]:
+        """Get the edges that leave a set of cells
+
+        Args:
+            cells (set[tuple[int, int]]): the cells
+
+        Returns:
+            list[int]: the variables of the edges with one cell in the set
+        """
+        return [var for var, (start, end) in enumerate(self.edges, 1)
+                if (start in cells) != (end in cells)]
+
+    def subtour_clause(self, cells: set[tuple[int, int]],
+                       loop: list[int]) -> list[int]:
+        """Get the clause that forbids a closed loop when there are other
+        loops. If the loop holds some of the clues, one edge that leaves it
+        must be on, if it holds none, one of its edges must be off
+
+        Args:
+            cells (set[tuple[int, int]]): the cells of the loop
+            loop (list[int]): the variables of the loop
+
+        Returns:
+            list[int]: the clause, empty if the loop holds all the clues and
+            can be the solution
+        """
+        inside = sum(cell in self.clues for cell in cells)
+        if inside == 0:
+            return [-var for var in loop]
+        if inside == len(self.clues):
+            return []
+        return self.boundary(cells)
+
+    def loops(self, model: list[bool]) -> list[list[int]]:
+        """Split the edges of a model into its loops
+
+        Args:
+            model (list[bool]): the value of every variable
+
+        Returns:
+            list[list[int]]: the variables of every loop, in loop order
+        """
+        edges = self.edges
+        cell_vars = self.cell_vars
+        size = self.size
+        done = set()
+        loops = []
+        for var in range(1, self.num_vars + 1):
+            if not model[var] or var in done:
+                continue
+            loop = []
+            cell = edges[var - 1][1]
+            current = var
+            while current not in done:
+                done.add(current)
+                loop.append(current)
+                start, end = edges[current - 1]
+                cell = end if start == cell else start
+                for other in cell_vars[cell[0] * size + cell[1]]:
+                    if other != current and model[other]:
+                        current = other
+                        break
+            loops.append(loop)
+        return loops
+
+    def loop_edges(self, loop: list[int]) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """Get the edges of a loop as ((s_x, s_y), (e_x, e_y)) pairs, each
+        one starting where the previous one ends
+
+        Args:
+            loop (list[int]): the variables of the loop, in loop order
+
+        Returns:
+            list[tuple[tuple[int, int], tuple[int, int]]]: the edges
+        """
+        edges = [self.edges[var - 1] for var in loop]
+        ordered = []
+        cell = edges[0][0] if edges[0][0] in edges[-1] else edges[0][1]
+        for start, end in edges:
+            other = end if start == cell else start
+            ordered.append((cell, other))
+            cell = other
+        return ordered
+
+    def write_dimacs(self, file: TextIO) -> None:
+        """Write the clauses in DIMACS format, with the edge of every
+        variable in the comments
+
+        Args:
+            file (TextIO): the file to write to
+        """
+        file.write(f"c masyu {self.size}x{self.size}\n")
+        for var, ((s_x, s_y), (e_x, e_y)) in enumerate(self.edges, 1):
+            file.write(f"c edge {var} {s_x} {s_y} {e_x} {e_y}\n")
+        file.write(f"p cnf {self.num_vars} {len(self.clauses)}\n")
+        for clause in self.clauses:
+            file.write(" ".join(map(str, clause)) + " 0\n")
+
+
+class CDCL:
+    """
+    CDCL class, a conflict-driven clause-learning SAT solver with two
+    watched literals, first-UIP learning, VSIDS branching, phase saving
+    and Luby restarts
+
+    A literal v or -v is stored as 2 * v or 2 * v + 1, so the negation of a
+    literal is lit ^ 1 and its variable lit >> 1.
+
+    Attributes
+    ----------
+    num_vars : int
+        The number of variables
+    model : list
+        The value of every variable after a satisfiable solve, model[v]
+    conflicts : int
+        The number of conflicts found
+    decisions : int
+        The number of decisions made
+    propagations : int
+        The number of literals set by unit propagation
+    learned : int
+        The number of clauses learned
+    restarts : int
+        The number of restarts
+
+    Methods
+    -------
+    new_var()
+        Add a variable, it can be called between solves
+    add_clause(literals)
+        Add a clause, it can be called between solves
+    simplify()
+        Forget the clauses that are satisfied at level 0
+    solve(assumptions)
+        Search for a model of the clauses
+    """
+    def __init__(self, num_vars: int, deadline: Optional[float] = None,
+                 progress: Optional[Callable[[int], None]] = None) -> None:
+        """
+        Args:
+            num_vars (int): the number of variables
+            deadline (Optional[float]): time.perf_counter() value after which
+                the search stops with SolverTimeout
+            progress (Optional[Callable[[int], None]]): called with the
+                number of decisions every few hundred conflicts
+        """
+        self.num_vars = num_vars
+        self.deadline = deadline
+        self.progress = progress
+        self.clauses = []
+        self.watches = [[] for _ in range(2 * num_vars + 2)]
+        # value[lit] is 1 if the literal is true, -1 if false, 0 if unknown
+        self.value = [0] * (2 * num_vars + 2)
+        self.level = [0] * (num_vars + 1)
+        self.reason = [-1] * (num_vars + 1)
+        self.trail = []
+        self.trail_lim = []
+        self.queue_head = 0
+        self.unsat = False
+
+        self.activity = [0.0] * (num_vars + 1)
+        self.var_inc = 1.0
+        self.phase = [1] * (num_vars + 1)
+        self.heap = [(0.0, var) for var in range(1, num_vars + 1)]
+
+        self.learned_clauses = []
+        self.max_learned = max(1000, num_vars)
+        # Number of clauses the last time they were simplified
+        self.simplified = 1000
+
+        self.model = []
+        self.conflicts = 0
+        self.decisions = 0
+        self.propagations = 0
+        self.learned = 0
+        self.restarts = 0
+
+    def new_var(self) -> int:
+        """Add a variable, it can be called between solves
+
+        Returns:
+            int: the new variable
+        """
+        self.num_vars += 1
+        self.watches.extend(([], []))
+        self.value.extend((0, 0))
+        self.level.append(0)
+        self.reason.append(-1)
+        self.activity.append(0.0)
+        self.phase.append(1)
+        heapq.heappush(self.heap, (0.0, self.num_vars))
+        return self.num_vars
+
+    def add_clause(self, literals: list[int]) -> bool:
+        """Add a clause, it can be called between solves
+
+        Args:
+            literals (list[int]): the DIMACS literals of the clause
+
+        Returns:
+            bool: False if the clauses became unsatisfiable
+        """
+        if self.unsat:
+            return False
+        self.backtrack(0)
+
+        value = self.value
+        clause = []
+        for literal in set(literals):
+            lit = 2 * literal if literal > 0 else -2 * literal + 1
+            if value[lit] == 1 or (lit ^ 1) in clause:
+                return True
+            if value[lit] == 0:
+                clause.append(lit)
+
+        if not clause:
+            self.unsat = True
+        elif len(clause) == 1:
+            self.assign(clause[0], -1)
+            self.unsat = self.propagate() >= 0
+        else:
+            self.attach(clause)
+        return not self.unsat
+
+    def attach(self, clause: list[int]) -> int:
+        """Store a clause and watch its first two literals
+
+        Args:
+            clause (list[int]): the literals of the clause
+
+        Returns:
+            int: the index of the clause
+        """
+        index = len(self.clauses)
+        self.clauses.append(clause)
+        self.watches[clause[0]].append(index)
+        self.watches[clause[1]].append(index)
+        return index
+
+    def assign(self, lit: int, reason: int) -> None:
+        """Make a literal true
+
+        Args:
+            lit (int): the literal
+            reason (int): the clause that forced it, -1 for a decision
+        """
+        var = lit >> 1
+        self.value[lit] = 1
+        self.value[lit ^ 1] = -1
+        self.level[var] = len(self.trail_lim)
+        self.reason[var] = reason
+        self.trail.append(lit)
+
+    def propagate(self) -> int:
+        """Propagate the literals of the trail through the watched clauses
+
+        Returns:
+            int: the index of a conflicting clause, -1 if there is none
+        """
+        value = self.value
+        clauses = self.clauses
+        watches = self.watches
+        trail = self.trail
+
+        while self.queue_head < len(trail):
+            false_lit = trail[self.queue_head] ^ 1
+            self.queue_head += 1
+            self.propagations += 1
+
+            watching = watches[false_lit]
+            kept = []
+            for position, index in enumerate(watching):
+                clause = clauses[index]
+                if clause is None:
+                    continue
+                # Keep the false literal on the second position
+                if clause[0] == false_lit:
+                    clause[0], clause[1] = clause[1], false_lit
+                first = clause[0]
+                if value[first] == 1:
+                    kept.append(index)
+                    continue
+
+                for k in range(2, len(clause)):
+                    if value[clause[k]] != -1:
+                        clause[1], clause[k] = clause[k], false_lit
+                        watches[clause[1]].append(index)
+                        break
+                else:
+                    kept.append(index)
+                    if value[first] == -1:
+                        kept.extend(watching[position + 1:])
+                        watches[false_lit] = kept
+                        return index
+                    self.assign(first, index)
+            watches[false_lit] = kept
+        return -1
+
+    def bump(self, var: int) -> None:
+        """Increase the activity of a variable that took part in a conflict
+
+        Args:
+            var (int): the variable
+        """
+        self.activity[var] += self.var_inc
+        if self.activity[var] > 1e100:
+            for other in range(1, self.num_vars + 1):
+                self.activity[other] *= 1e-100
+            self.var_inc *= 1e-100
+            self.rebuild_heap()
+        elif self.value[2 * var] == 0:
+            heapq.heappush(self.heap, (-self.activity[var], var))
+
+    def rebuild_heap(self) -> None:
+        """Rebuild the heap of free variables from their activities"""
+        self.heap = [(-self.activity[var], var) for var in range(1, self.num_vars + 1)
+                     if self.value[2 * var] == 0]
+        heapq.heapify(self.heap)
+
+    def analyze(self, conflict: int) -> tuple[list[int], int]:
+        """Learn a clause from a conflict, cutting at the first unique
+        implication point of the current level
+
+        Args:
+            conflict (int): the index of the conflicting clause
+
+        Returns:
+            tuple[list[int], int]: the learned clause, with the asserting
+            literal first, and the level to go back to
+        """
+        level = self.level
+        trail = self.trail
+        current = len(self.trail_lim)
+        seen = bytearray(self.num_vars + 1)
+        learned = [0]
+        pending = 0
+        lit = -1
+        position = len(trail) - 1
+
+        while True:
+            clause = self.clauses[conflict]
+            for other in (clause if lit < 0 else clause[1:]):
+                var = other >> 1
+                if not seen[var] and level[var] > 0:
+                    seen[var] = 1
+                    self.bump(var)
+                    if level[var] == current:
+                        pending += 1
+                    else:
+                        learned.append(other)
+
+            while not seen[trail[position] >> 1]:
+                position -= 1
+            lit = trail[position]
+            position -= 1
+            seen[lit >> 1] = 0
+            pending -= 1
+            if pending == 0:
+                break
+            conflict = self.reason[lit >> 1]
+
+        learned[0] = lit ^ 1
+        back_level = 0
+        if len(learned) > 1:
+            # The literal of the highest level is watched next to the first
+            best = max(range(1, len(learned)), key=lambda i: level[learned[i] >> 1])
+            learned[1], learned[best] = learned[best], learned[1]
+            back_level = level[learned[1] >> 1]
+        return learned, back_level
+
+    def backtrack(self, target: int) -> None:
+        """Undo the assignments above a level
+
+        Args:
+            target (int): the level to go back to
+        """
+        if len(self.trail_lim) <= target:
+            return
+        value = self.value
+        start = self.trail_lim[target]
+        for lit in self.trail[start:]:
+            var = lit >> 1
+            value[lit] = value[lit ^ 1] = 0
+            self.phase[var] = lit & 1
+            heapq.heappush(self.heap, (-self.activity[var], var))
+        del self.trail[start:]
+        del self.trail_lim[target:]
+        self.queue_head = len(self.trail)
+
+    def reduce_learned(self) -> None:
+        """Forget the longest half of the learned clauses that are not the
+        reason of an assignment"""
+        locked = {self.reason[lit >> 1] for lit in self.trail}
+        self.learned_clauses.sort(key=lambda index: len(self.clauses[index]))
+        keep = len(self.learned_clauses) // 2
+        kept = self.learned_clauses[:keep]
+        for index in self.learned_clauses[keep:]:
+            if index in locked:
+                kept.append(index)
+            else:
+                self.clauses[index] = None
+        self.learned_clauses = kept
+        self.max_learned += self.max_learned // 10
+
+    def simplify(self) -> None:
+        """Forget the clauses that are satisfied at level 0, like the
+        temporary clauses that were turned off with a unit clause"""
+        value = self.value
+        for index, clause in enumerate(self.clauses):
+            if clause is not None and any(value[lit] == 1 and self.level[lit >> 1] == 0
+                                          for lit in clause):
+                self.clauses[index] = None
+        self.learned_clauses = [index for index in self.learned_clauses
+                                if self.clauses[index] is not None]
+        self.simplified = len(self.clauses)
+
+    def decide(self) -> int:
+        """Get the free variable with the highest activity as a literal with
+        its saved phase
+
+        Returns:
+            int: the literal, -1 if all variables are set
+        """
+        value = self.value
+        heap = self.heap
+        while heap:
+            var = heapq.heappop(heap)[1]
+            if value[2 * var] == 0:
+                return 2 * var + self.phase[var]
+        return -1
+
+    def solve(self, assumptions: tuple[int, ...] = ()) -> bool:
+        """Search for a model of the clauses, the model is kept in model
+
+        Args:
+            assumptions (tuple[int, ...]): DIMACS literals that are taken as
+                true only for this solve, they are the first decisions
+
+        Raises:
+            SolverTimeout: if the deadline is reached
+
+        Returns:
+            bool: True if the clauses are satisfiable with the assumptions,
+            False otherwise
+        """
+        if self.unsat:
+            return False
+        self.backtrack(0)
+        if self.propagate() >= 0:
+            self.unsat = True
+            return False
+        # A satisfied clause settles on its true literal after one visit, so
+        # the scan is only worth it once the clauses have doubled
+        if len(self.clauses) > 2 * self.simplified:
+            self.simplify()
+        if len(self.heap) > 4 * self.num_vars:
+            self.rebuild_heap()
+        assumed = [2 * literal if literal > 0 else -2 * literal + 1
+                   for literal in assumptions]
+
+        restart = 0
+        budget = RESTART_CONFLICTS * luby(restart)
+        while True:
+            conflict = self.propagate()
+            if conflict >= 0:
+                self.conflicts += 1
+                budget -= 1
+                if not self.trail_lim:
+                    self.unsat = True
+                    return False
+                learned, back_level = self.analyze(conflict)
+                self.backtrack(back_level)
+                if len(learned) == 1:
+                    self.assign(learned[0], -1)
+                else:
+                    index = self.attach(learned)
+                    self.learned_clauses.append(index)
+                    self.assign(learned[0], index)
+                self.learned += 1
+                self.var_inc /= 0.95
+
+                if not self.conflicts & 31 and self.deadline is not None \
+                        and time.perf_counter() > self.deadline:
+                    raise SolverTimeout
+                if self.progress is not None and not self.conflicts & 255:
+                    self.progress(self.decisions)
+                continue
+
+            if budget <= 0:
+                self.restarts += 1
+                restart += 1
+                budget = RESTART_CONFLICTS * luby(restart)
+                self.backtrack(0)
+                if len(self.learned_clauses) > self.max_learned:
+                    self.reduce_learned()
+                continue
+
+            level = len(self.trail_lim)
+            if level < len(assumed):
+                lit = assumed[level]
+                if self.value[lit] == -1:
+                    return False
+                # An assumption that is already true still opens its level,
+                # so the level of every assumption is its position
+                self.trail_lim.append(len(self.trail))
+                if self.value[lit] == 0:
+                    self.assign(lit, -1)
+                continue
+
+            lit = self.decide()
+            if lit < 0:
+                self.model = [False] + [self.value[2 * var] == 1
+                                        for var in range(1, self.num_vars + 1)]
+                return True
+            self.decisions += 1
+            self.trail_lim.append(len(self.trail))
+            self.assign(lit, -1)
+
+
+class SatSolver:
+    """
+    SatSolver class to solve a board by compiling it to CNF and running the
+    CDCL solver. The loop must be connected, which CNF does not express
+    compactly, so every model with more than one loop adds a clause against
+    its smaller loops and the solver runs again
+
+    Attributes
+    ----------
+    cnf : CNF
+        The clauses of the board
+    engine : CDCL
+        The SAT solver
+    solutions : list
+        The solutions found, each one is a list of edges along the loop
+    subtours : int
+        The number of clauses added against disconnected loops
+    time : float
+        The seconds spent in solve
+
+    Methods
+    -------
+    solve()
+        Find one solution of the board
+    stats()
+        Get the size of the CNF and the work of the solver
+    """
+    def __init__(self, size: int, clues: dict[tuple[int, int], int],
+                 deadline: Optional[float] = None,
+                 progress: Optional[Callable[[int], None]] = None) -> None:
+        """
+        Args:
+            size (int): the size of the board
+            clues (dict[tuple[int, int], int]): the color of every clue
+                1: White
+                2: Black
+            deadline (Optional[float]): time.perf_counter() value after which
+                the search stops with SolverTimeout
+            progress (Optional[Callable[[int], None]]): called with the
+                number of decisions every few hundred conflicts
+        """
+        self.cnf = CNF(size, clues)
+        self.engine = CDCL(self.cnf.num_vars, deadline, progress)
+        for clause in self.cnf.clauses:
+            self.engine.add_clause(clause)
+        self.solutions = []
+        self.subtours = 0
+        self.time = 0.0
+
+    @property
+    def nodes(self) -> int:
+        """The number of decisions of the SAT solver, to compare with the
+        search nodes of Solver"""
+        return self.engine.decisions
+
+    def solve(self) -> bool:
+        """Find one solution of the board, it is kept in solutions
+
+        Raises:
+            SolverTimeout: if the deadline is reached
+
+        Returns:
+            bool: True if the board is solved, False otherwise
+        """
+        start = time.perf_counter()
+        try:
+            while self.engine.solve():
+                loops = self.cnf.loops(self.engine.model)
+                if len(loops) == 1:
+                    self.solutions.append(self.cnf.loop_edges(loops[0]))
+                    return True
+                # Without clues any of the loops is a solution, keep the first
+                for loop in loops[0 if self.cnf.clues else 1:]:
+                    cells = {cell for var in loop for cell in self.cnf.edges[var - 1]}
+                    clause = self.cnf.subtour_clause(cells, loop)
+                    if not clause:
+                        continue
+                    self.cnf.add_clause(clause)
+                    self.engine.add_clause(clause)
+                    self.subtours += 1
+            return False
+        finally:
+            self.time += time.perf_counter() - start
+
+    def stats(self) -> dict[str, float]:
+        """Get the size of the CNF and the work of the solver
+
+        Returns:
+            dict[str, float]: variables, clauses, conflicts, learned clauses,
+            decisions, restarts, subtour clauses and seconds
+        """
+        return {
+            "variables": self.cnf.num_vars,
+            "clauses": len(self.cnf.clauses),
+            "conflicts": self.engine.conflicts,
+            "learned": self.engine.learned,
+            "decisions": self.engine.decisions,
+            "restarts": self.engine.restarts,
+            "subtours": self.subtours,
+            "time": round(self.time, 4),
+        }
@@ -0,0 +1,839 @@
+import random
+import time
+from typing import Callable, Optional
+
+# States of an edge
+UNKNOWN = 0
+ON = 1
+OFF = 2
+
+# Directions, the opposite of a direction d is d ^ 2
+UP = 0
+RIGHT = 1
+DOWN = 2
+LEFT = 3
+OFFSETS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+# Colors of the clues
+WHITE = 1
+BLACK = 2
+
+# Search nodes of the first restart of solve, each restart allows half more
+RESTART_NODES = 100
+
+
+class SolverTimeout(Exception):
+    pass
+
+
+class Solver:
+    """
+    Solver class to solve a board with constraint propagation and
+    backtracking
+
+    Cells are identified by x * size + y and edges by their index in
+    edge_cells. Every change of the search state is recorded in a trail so a
+    branch is undone by popping it back to a mark.
+
+    Attributes
+    ----------
+    size : int
+        The size of the board
+    clues : dict
+        The color of every clue, by (x, y) position
+    state : bytearray
+        The state of every edge, UNKNOWN, ON or OFF
+    nodes : int
+        The number of search nodes explored
+    solutions : list
+        The solutions found, each one is a list of edges along the loop
+
+    Methods
+    -------
+    solve()
+        Find one solution of the board
+    count_solutions(limit)
+        Count the solutions of the board, stopping at a limit
+    set_edge(edge, value)
+        Set the state of an edge and update the cell counters and the chains
+    propagate()
+        Apply the deductions of the queued cells and grid lines until
+        nothing changes
+    probe()
+        Try both values of the unknown edges and keep the one left when the
+        other fails
+    is_connected()
+        Check that the chains and the clues can still be joined
+    choose_edge()
+        Choose the most constrained unknown edge to branch on
+    search(limit)
+        Backtrack over the unknown edges until the limit of solutions is found
+    is_solved()
+        Check if the edges that are ON are a valid solution
+    loop_edges()
+        Get the edges that are ON in the order of the loop
+    """
+    def __init__(self, size: int, clues: dict[tuple[int, int], int],
+                 deadline: Optional[float] = None,
+                 progress: Optional[Callable[[int], None]] = None) -> None:
+        """
+        Args:
+            size (int): the size of the board
+            clues (dict[tuple[int, int], int]): the color of every clue
+                1: White
+                2: Black
+            deadline (Optional[float]): time.perf_counter() value after which
+                the search stops with SolverTimeout
+            progress (Optional[Callable[[int], None]]): called with the
+                number of nodes explored every few hundred nodes
+        """
+        self.size = size
+        self.clues = clues
+        self.deadline = deadline
+        self.progress = progress
+        self.nodes = 0
+        self.solutions = []
+
+        n_cells = size * size
+        self.clue = bytearray(n_cells)
+        for (x, y), color in clues.items():
+            self.clue[x * size + y] = color
+
+        # cell_edge[cell * 4 + d] is the edge that leaves the cell in the
+        # direction d, and extension[cell * 4 + d] the edge that continues it
+        # on the next cell, -1 if they are out of the board
+        self.edge_cells = []
+        self.cell_edge = [-1] * (n_cells * 4)
+        for x in range(size):
+            for y in range(size):
+                cell = x * size + y
+                if y + 1 < size:
+                    self.cell_edge[cell * 4 + RIGHT] = len(self.edge_cells)
+                    self.cell_edge[(cell + 1) * 4 + LEFT] = len(self.edge_cells)
+                    self.edge_cells.append((cell, cell + 1))
+                if x + 1 < size:
+                    self.cell_edge[cell * 4 + DOWN] = len(self.edge_cells)
+                    self.cell_edge[(cell + size) * 4 + UP] = len(self.edge_cells)
+                    self.edge_cells.append((cell, cell + size))
+
+        # The loop crosses every grid line between two rows or two columns
+        # an even number of times, edge_line is the line an edge crosses
+        self.edge_line = [size - 1 + a % size if b == a + 1 else a // size
+                          for a, b in self.edge_cells]
+        self.line_edges = [[] for _ in range(2 * (size - 1))]
+        for edge, line in enumerate(self.edge_line):
+            self.line_edges[line].append(edge)
+
+        self.extension = [-1] * (n_cells * 4)
+        for cell in range(n_cells):
+            for d in range(4):
+                edge = self.cell_edge[cell * 4 + d]
+                if edge >= 0:
+                    next_cell = self.next_cell(cell, d)
+                    self.extension[cell * 4 + d] = self.cell_edge[next_cell * 4 + d]
+
+        # (edge, next cell) pairs of every cell, to walk the board
+        self.links = [tuple((self.cell_edge[cell * 4 + d], self.next_cell(cell, d))
+                            for d in range(4) if self.cell_edge[cell * 4 + d] >= 0)
+                      for cell in range(n_cells)]
+        self.clue_cells = [cell for cell in range(n_cells) if self.clue[cell]]
+
+        # Cells to check again when an edge changes: both ends, and the clues
+        # on them or next to them
+        watchers = [set(cells) for cells in self.edge_cells]
+        for cell in range(n_cells):
+            if not self.clue[cell]:
+                continue
+            around = [cell] + [self.next_cell(cell, d) for d in range(4)
+                               if self.cell_edge[cell * 4 + d] >= 0]
+            for other in around:
+                for d in range(4):
+                    edge = self.cell_edge[other * 4 + d]
+                    if edge >= 0:
+                        watchers[edge].add(cell)
+        self.watchers = [tuple(cells) for cells in watchers]
+
+        # Search state
+        self.state = bytearray(len(self.edge_cells))
+        self.on_count = bytearray(n_cells)
+        self.unknown_count = bytearray(n_cells)
+        for a, b in self.edge_cells:
+            self.unknown_count[a] += 1
+            self.unknown_count[b] += 1
+        # partner[cell] is the other end of the chain that ends on the cell,
+        # and chain_length[cell] its number of edges
+        self.partner = list(range(n_cells))
+        self.chain_length = [0] * n_cells
+        # ON edges, unknown edges, 1 once the loop is closed, and cells
+        # without clue that have ON edges
+        self.totals = [0, len(self.edge_cells), 0, 0]
+
+        self.line_on = [0] * len(self.line_edges)
+        self.line_unknown = [len(edges) for edges in self.line_edges]
+
+        self.trail = []
+        self.queue = []
+        self.queued = bytearray(n_cells)
+        self.line_queue = []
+
+        # Priority of every cell among the chain ends with the same number of
+        # options, shuffled on every restart of solve
+        self.tie = [0.0] * n_cells
+        self.random = random.Random(size)
+
+    def next_cell(self, cell: int, d: int) -> int:
+        """Get the cell next to a cell in a direction
+
+        Args:
+            cell (int): the cell id
+            d (int): the direction
+
+        Returns:
+            int: the id of the next cell
+        """
+        d_x, d_y = OFFSETS[d]
+        return cell + d_x * self.size + d_y
+
+    def undo(self, mark: int) -> None:
+        """Undo the changes of the trail back to a mark
+
+        Args:
+            mark (int): the length of the trail to go back to
+        """
+        trail = self.trail
+        while len(trail) > mark:
+            array, index, old = trail.pop()
+            array[index] = old
+
+    def enqueue(self, cell: int) -> None:
+        if not self.queued[cell]:
+            self.queued[cell] = 1
+            self.queue.append(cell)
+
+    def set_edge(self, edge: int, value: int) -> bool:
+        """Set the state of an edge and update the cell counters and the
+        chains
+
+        Args:
+            edge (int): the edge to set
+            value (int): ON or OFF
+
+        Returns:
+            bool: False if it is a contradiction, True otherwise
+        """
+        state = self.state
+        if state[edge] == value:
+            return True
+        if state[edge] != UNKNOWN:
+            return False
+
+        trail = self.trail
+        totals = self.totals
+        trail.append((state, edge, UNKNOWN))
+        state[edge] = value
+        trail.append((totals, 1, totals[1]))
+        totals[1] -= 1
+
+        line = self.edge_line[edge]
+        trail.append((self.line_unknown, line, self.line_unknown[line]))
+        self.line_unknown[line] -= 1
+        if value == ON:
+            trail.append((self.line_on, line, self.line_on[line]))
+            self.line_on[line] += 1
+        if self.line_unknown[line] <= 1:
+            self.line_queue.append(line)
+
+        a, b = self.edge_cells[edge]
+        unknown_count = self.unknown_count
+        trail.append((unknown_count, a, unknown_count[a]))
+        trail.append((unknown_count, b, unknown_count[b]))
+        unknown_count[a] -= 1
+        unknown_count[b] -= 1
+
+        for cell in self.watchers[edge]:
+            self.enqueue(cell)
+
+        if value == OFF:
+            return True
+
+        on_count = self.on_count
+        trail.append((on_count, a, on_count[a]))
+        trail.append((on_count, b, on_count[b]))
+        on_count[a] += 1
+        on_count[b] += 1
+        if on_count[a] > 2 or on_count[b] > 2:
+            return False
+        used = ((on_count[a] == 1 and not self.clue[a])
+                + (on_count[b] == 1 and not self.clue[b]))
+        if used:
+            trail.append((totals, 3, totals[3]))
+            totals[3] += used
+
+        partner = self.partner
+        chain_length = self.chain_length
+        end_a = partner[a]
+        end_b = partner[b]
+        trail.append((totals, 0, totals[0]))
+        totals[0] += 1
+
+        if end_a == b:
+            # The edge closes a loop, it must hold every ON edge
+            if chain_length[a] + 1 != totals[0]:
+                return False
+            trail.append((totals, 2, totals[2]))
+            totals[2] = 1
+            return True
+
+        length = chain_length[end_a] + chain_length[end_b] + 1
+        trail.append((partner, end_a, partner[end_a]))
+        trail.append((partner, end_b, partner[end_b]))
+        trail.append((chain_length, end_a, chain_length[end_a]))
+        trail.append((chain_length, end_b, chain_length[end_b]))
+        partner[end_a] = end_b
+        partner[end_b] = end_a
+        chain_length[end_a] = length
+        chain_length[end_b] = length
+
+        # Closing the chain now would leave the other ON edges out of it
+        if length < totals[0]:
+            closing = self.edge_between(end_a, end_b)
+            if closing >= 0 and closing != edge and not self.set_edge(closing, OFF):
+                return False
+        return True
+
+    def edge_between(self, a: int, b: int) -> int:
+        """Get the edge between two cells
+
+        Args:
+            a (int): the first cell id
+            b (int): the second cell id
+
+        Returns:
+            int: the edge, -1 if the cells are not next to each other
+        """
+        for d in range(4):
+            edge = self.cell_edge[a * 4 + d]
+            if edge >= 0 and b in self.edge_cells[edge]:
+                return edge
+        return -1
+
+    def propagate(self) -> bool:
+        """Apply the deductions of the queued cells until nothing changes
+
+        Returns:
+            bool: False if a contradiction is found, True otherwise
+        """
+        queue = self.queue
+        queued = self.queued
+        state = self.state
+        cell_edge = self.cell_edge
+        totals = self.totals
+
+        line_queue = self.line_queue
+
+        while True:
+            while queue:
+                cell = queue.pop()
+                queued[cell] = 0
+                if not self.deduce(cell, state, cell_edge):
+                    return self.clear_queues()
+
+            # Parity of the grid lines
+            while line_queue and not queue:
+                line = line_queue.pop()
+                unknown = self.line_unknown[line]
+                if unknown == 0:
+                    if self.line_on[line] & 1:
+                        return self.clear_queues()
+                elif unknown == 1:
+                    value = ON if self.line_on[line] & 1 else OFF
+                    for edge in self.line_edges[line]:
+                        if state[edge] == UNKNOWN:
+                            if not self.set_edge(edge, value):
+                                return self.clear_queues()
+                            break
+            if queue:
+                continue
+
+            # Once the loop is closed every other edge is OFF
+            if totals[2] and totals[1]:
+                for edge in range(len(state)):
+                    if state[edge] == UNKNOWN and not self.set_edge(edge, OFF):
+                        return False
+                continue
+            return True
+
+    def clear_queues(self) -> bool:
+        """Empty the queues after a contradiction
+
+        Returns:
+            bool: always False, to return it from propagate
+        """
+        for cell in self.queue:
+            self.queued[cell] = 0
+        self.queue.clear()
+        self.line_queue.clear()
+        return False
+
+    def is_connected(self) -> bool:
+        """Check that the chains and the clues can still be joined in a
+        loop by the edges that are not OFF: they must all be reached, and no
+        bridge edge can split them, as a loop can not cross a bridge
+
+        Returns:
+            bool: False if some of them are cut off from the others
+        """
+        on_count = self.on_count
+        clue = self.clue
+        targets = len(self.clue_cells) + self.totals[3]
+        if targets == 0:
+            return True
+
+        # A chain is walked as one link between its ends, as the cells
+        # inside it have no edge left that is not OFF. The link of a chain is
+        # -2 - its smaller end, and its cells are counted on that end
+        partner = self.partner
+        chain_length = self.chain_length
+        start = on_count.find(1)
+        if start < 0:
+            start = self.clue_cells[0]
+
+        # Iterative Tarjan bridge search, below[cell] is the number of
+        # targets in the DFS subtree of the cell
+        state = self.state
+        links = self.links
+        n_cells = len(clue)
+        order = [0] * n_cells
+        low = [0] * n_cells
+        below = [0] * n_cells
+        parent_edge = [-1] * n_cells
+        order[start] = low[start] = 1
+        timer = 1
+        # The links of a cell are walked with an iterator, kept on the stack
+        # while the DFS is below the cell
+        if on_count[start]:
+            end = partner[start]
+            below[start] = chain_length[start] if start < end else 1
+            stack = [(start, iter(links[start] + ((-2 - min(start, end), end),)))]
+        else:
+            below[start] = 1
+            stack = [(start, iter(links[start]))]
+        while stack:
+            cell, cell_links = stack[-1]
+            for edge, other in cell_links:
+                if (edge >= 0 and state[edge] != UNKNOWN) or edge == parent_edge[cell]:
+                    continue
+                seen = order[other]
+                if seen:
+                    if seen < low[cell]:
+                        low[cell] = seen
+                else:
+                    timer += 1
+                    order[other] = low[other] = timer
+                    parent_edge[other] = edge
+                    if on_count[other]:
+                        end = partner[other]
+                        below[other] = chain_length[other] if other < end else 1
+                        stack.append((other, iter(links[other] + ((-2 - min(other, end), end),))))
+                    else:
+                        if clue[other]:
+                            below[other] = 1
+                        stack.append((other, iter(links[other])))
+                    break
+            else:
+                stack.pop()
+                if stack:
+                    parent = stack[-1][0]
+                    if low[cell] < low[parent]:
+                        low[parent] = low[cell]
+                    elif low[cell] > order[parent] and 0 < below[cell] < targets:
+                        return False
+                    below[parent] += below[cell]
+        return below[start] == targets
+
+    def deduce(self, cell: int, state: bytearray, cell_edge: list[int]) -> bool:
+        """Apply the degree rules and the clue rules of a cell
+
+        Args:
+            cell (int): the cell id
+            state (bytearray): the state of the edges
+            cell_edge (list[int]): the edges of every cell
+
+        Returns:
+            bool: False if a contradiction is found, True otherwise
+        """
+        on = self.on_count[cell]
+        unknown = self.unknown_count[cell]
+        base = cell * 4
+
+        # Degree rules, a cell has zero or two edges
+        if on > 2:
+            return False
+        if on == 2:
+            if unknown:
+                for d in range(4):
+                    edge = cell_edge[base + d]
+                    if edge >= 0 and state[edge] == UNKNOWN and not self.set_edge(edge, OFF):
+                        return False
+        elif on == 1:
+            if unknown == 0:
+                return False
+            if unknown == 1:
+                for d in range(4):
+                    edge = cell_edge[base + d]
+                    if edge >= 0 and state[edge] == UNKNOWN:
+                        return self.set_edge(edge, ON) and self.deduce_clue(cell, state, cell_edge)
+        elif self.clue[cell]:
+            if unknown < 2:
+                return False
+            if unknown == 2:
+                for d in range(4):
+                    edge = cell_edge[base + d]
+                    if edge >= 0 and state[edge] == UNKNOWN and not self.set_edge(edge, ON):
+                        return False
+        elif unknown == 1:
+            for d in range(4):
+                edge = cell_edge[base + d]
+                if edge >= 0 and state[edge] == UNKNOWN:
+                    return self.set_edge(edge, OFF)
+
+        return self.deduce_clue(cell, state, cell_edge)
+
+    def deduce_clue(self, cell: int, state: bytearray, cell_edge: list[int]) -> bool:
+        """Apply the rules of a white or black clue
+
+        Args:
+            cell (int): the cell id
+            state (bytearray): the state of the edges
+            cell_edge (list[int]): the edges of every cell
+
+        Returns:
+            bool: False if a contradiction is found, True otherwise
+        """
+        color = self.clue[cell]
+        base = cell * 4
+        extension = self.extension
+
+        if color == BLACK:
+            # Turn, and go straight on the next cell of both arms
+            for d in range(4):
+                edge = cell_edge[base + d]
+                opposite = cell_edge[base + (d ^ 2)]
+                if edge < 0:
+                    if opposite < 0 or not self.set_edge(opposite, ON):
+                        return False
+                    continue
+
+                next_cell = self.next_cell(cell, d)
+                ext = extension[base + d]
+                # The arm goes straight on the next cell, a black clue turns
+                if ext < 0 or state[ext] == OFF or self.clue[next_cell] == BLACK:
+                    if not self.set_edge(edge, OFF):
+                        return False
+                else:
+                    # The next cell can not turn
+                    next_base = next_cell * 4
+                    for side in ((d + 1) & 3, (d + 3) & 3):
+                        side_edge = cell_edge[next_base + side]
+                        if side_edge >= 0 and state[side_edge] == ON:
+                            if not self.set_edge(edge, OFF):
+                                return False
+                            break
+
+                if state[edge] == ON:
+                    if not self.set_edge(ext, ON):
+                        return False
+                    if opposite >= 0 and not self.set_edge(opposite, OFF):
+                        return False
+                elif state[edge] == OFF:
+                    if opposite < 0 or not self.set_edge(opposite, ON):
+                        return False
+
+        elif color == WHITE:
+            # Go straight, and turn on at least one of the next cells
+            for a, b in ((LEFT, RIGHT), (UP, DOWN)):
+                edge_a = cell_edge[base + a]
+                edge_b = cell_edge[base + b]
+                ext_a = extension[base + a]
+                ext_b = extension[base + b]
+                other_a = cell_edge[base + (a ^ 1)]
+                other_b = cell_edge[base + (b ^ 1)]
+
+                blocked = (edge_a < 0 or edge_b < 0
+                           or state[edge_a] == OFF or state[edge_b] == OFF
+                           or (ext_a >= 0 and ext_b >= 0
+                               and state[ext_a] == ON and state[ext_b] == ON))
+                if blocked:
+                    for edge in (edge_a, edge_b):
+                        if edge >= 0 and not self.set_edge(edge, OFF):
+                            return False
+                    for edge in (other_a, other_b):
+                        if edge < 0 or not self.set_edge(edge, ON):
+                            return False
+                elif state[edge_a] == ON or state[edge_b] == ON:
+                    if not self.set_edge(edge_a, ON) or not self.set_edge(edge_b, ON):
+                        return False
+                    for edge in (other_a, other_b):
+                        if edge >= 0 and not self.set_edge(edge, OFF):
+                            return False
+                    if ext_a >= 0 and ext_b >= 0:
+                        if state[ext_a] == ON and not self.set_edge(ext_b, OFF):
+                            return False
+                        if state[ext_b] == ON and not self.set_edge(ext_a, OFF):
+                            return False
+
+        return True
+
+    def choose_edge(self) -> int:
+        """Choose the most constrained unknown edge to branch on, an edge of
+        the chain end with the fewest options
+
+        Returns:
+            int: the edge, -1 if there are no unknown edges
+        """
+        state = self.state
+        on_count = self.on_count
+        unknown_count = self.unknown_count
+
+        best_cell = -1
+        best_score = (5, 0)
+        fallback = -1
+        for cell in range(len(on_count)):
+            unknown = unknown_count[cell]
+            if not unknown:
+                continue
+            if on_count[cell] == 1:
+                score = (unknown, self.tie[cell])
+                if score < best_score:
+                    best_cell, best_score = cell, score
+            elif fallback < 0 and self.clue[cell] and on_count[cell] == 0:
+                fallback = cell
+        if best_cell < 0:
+            best_cell = fallback
+
+        if best_cell >= 0:
+            # Prefer to join the chain to a cell that is already on the loop
+            best_edge = -1
+            best_value = -1
+            for edge, other in self.links[best_cell]:
+                if state[edge] == UNKNOWN:
+                    value = (on_count[other] == 1) * 2 + (self.clue[other] > 0)
+                    if value > best_value:
+                        best_edge, best_value = edge, value
+            return best_edge
+
+        for edge in range(len(state)):
+            if state[edge] == UNKNOWN:
+                return edge
+        return -1
+
+    def is_solved(self) -> bool:
+        """Check if the edges that are ON are a valid solution
+
+        Returns:
+            bool: True if they form a single loop that satisfies every clue
+        """
+        if not self.totals[2]:
+            return False
+        for cell in range(len(self.clue)):
+            if self.clue[cell] and self.on_count[cell] != 2:
+                return False
+            if self.on_count[cell] not in (0, 2):
+                return False
+        # The loop was closed holding every ON edge, and the clue rules do
+        # not allow a full assignment that breaks a clue
+        return True
+
+    def loop_edges(self) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+        """Get the edges that are ON in the order of the loop
+
+        Returns:
+            list[tuple[tuple[int, int], tuple[int, int]]]: the edges as
+            ((s_x, s_y), (e_x, e_y)) pairs, ready for Game_flow.make_move
+        """
+        size = self.size
+        start = next(cell for cell in range(len(self.on_count)) if self.on_count[cell])
+        edges = []
+        previous, cell = -1, start
+        while True:
+            for d in range(4):
+                edge = self.cell_edge[cell * 4 + d]
+                if edge >= 0 and self.state[edge] == ON:
+                    next_cell = self.next_cell(cell, d)
+                    if next_cell != previous:
+                        break
+            edges.append(((cell // size, cell % size), (next_cell // size, next_cell % size)))
+            previous, cell = cell, next_cell
+            if cell == start:
+                return edges
+
+    def start(self) -> bool:
+        """Queue every cell, apply the deductions and probe the edges
+
+        Raises:
+            SolverTimeout: if the deadline is reached
+
+        Returns:
+            bool: False if the board has no solution, True otherwise
+        """
+        for cell in range(len(self.clue)):
+            self.enqueue(cell)
+        return self.propagate() and self.probe()
+
+    def probe(self) -> bool:
+        """Try both values of every unknown edge, when the deductions of one
+        value fail the edge takes the other one. It is repeated until no
+        edge changes, as an edge set can make another value fail
+
+        Raises:
+            SolverTimeout: if the deadline is reached
+
+        Returns:
+            bool: False if both values of an edge fail, True otherwise
+        """
+        state = self.state
+        changed = True
+        while changed:
+            changed = False
+            for edge in range(len(state)):
+                if state[edge] != UNKNOWN:
+                    continue
+                if self.deadline is not None and time.perf_counter() > self.deadline:
+                    raise SolverTimeout
+                for value, other in ((ON, OFF), (OFF, ON)):
+                    mark = len(self.trail)
+                    failed = not (self.set_edge(edge, value) and self.propagate())
+                    self.undo(mark)
+                    if failed:
+                        if not (self.set_edge(edge, other) and self.propagate()):
+                            return False
+                        changed = True
+                        break
+        return True
+
+    def assign(self, edge: int, value: int) -> bool:
+        """Branch on an edge and propagate the deductions
+
+        Args:
+            edge (int): the edge
+            value (int): ON or OFF
+
+        Raises:
+            SolverTimeout: if the deadline is reached
+
+        Returns:
+            bool: False if the branch is a contradiction, True otherwise
+        """
+        self.nodes += 1
+        # A node can take milliseconds on big boards, so the deadline is
+        # checked often to keep timeouts tight
+        if self.nodes & 15 == 0:
+            if self.progress is not None and self.nodes & 255 == 0:
+                self.progress(self.nodes)
+            if self.deadline is not None and time.perf_counter() > self.deadline:
+                raise SolverTimeout
+        return (self.set_edge(edge, value) and self.propagate()
+                and (self.totals[2] or self.is_connected()))
+
+    def search(self, limit: int, node_limit: Optional[int] = None) -> int:
+        """Backtrack over the unknown edges left by start until the limit of
+        solutions is found, the solutions are kept in solutions
+
+        Args:
+            limit (int): the number of solutions to stop at
+            node_limit (Optional[int]): the value of nodes to give up at
+
+        Raises:
+            SolverTimeout: if the deadline is reached
+
+        Returns:
+            int: the number of solutions found, -1 if node_limit was reached
+        """
+        mark = len(self.trail)
+        stack = []
+        ok = True
+        # The last edge whose two values failed is branched on first until
+        # one of them holds, so the search goes back to the choice that made
+        # it fail instead of trying every branch taken after that choice
+        conflict = -1
+        while True:
+            if node_limit is not None and self.nodes > node_limit:
+                self.undo(mark)
+                return -1
+            if ok:
+                if conflict >= 0 and self.state[conflict] != UNKNOWN:
+                    conflict = -1
+                edge = conflict if conflict >= 0 else self.choose_edge()
+                if edge < 0:
+                    if self.is_solved():
+                        self.solutions.append(self.loop_edges())
+                        if len(self.solutions) >= limit:
+                            self.undo(mark)
+                            return len(self.solutions)
+                    ok = False
+                else:
+                    stack.append((len(self.trail), edge, ON))
+                    ok = self.assign(edge, ON)
+                    if ok and edge == conflict:
+                        conflict = -1
+                    continue
+
+            # Backtrack to the last branch that can still try OFF
+            while stack:
+                branch_mark, edge, value = stack.pop()
+                self.undo(branch_mark)
+                if value == ON:
+                    stack.append((branch_mark, edge, OFF))
+                    ok = self.assign(edge, OFF)
+                    if ok:
+                        if edge == conflict:
+                            conflict = -1
+                    elif conflict < 0:
+                        conflict = edge
+                    break
+            else:
+                self.undo(mark)
+                return len(self.solutions)
+
+    def solve(self) -> bool:
+        """Find one solution of the board
+
+        Raises:
+            SolverTimeout: if the deadline is reached
+
+        Returns:
+            bool: True if a solution is found, False otherwise
+        """
+        mark = len(self.trail)
+        if not self.start():
+            self.undo(mark)
+            return False
+
+        # Restart with a new order of the chain ends when a branch takes too
+        # long, a bad early choice is then not explored to the end. Every
+        # restart begins from the deductions of start
+        budget = RESTART_NODES
+        while True:
+            found = self.search(1, self.nodes + budget)
+            if found >= 0:
+                self.undo(mark)
+                return found > 0
+            budget += budget // 2
+            self.tie = [self.random.random() for _ in self.tie]
+
+    def count_solutions(self, limit: int = 2) -> int:
+        """Count the solutions of the board, stopping at a limit
+
+        Args:
+            limit (int): the number of solutions to stop at
+
+        Raises:
+            SolverTimeout: if the deadline is reached
+
+        Returns:
+            int: the number of solutions found, at most limit
+        """
+        mark = len(self.trail)
+        found = self.search(limit) if self.start() else len(self.solutions)
+        self.undo(mark)
+        return found
@@ -0,0 +1,126 @@
+from typing import Optional
+
+from Logic.node import Node
+
+
+class LoopReport:
+    """
+    LoopReport class with the result of walking the edges of a graph
+
+    Attributes
+    ----------
+    is_loop : bool
+        True if the edges form exactly one closed loop
+    length : int
+        The number of nodes reached from the start node
+    has_cycle : bool
+        True if a cycle was found while walking from the start node
+    unvisited : list
+        The connected nodes that were not reached from the start node
+    invalid_clue : Optional[Node]
+        The first white or black node that is not valid, None if all are
+    """
+    def __init__(self, is_loop: bool, length: int, has_cycle: bool,
+                 unvisited: list[Node], invalid_clue: Optional[Node]) -> None:
+        self.is_loop = is_loop
+        self.length = length
+        self.has_cycle = has_cycle
+        self.unvisited = unvisited
+        self.invalid_clue = invalid_clue
+
+    def __str__(self) -> str:
+        return (f"loop={self.is_loop} length={self.length} "
+                f"unvisited={len(self.unvisited)} invalid_clue={self.invalid_clue}")
+
+
+def walk(graph, start_node: Node, visited: bytearray,
+         parent_node: Optional[Node] = None) -> tuple[list[Node], bool]:
+    """Walk the component of a node without recursion
+
+    Args:
+        graph (Graph): the graph to walk
+        start_node (Node): the node to start from
+        visited (bytearray): the visited flag of every cell id (x * size + y),
+            it is updated in place
+        parent_node (Optional[Node]): the node the walk comes from
+
+    Returns:
+        tuple[list[Node], bool]: the nodes in the order they were visited,
+        and True if a cycle was found
+    """
+    size = graph.size
+    order = []
+    has_cycle = False
+
+    visited[start_node.x * size + start_node.y] = 1
+    stack = [(start_node, parent_node)]
+    while stack:
+        node, parent = stack.pop()
+        order.append(node)
+        for adjacent_node in (node.up, node.right, node.down, node.left):
+            if adjacent_node is None or adjacent_node is parent:
+                continue
+            cell = adjacent_node.x * size + adjacent_node.y
+            if visited[cell]:
+                has_cycle = True
+            else:
+                visited[cell] = 1
+                stack.append((adjacent_node, node))
+
+    return order, has_cycle
+
+
+def first_invalid_clue(graph, nodes: list[Node]) -> Optional[Node]:
+    """Get the first white or black node that is not valid
+
+    Args:
+        graph (Graph): the graph the nodes belong to
+        nodes (list[Node]): the nodes to check, in order
+
+    Returns:
+        Optional[Node]: the first invalid node, None if all are valid
+    """
+    for node in nodes:
+        if node.color == 1 and not graph.check_valid_white(node):
+            return node
+        if node.color == 2 and not graph.check_valid_black(node):
+            return node
+    return None
+
+
+def walk_loop(graph, start_node: Optional[Node] = None) -> LoopReport:
+    """Walk the edges of a graph from a node and report if they form a
+    single closed loop
+
+    Args:
+        graph (Graph): the graph to walk
+        start_node (Optional[Node]): the node to start from, the first
+            connected node if it is None
+
+    Returns:
+        LoopReport: the result of the walk
+    """
+    connected = [node for row in graph.adjacency_matrix
+                 for node in row if node.weight > 0]
+    if start_node is None:
+        if not connected:
+            return LoopReport(False, 0, False, [], first_invalid_clue(graph, graph.clue_nodes))
+        start_node = connected[0]
+
+    visited = bytearray(graph.size * graph.size)
+    order, has_cycle = walk(graph, start_node, visited)
+
+    size = graph.size
+    unvisited = [node for node in connected if not visited[node.x * size + node.y]]
+    is_loop = (has_cycle and not unvisited
+               and all(node.weight == 2 for node in order))
+
+    invalid_clue = first_invalid_clue(graph, order)
+    if invalid_clue is None:
+        # Clues out of the walked edges can not be on the loop
+        for node in graph.clue_nodes:
+            if not visited[node.x * size + node.y]:
+                invalid_clue = node
+                break
+
+    return LoopReport(is_loop, len(order), has_cycle, unvisited, invalid_clue)
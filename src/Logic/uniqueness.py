@@ -0,0 +1,189 @@
+import time
+from typing import Optional, Union
+
+from Logic.graph import Graph
+from Logic.sat import CDCL, CNF
+
+Edge = tuple[tuple[int, int], tuple[int, int]]
+
+
+class UniquenessReport:
+    """
+    UniquenessReport class with the result of a uniqueness check
+
+    Attributes
+    ----------
+    count : int | str
+        0 if the board has no solution, 1 if it has exactly one, "2+" if it
+        has more than one
+    witnesses : list
+        One solution per solution found, at most two, each one a list of
+        ((s_x, s_y), (e_x, e_y)) edges along the loop
+    """
+    def __init__(self, count: Union[int, str], witnesses: list[list[Edge]]) -> None:
+        self.count = count
+        self.witnesses = witnesses
+
+    @property
+    def is_unique(self) -> bool:
+        """True if the board has exactly one solution"""
+        return self.count == 1
+
+    def __str__(self) -> str:
+        return f"solutions={self.count}"
+
+
+class UniquenessChecker:
+    """
+    UniquenessChecker class to count the solutions of the boards of a size
+    up to two
+
+    The clauses of every clue are guarded by a selector variable and the
+    clues of a board are solver assumptions, so one CDCL solver is kept for
+    many sets of clues and what it learns about the board is shared between
+    the checks. The second solution is searched with a temporary clause
+    against the first one, on the same solver that found the first.
+
+    Attributes
+    ----------
+    size : int
+        The size of the boards
+    cnf : CNF
+        The degree clauses, that do not depend on the clues
+    engine : CDCL
+        The SAT solver
+    checks : int
+        The number of checks done
+
+    Methods
+    -------
+    check(clues, known, timeout)
+        Count the solutions of some clues up to two
+    selector(cell, color)
+        Get the variable that turns on a clue
+    find(assumptions, clues)
+        Find a solution with the selected clues
+    """
+    def __init__(self, size: int) -> None:
+        """
+        Args:
+            size (int): the size of the boards
+        """
+        self.size = size
+        self.cnf = CNF(size, {})
+        self.engine = CDCL(self.cnf.num_vars)
+        for clause in self.cnf.clauses:
+            self.engine.add_clause(clause)
+        self.selectors = {}
+        self.checks = 0
+
+    def selector(self, cell: tuple[int, int], color: int) -> int:
+        """Get the variable that turns on a clue, the clauses of the clue
+        are added the first time
+
+        Args:
+            cell (tuple[int, int]): the position of the clue
+            color (int): the color of the clue
+
+        Returns:
+            int: the variable
+        """
+        var = self.selectors.get((cell, color))
+        if var is None:
+            var = self.engine.new_var()
+            for clause in self.cnf.clue_clauses(cell[0], cell[1], color):
+                self.engine.add_clause([-var] + clause)
+            self.selectors[(cell, color)] = var
+        return var
+
+    def check(self, clues: dict[tuple[int, int], int], known: Optional[list[Edge]] = None,
+              timeout: Optional[float] = None) -> UniquenessReport:
+        """Count the solutions of some clues up to two, stopping as soon as
+        the second one is found
+
+        Args:
+            clues (dict[tuple[int, int], int]): the color of every clue
+            known (Optional[list[Edge]]): a solution of the clues that is
+                already known, to only search for a second one
+            timeout (Optional[float]): the seconds the check can take
+
+        Raises:
+            SolverTimeout: if the timeout is reached
+
+        Returns:
+            UniquenessReport: the number of solutions and a witness of each
+        """
+        self.checks += 1
+        self.engine.deadline = None if timeout is None else time.perf_counter() + timeout
+        assumptions = [self.selector(cell, color) for cell, color in clues.items()]
+
+        if known is None:
+            known = self.find(assumptions, clues)
+            if known is None:
+                return UniquenessReport(0, [])
+
+        # Only for this check, the solution must not be the known one
+        other = self.engine.new_var()
+        self.engine.add_clause([-other] + [-self.cnf.var(*start, *end) for start, end in known])
+        try:
+            second = self.find(assumptions + [other], clues)
+        finally:
+            self.engine.add_clause([-other])
+
+        if second is None:
+            return UniquenessReport(1, [known])
+        return UniquenessReport("2+", [known, second])
+
+    def find(self, assumptions: list[int], clues: dict[tuple[int, int], int]) -> Optional[list[Edge]]:
+        """Find a solution with the selected clues. A model with more than
+        one loop adds clauses against its loops, guarded by the selectors of
+        the clues they depend on, and the solver runs again
+
+        Args:
+            assumptions (list[int]): the variables that must be true
+            clues (dict[tuple[int, int], int]): the clues of the selectors
+
+        Raises:
+            SolverTimeout: if the deadline of the engine is reached
+
+        Returns:
+            Optional[list[Edge]]: the edges of the solution along the loop,
+            None if there is no solution
+        """
+        cnf = self.cnf
+        while self.engine.solve(tuple(assumptions)):
+            loops = cnf.loops(self.engine.model)
+            if len(loops) == 1 or not clues:
+                # Without clues every loop of the model is a solution
+                return cnf.loop_edges(loops[0])
+
+            for loop in loops:
+                cells = {cell for var in loop for cell in cnf.edges[var - 1]}
+                inside = [cell for cell in clues if cell in cells]
+                outside = [cell for cell in clues if cell not in cells]
+                if not outside:
+                    continue
+                guard = -self.selector(outside[0], clues[outside[0]])
+                if inside:
+                    # A loop with a clue inside and one outside must leave
+                    guard_inside = -self.selector(inside[0], clues[inside[0]])
+                    self.engine.add_clause([guard, guard_inside] + cnf.boundary(cells))
+                else:
+                    self.engine.add_clause([guard] + [-var for var in loop])
+        return None
+
+
+def check_uniqueness(graph: Graph, timeout: Optional[float] = None) -> UniquenessReport:
+    """Count the solutions of the board of a graph up to two
+
+    Args:
+        graph (Graph): the graph of the board
+        timeout (Optional[float]): the seconds the check can take
+
+    Raises:
+        SolverTimeout: if the timeout is reached
+
+    Returns:
+        UniquenessReport: the number of solutions and a witness of each
+    """
+    return UniquenessChecker(graph.size).check(dict(graph.board.clues), timeout=timeout)
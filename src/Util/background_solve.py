@@ -0,0 +1,163 @@
+import multiprocessing
+import queue
+import time
+from typing import Optional
+
+from Logic.ai import solver_class
+from Logic.board import Board
+
+# Seconds between two progress messages of the worker
+PROGRESS_INTERVAL = 0.1
+
+
+def solve_worker(size: int, clues: dict[tuple[int, int], int], backend: str,
+                 messages: multiprocessing.Queue) -> None:
+    """Solve a board and send the progress and the result, it runs in the
+    worker process so it never raises, the errors are messages too
+
+    Args:
+        size (int): the size of the board
+        clues (dict[tuple[int, int], int]): the color of every clue
+        backend (str): the solver to use, a key of Logic.ai.BACKENDS
+        messages (multiprocessing.Queue): the queue of (kind, value, nodes)
+            messages, kind is progress, solution, unsolvable or error
+    """
+    last = time.perf_counter()
+
+    def progress(nodes: int) -> None:
+        nonlocal last
+        now = time.perf_counter()
+        if now - last >= PROGRESS_INTERVAL:
+            last = now
+            messages.put(("progress", None, nodes))
+
+    solver = None
+    try:
+        solver = solver_class(backend)(size, clues, progress=progress)
+        if solver.solve():
+            messages.put(("solution", solver.solutions[0], solver.nodes))
+        else:
+            messages.put(("unsolvable", None, solver.nodes))
+    except Exception as error:
+        messages.put(("error", str(error), solver.nodes if solver is not None else 0))
+
+
+class BackgroundSolve:
+    """
+    BackgroundSolve class to solve a board in a worker process, so the
+    window keeps drawing while the solver runs and the solve can be
+    cancelled at any time
+
+    Attributes
+    ----------
+    backend : str
+        The solver used, a key of Logic.ai.BACKENDS
+    status : str
+        running, solved, unsolvable, cancelled or error
+    nodes : int
+        The nodes explored so far, decisions for the sat backend
+    solution : list
+        The edges of the solution, ((s_x, s_y), (e_x, e_y)) along the loop
+    error : str
+        The message of the error of the worker
+    start : float
+        The time.perf_counter() value when the solve started
+    end : Optional[float]
+        The time.perf_counter() value when the solve stopped
+
+    Methods
+    -------
+    poll()
+        Read the messages of the worker without waiting
+    cancel()
+        Stop the worker
+    running()
+        Check if the worker is still solving
+    elapsed()
+        Get the seconds of the solve
+    """
+    def __init__(self, board: Board, backend: str = "sat") -> None:
+        """
+        Args:
+            board (Board): the board to solve
+            backend (str): the solver to use, a key of Logic.ai.BACKENDS
+
+        Raises:
+            ValueError: if there is no backend with that name
+        """
+        solver_class(backend)
+        self.backend = backend
+        self.status = "running"
+        self.nodes = 0
+        self.solution = []
+        self.error = ""
+        self.start = time.perf_counter()
+        self.end = None
+
+        # A new interpreter instead of a fork of the one that runs pygame
+        context = multiprocessing.get_context("spawn")
+        self.messages = context.Queue()
+        self.process = context.Process(
+            target=solve_worker, args=(board.size, dict(board.clues), backend, self.messages),
+            daemon=True)
+        self.process.start()
+
+    def running(self) -> bool:
+        return self.status == "running"
+
+    def elapsed(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def poll(self) -> bool:
+        """Read the messages of the worker without waiting
+
+        Returns:
+            bool: True if the progress or the status changed
+        """
+        if not self.running():
+            return False
+
+        changed = False
+        while True:
+            try:
+                kind, value, nodes = self.messages.get_nowait()
+            except queue.Empty:
+                break
+            changed = True
+            self.nodes = nodes
+            if kind == "progress":
+                continue
+            self.status = {"solution": "solved", "unsolvable": "unsolvable"}.get(kind, "error")
+            if kind == "solution":
+                self.solution = value
+            elif kind == "error":
+                self.error = value
+            self.finish()
+            return True
+
+        # A worker that died without a result
+        if not self.process.is_alive() and self.messages.empty():
+            self.status = "error"
+            self.error = f"the solver stopped with exit code {self.process.exitcode}"
+            self.finish()
+            return True
+        return changed
+
+    def cancel(self) -> None:
+        """Stop the worker, the solve is cancelled if it was running"""
+        if self.running():
+            self.status = "cancelled"
+            self.finish()
+
+    def finish(self, timeout: Optional[float] = 1.0) -> None:
+        """Stop the worker process and release the queue
+
+        Args:
+            timeout (Optional[float]): the seconds to wait for the process
+        """
+        self.end = time.perf_counter()
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join(timeout)
+        self.messages.close()
+        self.messages.cancel_join_thread()
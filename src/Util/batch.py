@@ -0,0 +1,115 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional, TextIO
+
+from Logic.ai import solver_class
+from Logic.bitboard import BitGraph
+from Logic.board import load_board
+from Logic.sat import SatSolver
+from Logic.solver import SolverTimeout
+
+# Columns of every result line, the CNF stats are empty for the search
+# backend
+HEADER = "file,solved,time,nodes,variables,clauses,conflicts,learned,subtours"
+
+# Stats of SatSolver.stats that are written, in the order of HEADER
+STATS = ("variables", "clauses", "conflicts", "learned", "subtours")
+
+
+def board_files(directory: str) -> list[str]:
+    """Get the board files of a directory and its subdirectories
+
+    Args:
+        directory (str): the directory to search
+
+    Returns:
+        list[str]: the paths of the .txt files, sorted
+    """
+    files = []
+    for root, _, names in os.walk(directory):
+        files.extend(os.path.join(root, name) for name in names if name.endswith(".txt"))
+    return sorted(files)
+
+
+def solve_board(path: str, timeout: Optional[float],
+                backend: str) -> tuple[str, str, float, int, dict[str, float]]:
+    """Solve a board file and check the solution, it runs in a worker
+    process so it never raises, the errors are part of the result
+
+    Args:
+        path (str): the path of the board file
+        timeout (Optional[float]): the seconds to give up at, None to never
+        backend (str): the solver to use, a key of Logic.ai.BACKENDS
+
+    Returns:
+        tuple[str, str, float, int, dict[str, float]]: the path, the result
+        (yes, no, timeout, invalid or error: message), the seconds, the
+        nodes explored and the CNF stats of the sat backend, empty for the
+        search backend
+    """
+    start = time.perf_counter()
+    solver = None
+    try:
+        parsed = load_board(path)
+        board = BitGraph(parsed)
+        size = board.size
+        clues = dict(parsed.clues)
+
+        deadline = None if timeout is None else start + timeout
+        solver = solver_class(backend)(size, clues, deadline=deadline)
+        if not solver.solve():
+            result = "no"
+        else:
+            # Check the solution with an engine that does not share code
+            # with the solvers
+            for (s_x, s_y), (e_x, e_y) in solver.solutions[0]:
+                board.add_edge(s_x, s_y, e_x, e_y)
+            result = "yes" if board.check_win() else "invalid"
+    except SolverTimeout:
+        result = "timeout"
+    except Exception as error:
+        result = f"error: {error}".replace(",", ";")
+
+    nodes = solver.nodes if solver is not None else 0
+    stats = solver.stats() if isinstance(solver, SatSolver) else {}
+    return path, result, time.perf_counter() - start, nodes, stats
+
+
+def run_batch(directory: str, timeout: Optional[float] = None,
+              workers: Optional[int] = None, backend: str = "search",
+              output: TextIO = sys.stdout) -> dict[str, int]:
+    """Solve every board of a directory over a process pool, writing one
+    line per board as soon as it finishes
+
+    Args:
+        directory (str): the directory with the board files
+        timeout (Optional[float]): the seconds each board can take
+        workers (Optional[int]): the number of processes, all cores if None
+        backend (str): the solver to use, "search" or "sat"
+        output (TextIO): where the result lines are written
+
+    Raises:
+        ValueError: if there is no backend with that name
+
+    Returns:
+        dict[str, int]: the number of boards of every result
+    """
+    # A wrong backend fails here and not once per board in the workers
+    solver_class(backend)
+
+    files = board_files(directory)
+    totals = {}
+    output.write(HEADER + "\n")
+    output.flush()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(solve_board, path, timeout, backend) for path in files]
+        for future in as_completed(futures):
+            path, result, seconds, nodes, stats = future.result()
+            columns = ",".join(str(stats.get(name, "")) for name in STATS)
+            output.write(f"{path},{result},{seconds:.4f},{nodes},{columns}\n")
+            output.flush()
+            key = result.split(":")[0]
+            totals[key] = totals.get(key, 0) + 1
+    return totals
@@ -1,3 +1,5 @@
+import sys
+
 def check_args(args: str) -> str:
     """get the filename from the command line arguments
 
@@ -22,4 +24,176 @@ def check_args(args: str) -> str:
     if "-f" in args:
         filename = args[args.index("-f") + 1]
         
-    return filename, resolution
\ No newline at end of file
+    return filename, resolution
+
+def check_batch_args(args: list[str]) -> tuple[str, float, int, str]:
+    """get the batch options from the command line arguments
+
+    Args:
+        args (list[str]): command line arguments
+
+    Returns:
+        tuple[str, float, int, str]: directory of the boards ("" if there is
+        no batch), timeout per board in seconds (None for no timeout),
+        number of worker processes (None for all cores) and solver backend
+    """
+    directory = ""
+    timeout = None
+    workers = None
+    backend = "search"
+    
+    # python .\src\main.py -b .\games -t 10 -j 4 -s sat (the order of the arguments does not matter)
+    
+    if "-b" in args:
+        directory = args[args.index("-b") + 1]
+    
+    if "-t" in args:
+        try:
+            timeout = float(args[args.index("-t") + 1])
+        except (IndexError, ValueError):
+            print("Invalid timeout")
+            timeout = None
+    
+    if "-j" in args:
+        try:
+            workers = int(args[args.index("-j") + 1])
+        except (IndexError, ValueError):
+            print("Invalid number of workers")
+            workers = None
+    
+    if "-s" in args:
+        backend = args[args.index("-s") + 1]
+        # The solvers are only loaded when a backend is chosen
+        from Logic.ai import solver_class
+        try:
+            solver_class(backend)
+        except ValueError as error:
+            print(f"Invalid backend: {error}")
+            sys.exit(1)
+        
+    return directory, timeout, workers, backend
+
+
+def check_generate_args(args: list[str]) -> tuple[int, int, str, int, int]:
+    """get the generator options from the command line arguments
+
+    Args:
+        args (list[str]): command line arguments
+
+    Returns:
+        tuple[int, int, str, int, int]: number of boards to create (0 if
+        there is nothing to create), size of the boards, directory to write
+        them to, number of worker processes (None for all cores) and seed
+        of the first board
+    """
+    count = 0
+    size = 10
+    directory = "games/generated"
+    workers = None
+    seed = 0
+    
+    # python .\src\main.py -g 100 -n 20 -o .\games\generated -j 4 --seed 7 (the order of the arguments does not matter)
+    
+    if "-g" in args:
+        try:
+            count = int(args[args.index("-g") + 1])
+        except (IndexError, ValueError):
+            print("Invalid number of boards")
+            count = 0
+    
+    if "-n" in args:
+        try:
+            size = int(args[args.index("-n") + 1])
+        except (IndexError, ValueError):
+            print("Invalid size")
+            size = 10
+    
+    if "-o" in args:
+        directory = args[args.index("-o") + 1]
+    
+    if "-j" in args:
+        try:
+            workers = int(args[args.index("-j") + 1])
+        except (IndexError, ValueError):
+            print("Invalid number of workers")
+            workers = None
+    
+    if "--seed" in args:
+        try:
+            seed = int(args[args.index("--seed") + 1])
+        except (IndexError, ValueError):
+            print("Invalid seed")
+            seed = 0
+        
+    return count, size, directory, workers, seed
+
+
+def check_convert_args(args: list[str]) -> tuple[str, str]:
+    """get the library conversion options from the command line arguments
+
+    Args:
+        args (list[str]): command line arguments
+
+    Returns:
+        tuple[str, str]: directory of the .txt boards to convert ("" if
+        there is nothing to convert) and path of the library to write
+    """
+    directory = ""
+    output = "games/boards.mlib"
+    
+    # python .\src\main.py --convert .\games -o .\games\boards.mlib (the order of the arguments does not matter)
+    
+    if "--convert" in args:
+        directory = args[args.index("--convert") + 1]
+    
+    if "-o" in args:
+        output = args[args.index("-o") + 1]
+        
+    return directory, output
+
+
+def check_trace_args(args: list[str]) -> tuple[str, str]:
+    """get the tracing options from the command line arguments
+
+    Args:
+        args (list[str]): command line arguments
+
+    Returns:
+        tuple[str, str]: path of the Chrome trace file to write ("" if
+        there is no trace) and level of the events, debug or info
+    """
+    output = ""
+    level = "info"
+    
+    # python .\src\main.py -f .\games\board_template.txt --trace trace.json --trace-level debug (the order of the arguments does not matter)
+    
+    if "--trace" in args:
+        output = args[args.index("--trace") + 1]
+    
+    if "--trace-level" in args:
+        level = args[args.index("--trace-level") + 1]
+        if level not in ("debug", "info"):
+            print("Invalid trace level")
+            level = "info"
+        
+    return output, level
+
+
+def check_dimacs_args(args: list[str]) -> str:
+    """get the DIMACS export option from the command line arguments
+
+    Args:
+        args (list[str]): command line arguments
+
+    Returns:
+        str: path of the DIMACS file to write with the CNF of the board of
+        -f ("" if there is nothing to write)
+    """
+    output = ""
+    
+    # python .\src\main.py -f .\games\board_template.txt --dimacs board.cnf (the order of the arguments does not matter)
+    
+    if "--dimacs" in args:
+        output = args[args.index("--dimacs") + 1]
+        
+    return output
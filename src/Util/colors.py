@@ -3,6 +3,7 @@ class colors:
         self.BLACK = (0, 0, 0)
         self.WHITE = (255, 255, 255)
         self.RED = (255, 45, 0)
+        self.GREEN = (0, 170, 60)
 
         self.flag = False
 
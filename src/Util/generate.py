@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional, TextIO
+
+from Logic.generator import Generator, board_text
+
+# Columns of every result line
+HEADER = "file,size,clues,time,loops,checks"
+
+
+def generate_board(path: str, size: int, seed: int, timeout: float) -> tuple[str, int, int, float, int, int]:
+    """Create a board with a unique solution and write it to a file, it runs
+    in a worker process
+
+    Args:
+        path (str): the path of the board file
+        size (int): the size of the board
+        seed (int): the seed of the board
+        timeout (float): the seconds that every solver call can take
+
+    Returns:
+        tuple[str, int, int, float, int, int]: the path, the size, the number
+        of clues, the seconds, the random loops tried and the solver calls
+    """
+    start = time.perf_counter()
+    generator = Generator(size, seed, timeout)
+    clues = generator.generate()
+    with open(path, "w") as file:
+        file.write(board_text(size, clues))
+    return (path, size, len(clues), time.perf_counter() - start,
+            generator.loops, generator.checks)
+
+
+def run_generator(count: int, size: int, directory: str, workers: Optional[int] = None,
+                  seed: int = 0, timeout: float = 2.0,
+                  output: TextIO = sys.stdout) -> float:
+    """Create boards with a unique solution over a process pool, writing one
+    line per board as soon as it is done
+
+    Args:
+        count (int): the number of boards
+        size (int): the size of the boards
+        directory (str): the directory to write the boards to
+        workers (Optional[int]): the number of processes, all cores if None
+        seed (int): the seed of the first board, the next ones count up
+        timeout (float): the seconds that every solver call can take
+        output (TextIO): where the result lines are written
+
+    Returns:
+        float: the boards created per minute
+    """
+    os.makedirs(directory, exist_ok=True)
+    start = time.perf_counter()
+    output.write(HEADER + "\n")
+    output.flush()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        for board_seed in range(seed, seed + count):
+            path = os.path.join(directory, f"board_{size}x{size}_{board_seed}.txt")
+            futures.append(executor.submit(generate_board, path, size, board_seed, timeout))
+        for future in as_completed(futures):
+            path, size, clues, seconds, loops, checks = future.result()
+            output.write(f"{path},{size},{clues},{seconds:.2f},{loops},{checks}\n")
+            output.flush()
+    return count * 60 / (time.perf_counter() - start)
@@ -1,8 +1,10 @@
-import tkinter as tk
-from tkinter import filedialog
 import os
 
 def select_file():
+    # tkinter is only loaded when the dialog is shown
+    import tkinter as tk
+    from tkinter import filedialog
+
     # Create a Tkinter root window with no GUI elements
     root = tk.Tk()
     root.withdraw()  # Ocult the root window
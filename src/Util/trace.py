@@ -0,0 +1,227 @@
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from typing import Optional
+
+# Levels of the events, an event is kept if its level is at least the level
+# of the trace
+DEBUG = 10
+INFO = 20
+LEVELS = {"debug": DEBUG, "info": INFO}
+
+# Events kept in memory, the next ones are only counted
+MAX_EVENTS = 1_000_000
+
+# The hooks check this flag before doing any work, so a disabled trace costs
+# a module attribute lookup. Hot paths test it themselves:
+#     if trace.enabled:
+#         trace.event("graph.add_edge", start=..., end=...)
+enabled = False
+level = INFO
+output = None
+
+# Chrome trace events, timers by name as [count, total ns, max ns] and
+# counters by name
+events = []
+timers = {}
+counters = {}
+dropped = 0
+start_ns = time.perf_counter_ns()
+
+
+def enable(path: Optional[str] = None, trace_level: int = INFO) -> None:
+    """Start keeping the events, the timers and the counters
+
+    Args:
+        path (Optional[str]): the Chrome trace file written when the program
+            exits, None to keep the trace in memory only
+        trace_level (int): DEBUG to keep every event, INFO for the timers and
+            the main events only
+    """
+    global enabled, level, output
+    if path is not None and output is None:
+        atexit.register(finish)
+    enabled = True
+    level = trace_level
+    output = path
+
+
+def disable() -> None:
+    """Stop keeping events, the ones already kept are not removed"""
+    global enabled
+    enabled = False
+
+
+def reset() -> None:
+    """Remove the events, the timers and the counters kept so far"""
+    global dropped, start_ns
+    events.clear()
+    timers.clear()
+    counters.clear()
+    dropped = 0
+    start_ns = time.perf_counter_ns()
+
+
+def keep(record: dict) -> None:
+    """Add an event to the trace, or count it if the trace is full
+
+    Args:
+        record (dict): the Chrome trace event
+    """
+    global dropped
+    if len(events) < MAX_EVENTS:
+        record["pid"] = os.getpid()
+        record["tid"] = threading.get_ident()
+        events.append(record)
+    else:
+        dropped += 1
+
+
+def event(name: str, event_level: int = DEBUG, **args) -> None:
+    """Keep an instant event
+
+    Args:
+        name (str): the name of the event, the module first (graph.add_edge)
+        event_level (int): the level of the event
+        args: the values shown with the event, they must be JSON values
+    """
+    if not enabled or event_level < level:
+        return
+    keep({"name": name, "cat": name.split(".")[0], "ph": "i", "s": "t",
+          "ts": (time.perf_counter_ns() - start_ns) / 1e3, "args": args})
+
+
+def count(name: str, value: int = 1) -> None:
+    """Add to a counter
+
+    Args:
+        name (str): the name of the counter
+        value (int): the amount to add
+    """
+    if enabled:
+        counters[name] = counters.get(name, 0) + value
+
+
+class Span:
+    """
+    Span class to time a block of code, the time is added to the timer of
+    its name and kept as a Chrome trace event
+
+    Attributes
+    ----------
+    name : str
+        The name of the timer
+    args : dict
+        The values shown with the event
+    start : int
+        The time.perf_counter_ns() value when the block started
+    """
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name: str, args: dict) -> None:
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def __enter__(self) -> "Span":
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        end = time.perf_counter_ns()
+        elapsed = end - self.start
+        timer = timers.get(self.name)
+        if timer is None:
+            timers[self.name] = [1, elapsed, elapsed]
+        else:
+            timer[0] += 1
+            timer[1] += elapsed
+            if elapsed > timer[2]:
+                timer[2] = elapsed
+        keep({"name": self.name, "cat": self.name.split(".")[0], "ph": "X",
+              "ts": (self.start - start_ns) / 1e3, "dur": elapsed / 1e3, "args": self.args})
+
+
+class NullSpan:
+    """
+    NullSpan class for the blocks timed while the trace is disabled, it does
+    nothing and a single one is shared
+    """
+    __slots__ = ()
+
+    def __enter__(self) -> "NullSpan":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+NULL_SPAN = NullSpan()
+
+
+def span(name: str, **args) -> "Span | NullSpan":
+    """Time a block of code with a with statement
+
+    Args:
+        name (str): the name of the timer, the module first (graph.check_win)
+        args: the values shown with the event, they must be JSON values
+
+    Returns:
+        Span | NullSpan: the context manager of the block
+    """
+    if not enabled:
+        return NULL_SPAN
+    return Span(name, args)
+
+
+def summary() -> str:
+    """Get the timers and the counters as a table, the slowest timers first
+
+    Returns:
+        str: the table
+    """
+    lines = [f"{'timer':<24}{'count':>9}{'total ms':>11}{'mean us':>10}{'max us':>10}"]
+    for name, (calls, total, longest) in sorted(timers.items(), key=lambda item: -item[1][1]):
+        lines.append(f"{name:<24}{calls:9d}{total / 1e6:11.2f}{total / calls / 1e3:10.1f}"
+                     f"{longest / 1e3:10.1f}")
+    for name, value in sorted(counters.items()):
+        lines.append(f"{name:<24}{value:9d}")
+    if dropped:
+        lines.append(f"{dropped} events were not kept, the trace is full")
+    return "\n".join(lines)
+
+
+def dump(path: str) -> None:
+    """Write the trace as a Chrome trace file, for chrome://tracing or
+    Perfetto, with the timers and the counters in its metadata
+
+    Args:
+        path (str): the JSON file
+    """
+    end = (time.perf_counter_ns() - start_ns) / 1e3
+    counter_events = [{"name": name, "ph": "C", "ts": end, "pid": os.getpid(),
+                       "args": {"value": value}} for name, value in counters.items()]
+    report = {
+        "traceEvents": events + counter_events,
+        "displayTimeUnit": "ms",
+        "metadata": {
+            "timers": {name: {"count": calls, "total_ms": total / 1e6, "max_us": longest / 1e3}
+                       for name, (calls, total, longest) in timers.items()},
+            "counters": dict(counters),
+            "dropped": dropped,
+        },
+    }
+    with open(path, "w") as file:
+        json.dump(report, file)
+
+
+def finish() -> None:
+    """Write the trace file and print the summary when the program exits"""
+    if output is None or (not events and not timers and not counters):
+        return
+    dump(output)
+    print(summary(), file=sys.stderr)
+    print(f"Trace written to {output}", file=sys.stderr)
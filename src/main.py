@@ -1,15 +1,72 @@
 # imports
-import pygame
 import sys
 
-import Util.colors as COLORS
-import GUI.show_game as show_game
-import GUI.show_menu as show_menu
 import Util.check_args as c_a
+import Util.trace as trace
+from Logic.board import BoardFormatError
 
 def main():
+    # Keep the timers and the events of this process, written when it exits
+    output, level = c_a.check_trace_args(sys.argv)
+    if output != "":
+        trace.enable(output, trace.LEVELS[level])
+
+    # Solve a directory of boards without the window
+    directory, timeout, workers, backend = c_a.check_batch_args(sys.argv)
+    if directory != "":
+        import Util.batch as batch
+        totals = batch.run_batch(directory, timeout, workers, backend)
+        print(", ".join(f"{result}: {count}" for result, count in sorted(totals.items())),
+              file=sys.stderr)
+        sys.exit(0 if set(totals) <= {"yes"} else 1)
+
+    # Convert a directory of boards to a library file
+    directory, output = c_a.check_convert_args(sys.argv)
+    if directory != "":
+        import Logic.library as library
+        import Util.batch as batch
+        paths = batch.board_files(directory)
+        count = library.convert_files(paths, output)
+        for number, path in enumerate(paths):
+            print(f"{number},{path}")
+        print(f"{count} boards written to {output}", file=sys.stderr)
+        sys.exit(0)
+
+    # Create boards with a unique solution without the window
+    count, size, directory, workers, seed = c_a.check_generate_args(sys.argv)
+    if count > 0:
+        import Util.generate as generate
+        rate = generate.run_generator(count, size, directory, workers, seed)
+        print(f"{rate:.1f} boards per minute", file=sys.stderr)
+        sys.exit(0)
+
     # Check command line arguments
     filename, resolution = c_a.check_args(sys.argv)
+
+    # Write the CNF of a board for an external SAT solver
+    dimacs = c_a.check_dimacs_args(sys.argv)
+    if dimacs != "":
+        from Logic.board import load_board
+        from Logic.sat import CNF
+        try:
+            board = load_board(filename)
+        except (OSError, BoardFormatError) as error:
+            print(error, file=sys.stderr)
+            sys.exit(1)
+        cnf = CNF(board.size, dict(board.clues))
+        with open(dimacs, "w") as file:
+            cnf.write_dimacs(file)
+        print(f"{cnf.num_vars} variables and {len(cnf.clauses)} clauses written to {dimacs}",
+              file=sys.stderr)
+        sys.exit(0)
+
+    # The window is only imported when it is shown, the modes above run
+    # without pygame
+    import pygame
+
+    import GUI.show_game as show_game
+    import GUI.show_menu as show_menu
+    import Util.colors as COLORS
     
     # Initialize the game
     pygame.init()
@@ -25,12 +82,19 @@ def main():
     # Frames per second
     FPS = 60
 
+    # Milliseconds the loop sleeps waiting for an event
+    IDLE_TIMEOUT = 1000
+
     # Current state of the game
     current_state = "menu"
 
     # Initialize the game objects
     if filename != "" or filename != None:
-        game = show_game.Game(SCREEN_WIDTH, SCREEN_HEIGHT, filename)
+        try:
+            game = show_game.Game(SCREEN_WIDTH, SCREEN_HEIGHT, filename)
+        except BoardFormatError as error:
+            print(error, file=sys.stderr)
+            sys.exit(1)
     
     menu = show_menu.Menu(SCREEN_WIDTH, SCREEN_HEIGHT)
     colors = COLORS.colors()
@@ -43,24 +107,49 @@ def main():
     # Create a clock object to control the frame rate
     clock = pygame.time.Clock()
 
+    # Render scheduler: the loop sleeps in pygame.event.wait until there is
+    # an event, and a frame is only drawn when an event or a change of state
+    # can have changed the screen. Each frame is presented once
+    redraw = True
+    shown_state = None
+
     # Main loop
     running = True
     while running:
-        events = pygame.event.get()
+        if redraw:
+            events = pygame.event.get()
+        else:
+            event = pygame.event.wait(IDLE_TIMEOUT)
+            if event.type == pygame.NOEVENT:
+                continue
+            events = [event] + pygame.event.get()
+
         for event in events:
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 # Cambiar entre menú y juego
-                if current_state == "menu":
+                if current_state == "game" and game.busy():
+                    # ESC stops the AI first
+                    game.cancel_ai()
+                elif current_state == "menu":
                     current_state = "game"
                 elif current_state == "game":
                     current_state = "menu"
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                # The window was covered, the whole screen is drawn again
+                shown_state = None
+
+        if not running:
+            break
 
-        screen.fill(colors.BLACK)
+        # A new state is drawn from scratch
+        if current_state != shown_state and current_state == "game":
+            game.invalidate()
 
         # Draw the current state
         if current_state == "menu":
+            screen.fill(colors.BLACK)
             menu.draw(screen, events, current_state, filename)
             current_state = menu.current_state
             
@@ -69,14 +158,36 @@ def main():
             
             
             if new_filename != filename and is_new_game:
-                filename = new_filename
-                game = show_game.Game(SCREEN_WIDTH, SCREEN_HEIGHT, filename)
+                try:
+                    game = show_game.Game(SCREEN_WIDTH, SCREEN_HEIGHT, new_filename)
+                    filename = new_filename
+                except BoardFormatError as error:
+                    # Keep the current game and stay in the menu
+                    print(error, file=sys.stderr)
+                    menu.new_game = False
+                    menu.ai_game = False
+                    current_state = "menu"
+
+            # The AI button solves the game that is shown now
+            if menu.ai_game and current_state == "game":
+                menu.ai_game = False
+                game.start_ai()
+
+            # Update the screen
+            pygame.display.flip()
+            shown_state = "menu"
                 
         elif current_state == "game":
-            game.draw(screen, events)
+            # Update only the regions of the screen that changed
+            rects = game.draw(screen, events)
+            if rects:
+                with trace.span("render.present", rects=len(rects)):
+                    pygame.display.update(rects)
+            shown_state = "game"
 
-        # Update the screen
-        pygame.display.flip()
+        # Leaving the menu draws the game on the next frame without waiting,
+        # and the AI is followed on every frame while it works
+        redraw = current_state != shown_state or (current_state == "game" and game.busy())
 
         # Control the frame rate
         clock.tick(FPS)
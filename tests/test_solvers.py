@@ -0,0 +1,172 @@
+"""Check the solvers against a brute force enumeration on small boards.
+
+python -m pytest tests
+
+Every loop of a 4x4 and a 5x5 grid is enumerated and kept if it satisfies
+the clues, with rules written here and not taken from the solvers. The
+boards are the clues of random loops, so they have a solution, and random
+clues, that often have none or many.
+"""
+import functools
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from Logic.sat import SatSolver  # noqa: E402
+from Logic.solver import Solver  # noqa: E402
+from Logic.uniqueness import UniquenessChecker  # noqa: E402
+
+WHITE = 1
+BLACK = 2
+
+# Solutions counted by count_solutions, most random boards have fewer
+COUNT_LIMIT = 50
+
+Cell = tuple[int, int]
+
+
+@functools.lru_cache(maxsize=None)
+def all_loops(size: int) -> list[tuple[Cell, ...]]:
+    """Enumerate every loop of the grid, each one once, as its cells in
+    order starting from its smallest cell
+
+    Args:
+        size (int): the size of the grid
+
+    Returns:
+        list[tuple[Cell, ...]]: the loops
+    """
+    loops = []
+
+    def extend(start: Cell, path: list[Cell], seen: set[Cell]) -> None:
+        x, y = path[-1]
+        for cell in ((x - 1, y), (x, y + 1), (x + 1, y), (x, y - 1)):
+            if not (0 <= cell[0] < size and 0 <= cell[1] < size):
+                continue
+            if cell == start:
+                # Each loop is walked in both directions, only one is kept
+                if len(path) >= 4 and path[1] < path[-1]:
+                    loops.append(tuple(path))
+            elif cell > start and cell not in seen:
+                seen.add(cell)
+                path.append(cell)
+                extend(start, path, seen)
+                path.pop()
+                seen.discard(cell)
+
+    for x in range(size):
+        for y in range(size):
+            extend((x, y), [(x, y)], {(x, y)})
+    return loops
+
+
+def loop_neighbors(loop: tuple[Cell, ...]) -> dict[Cell, tuple[Cell, Cell]]:
+    """Get the two cells next to every cell of a loop"""
+    return {cell: (loop[i - 1], loop[(i + 1) % len(loop)]) for i, cell in enumerate(loop)}
+
+
+def is_straight(neighbors: dict[Cell, tuple[Cell, Cell]], cell: Cell) -> bool:
+    """Check if the loop goes straight through a cell"""
+    (a_x, a_y), (b_x, b_y) = neighbors[cell]
+    return a_x + b_x == 2 * cell[0] and a_y + b_y == 2 * cell[1]
+
+
+def satisfies(loop: tuple[Cell, ...], clues: dict[Cell, int]) -> bool:
+    """Check the Masyu rules of every clue on a loop
+
+    Args:
+        loop (tuple[Cell, ...]): the cells of the loop in order
+        clues (dict[Cell, int]): the color of every clue
+
+    Returns:
+        bool: True if the loop is a solution of the clues
+    """
+    neighbors = loop_neighbors(loop)
+    for cell, color in clues.items():
+        if cell not in neighbors:
+            return False
+        straight_next = [is_straight(neighbors, other) for other in neighbors[cell]]
+        if color == WHITE:
+            # Straight through, and a turn on at least one side
+            if not is_straight(neighbors, cell) or all(straight_next):
+                return False
+        elif is_straight(neighbors, cell) or not all(straight_next):
+            # A turn, and straight on both sides
+            return False
+    return True
+
+
+def edge_set(edges) -> frozenset:
+    """Get the edges of a solution as a set that does not depend on their
+    order or direction"""
+    return frozenset(frozenset(edge) for edge in edges)
+
+
+def brute_force(size: int, clues: dict[Cell, int]) -> set[frozenset]:
+    """Get the edges of every solution of the clues"""
+    return {edge_set(zip(loop, loop[1:] + loop[:1]))
+            for loop in all_loops(size) if satisfies(loop, clues)}
+
+
+def loop_board(size: int, seed: int) -> dict[Cell, int]:
+    """Get some of the clues that a random loop satisfies"""
+    rng = random.Random(seed)
+    loop = rng.choice(all_loops(size))
+    neighbors = loop_neighbors(loop)
+    clues = {}
+    for cell in loop:
+        straight_next = [is_straight(neighbors, other) for other in neighbors[cell]]
+        if is_straight(neighbors, cell) and not all(straight_next):
+            clues[cell] = WHITE
+        elif not is_straight(neighbors, cell) and all(straight_next):
+            clues[cell] = BLACK
+    kept = rng.uniform(0.3, 1.0)
+    return {cell: color for cell, color in clues.items() if rng.random() < kept}
+
+
+def random_board(size: int, seed: int) -> dict[Cell, int]:
+    """Get random clues, that may have no solution or many"""
+    rng = random.Random(seed)
+    cells = rng.sample([(x, y) for x in range(size) for y in range(size)], rng.randint(1, size))
+    return {cell: rng.choice((WHITE, BLACK)) for cell in cells}
+
+
+BOARDS = [(size, seed, loop_board(size, seed)) for size in (4, 5) for seed in range(12)]
+BOARDS += [(size, seed, random_board(size, seed)) for size in (4, 5) for seed in range(100, 112)]
+IDS = [f"{size}x{size}-{seed}" for size, seed, _ in BOARDS]
+
+
+@pytest.mark.parametrize("size, seed, clues", BOARDS, ids=IDS)
+def test_count_solutions(size, seed, clues):
+    expected = brute_force(size, clues)
+    solver = Solver(size, clues)
+    assert solver.count_solutions(COUNT_LIMIT) == min(len(expected), COUNT_LIMIT)
+    assert {edge_set(solution) for solution in solver.solutions} <= expected
+
+
+@pytest.mark.parametrize("size, seed, clues", BOARDS, ids=IDS)
+def test_uniqueness(size, seed, clues):
+    expected = brute_force(size, clues)
+    report = UniquenessChecker(size).check(clues)
+    assert report.count == (len(expected) if len(expected) < 2 else "2+")
+    assert {edge_set(witness) for witness in report.witnesses} <= expected
+
+
+@pytest.mark.parametrize("solver_class", [Solver, SatSolver], ids=["search", "sat"])
+@pytest.mark.parametrize("size, seed, clues", BOARDS, ids=IDS)
+def test_solve(size, seed, clues, solver_class):
+    expected = brute_force(size, clues)
+    solver = solver_class(size, clues)
+    assert solver.solve() == bool(expected)
+    if expected:
+        assert edge_set(solver.solutions[0]) in expected
+
+
+def test_loops_of_empty_grid():
+    # The number of cycles of the grid graphs, OEIS A140517
+    assert [len(all_loops(size)) for size in (2, 3, 4, 5)] == [1, 13, 213, 9349]
+    assert Solver(4, {}).count_solutions(1000) == 213